@@ -0,0 +1,359 @@
+"""
+Routing scalability benchmarks.
+
+Builds applications with 10 to 10k operations spread across controllers and ModuleRouters
+and measures, fully in-process:
+
+- `router`: `ApplicationRouter._get_route_handler` latency per lookup
+- `mount`: `EllarControllerMount.matches` latency per lookup, for the mount handling the path
+- `asgi`: a complete request through the application ASGI callable
+
+Every lookup also reports the peak memory allocated while it runs, traced with `tracemalloc`.
+
+Scenarios:
+
+- `operations`: operations with and without path parameters
+- `versioned`: every operation is registered for versions `1` and `2`, resolved from the query string
+- `path_mounts`: `{path:path}` operations next to mounted ASGI applications
+
+Results are written as JSON so runs can be compared over time:
+
+    python -m benchmarks.routing --sizes 10,100,1000 --output routing.json
+    python -m benchmarks.routing --route-matcher regex --flatten-routes
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import typing as t
+from datetime import datetime, timezone
+
+import ellar
+from ellar.app import App, AppFactory
+from ellar.common import Controller, ModuleRouter, Version, get
+from ellar.common.constants import SCOPE_API_VERSIONING_RESOLVER
+from ellar.common.types import TScope
+from ellar.core.routing import EllarControllerMount
+from ellar.core.versioning import DefaultAPIVersioning, QueryParameterAPIVersioning
+from starlette.responses import PlainTextResponse
+from starlette.routing import Mount
+
+SIZES = (10, 100, 1000, 10000)
+SCENARIOS = ("operations", "versioned", "path_mounts")
+# operations registered per controller or ModuleRouter
+GROUP_SIZE = 10
+
+
+class _Group(t.NamedTuple):
+    prefix: str
+    paths: t.List[str]
+
+
+def _operation_paths(scenario: str, group: int) -> t.List[str]:
+    paths = []
+    for index in range(GROUP_SIZE):
+        if scenario == "path_mounts" and index % 2:
+            paths.append(f"/files{index}/{{path:path}}")
+        elif index % 2:
+            paths.append(f"/items{index}/{{item_id:int}}")
+        else:
+            paths.append(f"/items{index}")
+    return paths
+
+
+def _create_endpoint(name: str, scenario: str) -> t.Callable:
+    def endpoint(*args: t.Any) -> str:
+        return name
+
+    endpoint.__name__ = name
+    if scenario == "versioned":
+        endpoint = Version("1", "2")(endpoint)
+    return endpoint
+
+
+def _create_controller(group: int, scenario: str) -> t.Tuple[t.Type, _Group]:
+    prefix = f"/controller{group}"
+    paths = _operation_paths(scenario, group)
+    namespace: t.Dict[str, t.Any] = {}
+    for index, path in enumerate(paths):
+        name = f"operation_{group}_{index}"
+        namespace[name] = get(path)(_create_endpoint(name, scenario))
+    controller = Controller(prefix)(type(f"Controller{group}", (), namespace))
+    return controller, _Group(prefix, paths)
+
+
+def _create_router(group: int, scenario: str) -> t.Tuple[ModuleRouter, _Group]:
+    prefix = f"/router{group}"
+    router = ModuleRouter(prefix)
+    paths = _operation_paths(scenario, group)
+    for index, path in enumerate(paths):
+        name = f"operation_{group}_{index}"
+        router.get(path)(_create_endpoint(name, scenario))
+    return router, _Group(prefix, paths)
+
+
+async def _asgi_file(scope: TScope, receive: t.Callable, send: t.Callable) -> None:
+    await PlainTextResponse("file")(scope, receive, send)
+
+
+def create_app(
+    scenario: str, size: int, config: t.Dict[str, t.Any]
+) -> t.Tuple[App, t.List[_Group]]:
+    controllers = []
+    routers: t.List[t.Any] = []
+    groups = []
+
+    for group in range(max(size // GROUP_SIZE, 1)):
+        if group % 2:
+            router, item = _create_router(group, scenario)
+            routers.append(router)
+        else:
+            controller, item = _create_controller(group, scenario)
+            controllers.append(controller)
+        groups.append(item)
+
+        if scenario == "path_mounts":
+            routers.append(Mount(f"/static{group}", app=_asgi_file))
+
+    config_module = {"STATIC_MOUNT_PATH": None, **config}
+    if scenario == "versioned":
+        config_module["VERSIONING_SCHEME"] = QueryParameterAPIVersioning()
+
+    app = AppFactory.create_app(
+        controllers=controllers, routers=routers, config_module=config_module
+    )
+    return app, groups
+
+
+def _concrete_path(group: _Group, path: str) -> str:
+    return group.prefix + path.replace("{item_id:int}", "42").replace(
+        "{path:path}", "css/app.css"
+    )
+
+
+def lookup_targets(groups: t.List[_Group]) -> t.Dict[str, t.Tuple[str, str]]:
+    """
+    Methods and paths looked up for each application: first, middle and last registered groups,
+    a miss and a method mismatch on the first group, answered with `405` after checking the later routes
+    """
+    first, middle, last = groups[0], groups[len(groups) // 2], groups[-1]
+    return {
+        "first_static": ("GET", _concrete_path(first, first.paths[0])),
+        "middle_param": ("GET", _concrete_path(middle, middle.paths[1])),
+        "last_param": ("GET", _concrete_path(last, last.paths[-1])),
+        "not_found": ("GET", "/wp-admin/setup.php"),
+        "method_mismatch": ("DELETE", _concrete_path(first, first.paths[1])),
+    }
+
+
+def create_scope(app: App, path: str, scenario: str, method: str = "GET") -> TScope:
+    scope: TScope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"version=2" if scenario == "versioned" else b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("testserver", 80),
+        "app": app,
+    }
+    return scope
+
+
+def _with_version_resolver(app: App, scope: TScope) -> TScope:
+    # what `RequestVersioningMiddleware` does before routing
+    scope = dict(scope)
+    scheme = app.config.VERSIONING_SCHEME or DefaultAPIVersioning()
+    resolver = scheme.get_version_resolver(scope)
+    resolver.resolve()
+    scope[SCOPE_API_VERSIONING_RESOLVER] = resolver
+    return scope
+
+
+def _measure(
+    func: t.Callable[[], t.Any], number: int, repeat: int
+) -> t.Dict[str, float]:
+    for _ in range(min(number, 100)):
+        func()
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter_ns()
+        for _ in range(number):
+            func()
+        timings.append((time.perf_counter_ns() - start) / number)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(number, 50)):
+            current, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            func()
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "ns_per_op_min": min(timings),
+        "ns_per_op_median": statistics.median(timings),
+        "alloc_peak_bytes": statistics.mean(peaks),
+    }
+
+
+def bench_router(
+    app: App, scope: TScope, number: int, repeat: int
+) -> t.Dict[str, float]:
+    scope = _with_version_resolver(app, scope)
+    get_route_handler = app.router._get_route_handler
+
+    def lookup() -> t.Any:
+        # `_get_route_handler` updates the scope it is given
+        return get_route_handler(dict(scope))
+
+    return _measure(lookup, number, repeat)
+
+
+def bench_mount(
+    app: App, scope: TScope, number: int, repeat: int
+) -> t.Optional[t.Dict[str, float]]:
+    scope = _with_version_resolver(app, scope)
+    route = app.router._get_route_handler(dict(scope))
+    mount = getattr(route, "root_mount", route)
+    if not isinstance(mount, EllarControllerMount):
+        # not found, or flattened routes resolved without the mount
+        return None
+
+    return _measure(lambda: mount.matches(scope), number, repeat)
+
+
+def bench_asgi(app: App, scope: TScope, number: int, repeat: int) -> t.Dict[str, float]:
+    loop = asyncio.new_event_loop()
+
+    async def receive() -> t.Dict[str, t.Any]:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: t.Dict[str, t.Any]) -> None:
+        pass
+
+    def request() -> None:
+        loop.run_until_complete(app(dict(scope), receive, send))
+
+    try:
+        return _measure(request, number, repeat)
+    finally:
+        loop.close()
+
+
+def run(options: argparse.Namespace) -> t.Dict[str, t.Any]:
+    config = {
+        "FLATTEN_ROUTES": options.flatten_routes,
+        "ROUTE_MATCHER": options.route_matcher,
+        "ROUTE_MATCH_CACHE_SIZE": options.match_cache_size,
+    }
+    results = []
+
+    for scenario in options.scenarios:
+        for size in options.sizes:
+            start = time.perf_counter()
+            app, groups = create_app(scenario, size, config)
+            build_seconds = time.perf_counter() - start
+            print(
+                f"{scenario} size={size} built in {build_seconds:.2f}s",
+                file=sys.stderr,
+            )
+
+            for target, (method, path) in lookup_targets(groups).items():
+                scope = create_scope(app, path, scenario, method)
+                benchmarks = {
+                    "router": bench_router(app, scope, options.number, options.repeat),
+                    "mount": bench_mount(app, scope, options.number, options.repeat),
+                    "asgi": bench_asgi(
+                        app, scope, max(options.number // 10, 1), options.repeat
+                    ),
+                }
+                for name, result in benchmarks.items():
+                    if result is None:
+                        continue
+                    results.append(
+                        {
+                            "scenario": scenario,
+                            "size": size,
+                            "routes": len(app.router.routes),
+                            "build_seconds": build_seconds,
+                            "target": target,
+                            "method": method,
+                            "path": path,
+                            "benchmark": name,
+                            **result,
+                        }
+                    )
+
+    return {
+        "meta": {
+            "benchmark": "routing",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "ellar": ellar.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "options": {
+                key: list(value) if isinstance(value, tuple) else value
+                for key, value in vars(options).items()
+                if key != "output"
+            },
+        },
+        "results": results,
+    }
+
+
+def _comma_separated(cast: t.Callable[[str], t.Any]) -> t.Callable[[str], t.Tuple]:
+    return lambda value: tuple(cast(item) for item in value.split(",") if item)
+
+
+def parse_args(argv: t.Optional[t.Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ellar routing benchmarks")
+    parser.add_argument("--sizes", type=_comma_separated(int), default=SIZES)
+    parser.add_argument("--scenarios", type=_comma_separated(str), default=SCENARIOS)
+    parser.add_argument("--number", type=int, default=2000, help="lookups per repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--route-matcher", choices=("trie", "regex"), default="trie")
+    parser.add_argument("--flatten-routes", action="store_true")
+    parser.add_argument("--match-cache-size", type=int, default=0)
+    parser.add_argument("--output", help="JSON output file, stdout otherwise")
+    options = parser.parse_args(argv)
+
+    unknown = set(options.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+    return options
+
+
+def write_results(results: t.Dict[str, t.Any], output: t.Optional[str]) -> None:
+    """Writes the JSON results to the `output` file, to stdout without closing it otherwise"""
+    if output is None:
+        json.dump(results, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+        return
+
+    with open(output, "w") as file:
+        json.dump(results, file, indent=2)
+        file.write("\n")
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> None:
+    options = parse_args(argv)
+    write_results(run(options), options.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""
+Request tracing overhead benchmarks.
+
+Measures, fully in-process, a complete request through the application ASGI callable
+with request tracing:
+
+- `disabled`: no hook and events not logged, the default unless `LOG_LEVEL` is `debug`
+- `filtered`: events logged while the `ellar.request` logger drops `DEBUG` messages, which is
+  what every request paid when the debug messages were formatted eagerly
+- `hook`: events sent to a hook doing nothing
+
+and a single trace call site, eager `request_logger.debug(f"...")` against the
+`request_tracer.enabled` check, to estimate the savings per request from the number
+of events traced by each request:
+
+    python -m benchmarks.tracing --output tracing.json
+"""
+
+import argparse
+import asyncio
+import logging
+import platform
+import typing as t
+from datetime import datetime, timezone
+
+import ellar
+from ellar.app import App, AppFactory
+from ellar.common import Body, Controller, Header, Query, get, post
+from ellar.common.logging import TraceEvent, request_logger, request_tracer
+from ellar.common.types import TScope
+from ellar.pydantic import BaseModel
+
+from .routing import _measure, write_results
+
+MODES = ("disabled", "filtered", "hook")
+
+
+class ItemSchema(BaseModel):
+    name: str
+    price: float
+
+
+@Controller("/items")
+class ItemController:
+    @get("/{item_id:int}")
+    def get_item(
+        self,
+        item_id: int,
+        q: t.Optional[str] = Query(None),
+        user_agent: t.Optional[str] = Header(None),
+    ) -> t.Dict[str, t.Any]:
+        return {"item_id": item_id, "q": q}
+
+    @post("/")
+    def create_item(self, item: ItemSchema = Body()) -> ItemSchema:
+        return item
+
+
+def create_app() -> App:
+    return AppFactory.create_app(
+        controllers=[ItemController], config_module={"STATIC_MOUNT_PATH": None}
+    )
+
+
+REQUESTS: t.Dict[str, t.Tuple[str, str, bytes, bytes]] = {
+    "get_item": ("GET", "/items/42", b"q=search", b""),
+    "create_item": ("POST", "/items/", b"", b'{"name": "Foo", "price": 2.5}'),
+}
+
+
+def create_scope(app: App, method: str, path: str, query_string: bytes) -> TScope:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query_string,
+        "headers": [
+            (b"host", b"testserver"),
+            (b"user-agent", b"benchmark"),
+            (b"content-type", b"application/json"),
+        ],
+        "client": ("127.0.0.1", 5000),
+        "server": ("testserver", 80),
+        "app": app,
+    }
+
+
+def bench_request(app: App, name: str, number: int, repeat: int) -> t.Dict[str, float]:
+    method, path, query_string, body = REQUESTS[name]
+    scope = create_scope(app, method, path, query_string)
+    loop = asyncio.new_event_loop()
+
+    async def receive() -> t.Dict[str, t.Any]:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: t.Dict[str, t.Any]) -> None:
+        pass
+
+    def request() -> None:
+        loop.run_until_complete(app(dict(scope), receive, send))
+
+    try:
+        return _measure(request, number, repeat)
+    finally:
+        loop.close()
+
+
+def count_events(app: App, name: str) -> int:
+    events: t.List[TraceEvent] = []
+    request_tracer.add_hook(events.append)
+    try:
+        bench_request(app, name, 1, 1)
+    finally:
+        request_tracer.remove_hook(events.append)
+    # `_measure` runs the request three times: warmup, timing and memory tracing
+    return len(events) // 3
+
+
+def bench_call_site(number: int, repeat: int) -> t.Dict[str, t.Dict[str, float]]:
+    source = ItemController()
+
+    def eager() -> None:
+        request_logger.debug(
+            f"Resolving Path Parameters - '{source.__class__.__name__}'"
+        )
+
+    def guarded() -> None:
+        if request_tracer.enabled:  # pragma: no cover
+            request_tracer.trace("Resolving Path Parameters", source)
+
+    return {
+        "eager": _measure(eager, number, repeat),
+        "guarded": _measure(guarded, number, repeat),
+    }
+
+
+def _noop_hook(event: TraceEvent) -> None:
+    pass
+
+
+def _set_mode(mode: str) -> None:
+    request_tracer.log_events = mode == "filtered"
+    if mode == "hook":
+        request_tracer.add_hook(_noop_hook)
+
+
+def run(options: argparse.Namespace) -> t.Dict[str, t.Any]:
+    app = create_app()
+    # `create_app` configures the `ellar.request` logger from the default `LOG_LEVEL`
+    request_logger.setLevel(logging.INFO)
+    results = []
+
+    for name in REQUESTS:
+        events_per_request = count_events(app, name)
+        for mode in MODES:
+            _set_mode(mode)
+            try:
+                result = bench_request(app, name, options.number, options.repeat)
+            finally:
+                if mode == "hook":
+                    request_tracer.remove_hook(_noop_hook)
+                request_tracer.log_events = None
+            results.append(
+                {
+                    "request": name,
+                    "mode": mode,
+                    "events_per_request": events_per_request,
+                    **result,
+                }
+            )
+
+    call_site = bench_call_site(options.number * 10, options.repeat)
+    saved_per_event = (
+        call_site["eager"]["ns_per_op_median"]
+        - call_site["guarded"]["ns_per_op_median"]
+    )
+    for item in results:
+        item["estimated_savings_ns_per_request"] = (
+            item["events_per_request"] * saved_per_event
+        )
+
+    return {
+        "meta": {
+            "benchmark": "tracing",
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "ellar": ellar.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "options": {
+                key: value for key, value in vars(options).items() if key != "output"
+            },
+        },
+        "call_site": call_site,
+        "results": results,
+    }
+
+
+def parse_args(argv: t.Optional[t.Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ellar request tracing benchmarks")
+    parser.add_argument("--number", type=int, default=2000, help="requests per repeat")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="JSON output file, stdout otherwise")
+    return parser.parse_args(argv)
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> None:
+    options = parse_args(argv)
+    write_results(run(options), options.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -167,6 +167,9 @@ class AppFactory:
                 if issubclass(module, IApplicationReady):
                     context.get(module).on_ready(app)
 
+            app.router.build_execution_plans(app)
+            app.bind_object_serializer()
+
             execute_coroutine(build_with_context_event.run())
             build_with_context_event.disconnect_all()
 
@@ -11,6 +11,7 @@ from ellar.common import (
 from ellar.common.datastructures import State, URLPath
 from ellar.common.interfaces import IExceptionHandler, IExceptionMiddlewareService
 from ellar.common.models import EllarInterceptor, GuardCanActivate
+from ellar.common.serializer import ObjectSerializer
 from ellar.common.templating import Environment, ModuleTemplating
 from ellar.common.types import ASGIApp, TReceive, TScope, TSend
 from ellar.core import HttpRequestConnectionContext, Request
@@ -63,6 +64,7 @@ class App:
 
         self._config = config
         self._injector: EllarInjector = injector
+        self._object_serializer: t.Optional[ObjectSerializer] = None
 
         self.state = State()
         self.config.DEFAULT_LIFESPAN_HANDLER = (
@@ -76,6 +78,9 @@ class App:
             lifespan=EllarApplicationLifespan(
                 self.config.DEFAULT_LIFESPAN_HANDLER
             ).lifespan,
+            flatten_routes=self.config.FLATTEN_ROUTES,
+            match_cache_size=self.config.ROUTE_MATCH_CACHE_SIZE,
+            route_matcher=self.config.ROUTE_MATCHER,
         )
 
         self._finalize_app_initialization()
@@ -202,7 +207,24 @@ class App:
 
     @t.no_type_check
     def with_injector_context(self) -> _AsyncGeneratorContextManager[t.Any]:
-        return injector_context(self.injector)
+        return injector_context(self.injector, self.object_serializer)
+
+    @property
+    def object_serializer(self) -> ObjectSerializer:
+        """
+        Serializer of the objects without schema, with the `SERIALIZER_CUSTOM_ENCODER` encoders.
+        Used by `serialize_object` within the application context.
+        """
+        if self._object_serializer is None:
+            self.bind_object_serializer()
+        return t.cast(ObjectSerializer, self._object_serializer)
+
+    def bind_object_serializer(self) -> ObjectSerializer:
+        """Creates the object serializer with the current `SERIALIZER_CUSTOM_ENCODER` encoders"""
+        self._object_serializer = ObjectSerializer(
+            self.config.SERIALIZER_CUSTOM_ENCODER
+        )
+        return self._object_serializer
 
     @t.no_type_check
     async def __call__(self, scope: TScope, receive: TReceive, send: TSend) -> None:
@@ -7,11 +7,15 @@ from .decorators import (
     UseGuards,
     UseInterceptors,
     Version,
+    capture_raw_data,
     exception_handler,
     extra_args,
     file,
+    max_body_size,
     middleware,
+    multipart_limits,
     render,
+    response_validation,
     serializer_filter,
     set_metadata,
     template_context,
@@ -81,6 +85,7 @@ from .params.decorators import (
     Inject,
     Path,
     Query,
+    StreamBody,
     WsBody,
 )
 from .params.params import ParamFieldInfo as Param
@@ -152,9 +157,14 @@ __all__ = [
     "Path",
     "Query",
     "WsBody",
+    "StreamBody",
     "middleware",
     "exception_handler",
     "serializer_filter",
+    "capture_raw_data",
+    "multipart_limits",
+    "max_body_size",
+    "response_validation",
     "template_filter",
     "template_global",
     "template_context",
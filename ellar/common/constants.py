@@ -25,6 +25,10 @@ ELLAR_CONFIG_MODULE = "ELLAR_CONFIG_MODULE"
 
 
 SERIALIZER_FILTER_KEY = "SERIALIZER_FILTER"
+CAPTURE_RAW_DATA_KEY = "CAPTURE_RAW_DATA"
+MULTIPART_LIMITS_KEY = "MULTIPART_LIMITS"
+MAX_BODY_SIZE_KEY = "MAX_BODY_SIZE"
+RESPONSE_VALIDATION_KEY = "RESPONSE_VALIDATION"
 VERSIONING_KEY = "ROUTE_VERSIONING"
 GUARDS_KEY = "ROUTE_GUARDS"
 EXTRA_ROUTE_ARGS_KEY = "EXTRA_ROUTE_ARGS"
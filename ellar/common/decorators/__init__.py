@@ -1,6 +1,7 @@
 import typing as t
 
 from .base import set_metadata
+from .body_size import max_body_size
 from .controller import Controller
 from .exception import exception_handler
 from .extra_args import extra_args
@@ -10,11 +11,18 @@ from .html import render, template_context, template_filter, template_global
 from .interceptor import UseInterceptors
 from .middleware import middleware
 from .modules import Module
+from .multipart import multipart_limits
+from .raw_data import capture_raw_data
+from .response_validation import response_validation
 from .serializer import serializer_filter
 from .versioning import Version
 
 __all__ = [
     "serializer_filter",
+    "capture_raw_data",
+    "multipart_limits",
+    "max_body_size",
+    "response_validation",
     "Controller",
     "Version",
     "UseGuards",
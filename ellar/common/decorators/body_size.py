@@ -0,0 +1,28 @@
+import typing as t
+
+from ellar.common.constants import MAX_BODY_SIZE_KEY
+
+from .base import set_metadata as set_meta
+
+
+def max_body_size(size: int) -> t.Callable:
+    """
+    ========= CONTROLLER AND ROUTE FUNCTION DECORATOR ==============
+
+    Sets the maximum size in bytes of the route function request body, overriding `MAX_REQUEST_BODY_SIZE` config.
+    Requests declaring a larger `Content-Length` are rejected with a `413` response before
+    the route function parameters are resolved, and bodies sent without `Content-Length`
+    are rejected as soon as the received size exceeds `size`.
+
+    :param size: Maximum size of the request body in bytes
+
+    ### Example
+
+    ```python
+    @post("/")
+    @max_body_size(1024 * 1024)
+    def create(item: Item):
+        return item
+    ```
+    """
+    return set_meta(MAX_BODY_SIZE_KEY, size)
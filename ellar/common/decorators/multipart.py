@@ -0,0 +1,51 @@
+import typing as t
+
+from ellar.common.constants import MULTIPART_LIMITS_KEY
+from ellar.common.params.formparsers import MultipartLimits, TUploadFileFactory
+
+from .base import set_metadata as set_meta
+
+
+def multipart_limits(
+    *,
+    max_file_size: t.Optional[int] = None,
+    max_files: t.Union[int, float] = 1000,
+    max_fields: t.Union[int, float] = 1000,
+    max_part_size: int = 1024 * 1024,
+    spool_max_size: int = 1024 * 1024,
+    file_factory: t.Optional[TUploadFileFactory] = None,
+) -> t.Callable:
+    """
+    ========= ROUTE FUNCTION DECORATOR ==============
+
+    Sets the limits applied while parsing the `multipart/form-data` body of the route function request.
+    An upload exceeding `max_file_size` is rejected with a `413` response as soon as its size is exceeded,
+    other exceeded limits result in a `400` response.
+
+    :param max_file_size: Maximum size of an uploaded file in bytes, unlimited when None
+    :param max_files: Maximum number of uploaded files
+    :param max_fields: Maximum number of non-file fields
+    :param max_part_size: Maximum size of a non-file field in bytes
+    :param spool_max_size: Size in bytes from which uploads are written to disk instead of memory
+    :param file_factory: Creates the file object each upload is written to, from its filename and headers
+
+    ### Example
+
+    ```python
+    @post("/upload")
+    @multipart_limits(max_file_size=10 * 1024 * 1024, max_files=1)
+    async def upload(file: UploadFile = File()):
+        ...
+    ```
+    """
+    return set_meta(
+        MULTIPART_LIMITS_KEY,
+        MultipartLimits(
+            max_file_size=max_file_size,
+            max_files=max_files,
+            max_fields=max_fields,
+            max_part_size=max_part_size,
+            spool_max_size=spool_max_size,
+            file_factory=file_factory,
+        ),
+    )
@@ -0,0 +1,26 @@
+import typing as t
+
+from ellar.common.constants import CAPTURE_RAW_DATA_KEY
+
+from .base import set_metadata as set_meta
+
+
+def capture_raw_data(capture: bool = True) -> t.Callable:
+    """
+    ========= ROUTE FUNCTION DECORATOR ==============
+
+    Turns on or off the capture of the raw values of the route function parameters,
+    overriding `CAPTURE_PARAMETERS_RAW_DATA` config for this route.
+
+    :param capture: Whether to capture raw data
+
+    ### Example
+
+    ```python
+    @get("/")
+    @capture_raw_data(False)
+    def index(q: str):
+        return {"q": q}
+    ```
+    """
+    return set_meta(CAPTURE_RAW_DATA_KEY, capture)
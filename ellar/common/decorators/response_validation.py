@@ -0,0 +1,44 @@
+import typing as t
+
+from ellar.common.constants import RESPONSE_VALIDATION_KEY
+
+from .base import set_metadata as set_meta
+
+
+def response_validation(
+    policy: t.Literal["always", "never", "sample"],
+    sample_rate: t.Optional[float] = None,
+) -> t.Callable:
+    """
+    ========= ROUTE FUNCTION DECORATOR ==============
+
+    Sets the validation of the objects returned by the route function against its response schema,
+    overriding `RESPONSE_VALIDATION` config for this route.
+
+    - `always`: every returned object is validated.
+    - `never`: returned objects are serialized by the schema serializer without validation,
+    leaving out the dictionary keys the schema does not declare.
+    - `sample`: a `sample_rate` fraction of the returned objects is validated,
+    `RESPONSE_VALIDATION_SAMPLE_RATE` config when None. Failures are reported to `RESPONSE_VALIDATION_FAILURE_HOOK`.
+
+    Instances of the model schema are never validated again, whatever the policy.
+
+    :param policy: Response validation policy
+    :param sample_rate: Fraction of the validated objects with the `sample` policy, between 0 and 1
+
+    ### Example
+
+    ```python
+    @get("/", response=ItemSchema)
+    @response_validation("sample", sample_rate=0.01)
+    def index():
+        return {"name": "item"}
+    ```
+    """
+    assert policy in ("always", "never", "sample"), (
+        f"Invalid response validation policy: {policy}"
+    )
+    assert sample_rate is None or 0 <= sample_rate <= 1, (
+        "sample_rate must be between 0 and 1"
+    )
+    return set_meta(RESPONSE_VALIDATION_KEY, (policy, sample_rate))
@@ -10,6 +10,7 @@ from .exceptions_types import (
     NotAuthenticated,
     NotFound,
     PermissionDenied,
+    RequestEntityTooLarge,
     UnsupportedMediaType,
 )
 from .validation import RequestValidationError, WebSocketRequestValidationError
@@ -29,5 +30,6 @@ __all__ = [
     "NotFound",
     "MethodNotAllowed",
     "NotAcceptable",
+    "RequestEntityTooLarge",
     "UnsupportedMediaType",
 ]
@@ -46,6 +46,11 @@ class NotAcceptable(APIException):
     code = "not_acceptable"
 
 
+class RequestEntityTooLarge(APIException):
+    status_code = status.HTTP_413_CONTENT_TOO_LARGE
+    code = "request_entity_too_large"
+
+
 class UnsupportedMediaType(APIException):
     status_code = status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
     code = "unsupported_media_type"
@@ -1,4 +1,91 @@
 import logging
+import typing as t
 
 logger = logging.getLogger("ellar")
 request_logger = logging.getLogger("ellar.request")
+
+__all__ = [
+    "logger",
+    "request_logger",
+    "request_tracer",
+    "RequestTracer",
+    "TraceEvent",
+    "TraceHook",
+]
+
+
+class TraceEvent(t.NamedTuple):
+    """A request processing stage reached by `source`"""
+
+    stage: str
+    source: str
+    data: t.Mapping[str, t.Any]
+
+    def __str__(self) -> str:
+        details = ", ".join(f"{key}={value}" for key, value in self.data.items())
+        if details:
+            return f"{self.stage}, {details} - '{self.source}'"
+        return f"{self.stage} - '{self.source}'"
+
+
+TraceHook = t.Callable[[TraceEvent], t.Any]
+
+
+class RequestTracer:
+    """
+    Traces the stages a request goes through, from routing to the response.
+
+    Call sites check `enabled` before tracing:
+
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Path Parameters", self, path=path)
+
+    so nothing is computed or formatted when tracing is off. Tracing is on when hooks are registered
+    or when events are logged, see `log_events`.
+    """
+
+    __slots__ = ("_hooks", "_log_events")
+
+    def __init__(self) -> None:
+        self._hooks: t.List[TraceHook] = []
+        self._log_events: t.Optional[bool] = None
+
+    @property
+    def enabled(self) -> bool:
+        if self._hooks:
+            return True
+        if self._log_events is None:
+            return request_logger.isEnabledFor(logging.DEBUG)
+        return self._log_events
+
+    @property
+    def log_events(self) -> bool:
+        """
+        Whether trace events are logged as `DEBUG` messages of the `ellar.request` logger,
+        which they are when the logger enables `DEBUG` messages, e.g. with the `LOG_LEVEL` of the application.
+        The logger caches its level checks until a level changes.
+        """
+        if self._log_events is None:
+            return request_logger.isEnabledFor(logging.DEBUG)
+        return self._log_events
+
+    @log_events.setter
+    def log_events(self, value: t.Optional[bool]) -> None:
+        # None follows the `ellar.request` logger level again
+        self._log_events = value
+
+    def add_hook(self, hook: TraceHook) -> None:
+        self._hooks.append(hook)
+
+    def remove_hook(self, hook: TraceHook) -> None:
+        self._hooks.remove(hook)
+
+    def trace(self, stage: str, source: t.Any, **data: t.Any) -> None:
+        event = TraceEvent(stage, type(source).__name__, data)
+        if self.log_events:
+            request_logger.debug("%s", event)
+        for hook in self._hooks:
+            hook(event)
+
+
+request_tracer = RequestTracer()
@@ -4,15 +4,22 @@ from .args import (
     RequestEndpointArgsModel,
     WebsocketEndpointArgsModel,
 )
+from .decoders import BodyDecoderRegistry, body_decoders
 from .decorators import add_default_resolver
+from .formparsers import MultipartLimits
 from .resolvers import (
     BaseConnectionParameterResolver,
     IRouteParameterResolver,
     SystemParameterResolver,
 )
+from .streaming import JsonArrayStream
 
 __all__ = [
     "add_default_resolver",
+    "BodyDecoderRegistry",
+    "body_decoders",
+    "JsonArrayStream",
+    "MultipartLimits",
     "WebsocketEndpointArgsModel",
     "RequestEndpointArgsModel",
     "ExtraEndpointArg",
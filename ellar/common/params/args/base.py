@@ -3,6 +3,7 @@ import re
 import typing as t
 from collections import defaultdict
 
+import anyio
 from ellar.common.constants import (
     ROUTE_OPENAPI_PARAMETERS,
     primitive_types,
@@ -27,9 +28,11 @@ from ..decorators import get_default_resolver
 from ..resolvers import (
     BaseRouteParameterResolver,
     IRouteParameterResolver,
+    PathParameterResolver,
     SystemParameterResolver,
 )
 from ..resolvers.base import ResolverResult
+from .compiler import CompiledEndpointArgsResolver, compile_endpoint_args_model
 from .extra_args import ExtraEndpointArg
 from .factory import get_parameter_field
 from .resolver_generators import (
@@ -139,6 +142,10 @@ class EndpointArgsModel:
         "body_resolver",
         "endpoint_signature",
         "_route_models",
+        "_concurrent_route_models",
+        "_concurrent_resolution",
+        "_compiled_resolver",
+        "_capture_raw_data",
         "param_converters",
         "_extra_endpoint_args",
     )
@@ -162,6 +169,10 @@ class EndpointArgsModel:
             None
         )
         self._route_models: t.List[IRouteParameterResolver] = []
+        self._concurrent_route_models = False
+        self._concurrent_resolution = False
+        self._compiled_resolver: t.Optional[CompiledEndpointArgsResolver] = None
+        self._capture_raw_data = True
         self._extra_endpoint_args: t.List[ExtraEndpointArg] = (
             list(extra_endpoint_args) if extra_endpoint_args else []
         )
@@ -198,6 +209,26 @@ class EndpointArgsModel:
             param_name=param_name,
         )
 
+    @classmethod
+    def get_convertor_trusted_type(
+        cls, field: ModelField, convertor: Convertor
+    ) -> t.Optional[t.Type]:
+        """
+        Returns the return type of `convertor` when `field` is annotated with it and has no constraints.
+        Values converted to this type are already valid and are not validated again.
+        """
+        try:
+            return_type = t.get_type_hints(convertor.convert).get("return")
+        except Exception:  # pragma: no cover
+            return None
+        if (
+            isinstance(return_type, type)
+            and field.field_info.annotation is return_type
+            and not field.field_info.metadata
+        ):
+            return return_type
+        return None
+
     def get_omitted_prefix(self) -> t.List[ModelField]:
         """
         Tracks for omitted path parameters for OPENAPI purpose
@@ -219,6 +250,8 @@ class EndpointArgsModel:
         :return:
         """
         self._computation_models = defaultdict(list)
+        self._compiled_resolver = None
+        self._capture_raw_data = True
         self.compute_route_parameter_list()
         self.compute_extra_route_args()
         self.build_body_field()
@@ -229,6 +262,10 @@ class EndpointArgsModel:
             + self._computation_models[params.CookieFieldInfo.in_.value]
             + self._computation_models[SystemParameterResolver.in_]
         )
+        # concurrency only pays off with at least two resolvers waiting on I/O
+        self._concurrent_route_models = (
+            sum(resolver.awaits_io for resolver in self._route_models) > 1
+        )
 
     def compute_route_parameter_list(
         self, body_field_class: t.Type[FieldInfo] = params.BodyFieldInfo
@@ -283,7 +320,14 @@ class EndpointArgsModel:
                 assert is_scalar_field(field=param_field), (
                     "Path params must be of one of the supported types"
                 )
-                self._add_to_model(field=param_field)
+                resolver = self._add_to_model(field=param_field)
+                convertor = self.param_converters.get(param_name)
+                if convertor is not None and isinstance(
+                    resolver, PathParameterResolver
+                ):
+                    resolver.trusted_type = self.get_convertor_trusted_type(
+                        param_field, convertor
+                    )
             else:
                 param_field = process_parameter_file(
                     param_default=param_default,
@@ -327,28 +371,144 @@ class EndpointArgsModel:
         typed_signature = inspect.Signature(typed_params)
         return typed_signature
 
-    def _add_to_model(self, *, field: ModelField, key: t.Optional[str] = None) -> None:
+    def _add_to_model(
+        self, *, field: ModelField, key: t.Optional[str] = None
+    ) -> IRouteParameterResolver:
         field_info = t.cast(params.ParamFieldInfo, field.field_info)
-        self._computation_models[str(key or field_info.in_.value)].append(
-            field_info.create_resolver(model_field=field)
-        )
+        resolver = field_info.create_resolver(model_field=field)
+        self._computation_models[str(key or field_info.in_.value)].append(resolver)
+        return resolver
+
+    @property
+    def capture_raw_data(self) -> bool:
+        return self._capture_raw_data
+
+    def set_raw_data_capture(self, capture: bool) -> None:
+        """
+        Turns on or off the capture of the raw values of the endpoint parameters.
+
+        When off, resolvers return an empty dictionary instead of a dictionary of raw values
+        and the raw data of the resolvers is not merged.
+        :param capture: capture raw data
+        """
+        if capture == self._capture_raw_data:
+            return
+        self._capture_raw_data = capture
+        self._compiled_resolver = None
+
+        resolvers: t.List[t.Any] = list(self.get_all_models())
+        if isinstance(self.body_resolver, list):
+            resolvers.extend(self.body_resolver)
+        elif self.body_resolver:
+            resolvers.append(self.body_resolver)
+        while resolvers:
+            resolver = resolvers.pop()
+            resolver.capture_raw_data = capture
+            # grouped parameters resolvers
+            resolvers.extend(getattr(resolver, "resolvers", ()))
+
+    def set_concurrent_resolution(self, enabled: bool) -> None:
+        """
+        Turns on or off the concurrent resolution of the route parameters waiting on I/O.
+        Turning it on drops the compiled function of models resolving parameters concurrently.
+        :param enabled: resolve parameters concurrently
+        """
+        self._concurrent_resolution = enabled
+        if enabled and self._concurrent_route_models:
+            self._compiled_resolver = None
+
+    @property
+    def compiled_resolver(self) -> t.Optional[CompiledEndpointArgsResolver]:
+        return self._compiled_resolver
+
+    def compile(
+        self, single_validation: bool = False, enabled: bool = True
+    ) -> t.Optional[CompiledEndpointArgsResolver]:
+        """
+        Generates a function resolving the endpoint arguments in a single pass,
+        used by `resolve_dependencies` from then on.
+
+        Models resolving parameters concurrently, see `set_concurrent_resolution`, are not compiled.
+        :param single_validation: validates query, header, path and cookie parameters with a single call
+        :param enabled: when False, drops the compiled function and resolves the arguments with the resolvers
+        :return: CompiledEndpointArgsResolver or None
+        """
+        if not enabled or (
+            self._concurrent_route_models and self._concurrent_resolution
+        ):
+            self._compiled_resolver = None
+            return None
+        if (
+            self._compiled_resolver is None
+            or self._compiled_resolver.single_validation != single_validation
+        ):
+            self._compiled_resolver = compile_endpoint_args_model(
+                self,
+                single_validation=single_validation,
+                capture_raw_data=self._capture_raw_data,
+            )
+        return self._compiled_resolver
 
     async def resolve_dependencies(self, *, ctx: IExecutionContext) -> ResolverResult:
+        if self._compiled_resolver is not None:
+            return await self._compiled_resolver.resolve(ctx)
+
         body_resolver = await self.resolve_body(ctx)
 
         if body_resolver and not body_resolver.errors:
-            for parameter_resolver in self._route_models:
-                res = await parameter_resolver.resolve(ctx=ctx)
-                if res.data:
-                    body_resolver.data.update(res.data)
-                if res.errors:
-                    _errors = (
-                        res.errors if isinstance(res.errors, list) else [res.errors]
-                    )
-                    body_resolver.errors.extend(_errors)
-                body_resolver.raw_data.update(res.raw_data)
+            if self._concurrent_route_models and self._concurrent_resolution:
+                for res in await self._resolve_route_models_concurrently(ctx):
+                    self._merge_resolver_result(body_resolver, res)
+            else:
+                for parameter_resolver in self._route_models:
+                    res = await parameter_resolver.resolve(ctx=ctx)
+                    self._merge_resolver_result(body_resolver, res)
         return body_resolver
 
+    def _merge_resolver_result(
+        self, body_resolver: ResolverResult, res: ResolverResult
+    ) -> None:
+        if res.data:
+            body_resolver.data.update(res.data)
+        if res.errors:
+            _errors = res.errors if isinstance(res.errors, list) else [res.errors]
+            body_resolver.errors.extend(_errors)
+        if self._capture_raw_data:
+            # results of resolvers that do not capture raw data share a read-only mapping
+            t.cast(t.Dict, body_resolver.raw_data).update(res.raw_data)
+
+    async def _resolve_route_models_concurrently(
+        self, ctx: IExecutionContext
+    ) -> t.List[ResolverResult]:
+        """
+        Resolves route parameters waiting on I/O concurrently in an anyio task group
+        and the others inline.
+
+        Results are returned in route models order, so errors are aggregated as they are when
+        resolving one parameter after another. When resolvers raise, all resolvers still complete
+        and the exception of the first one, in route models order, is raised.
+        """
+        outcomes: t.List[t.Any] = [None] * len(self._route_models)
+
+        async def _resolve(position: int, resolver: IRouteParameterResolver) -> None:
+            try:
+                outcomes[position] = await resolver.resolve(ctx=ctx)
+            except Exception as ex:
+                outcomes[position] = ex
+
+        async with anyio.create_task_group() as task_group:
+            for position, resolver in enumerate(self._route_models):
+                if resolver.awaits_io:
+                    task_group.start_soon(_resolve, position, resolver)
+            for position, resolver in enumerate(self._route_models):
+                if not resolver.awaits_io:
+                    await _resolve(position, resolver)
+
+        for outcome in outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+        return outcomes
+
     def compute_extra_route_args(self) -> None:
         self._add_extra_route_args(*self._extra_endpoint_args)
 
@@ -0,0 +1,327 @@
+import copy
+import linecache
+import re
+import typing as t
+from collections import defaultdict
+
+from ellar.common.logging import request_tracer
+from ellar.pydantic import ModelField, TypeAdapter, ValidationError, is_sequence_field
+from typing_extensions import Annotated, TypedDict
+
+from ..resolvers import (
+    CookieParameterResolver,
+    HeaderParameterResolver,
+    IRouteParameterResolver,
+    PathParameterResolver,
+    QueryParameterResolver,
+)
+from ..resolvers.base import ResolverResult
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.common.interfaces import IExecutionContext
+
+    from .base import EndpointArgsModel
+
+__all__ = [
+    "CompiledEndpointArgsResolver",
+    "ParametersValidator",
+    "compile_endpoint_args_model",
+]
+
+# connection attribute read by each resolver type compiled inline
+_INLINE_SOURCES = {
+    HeaderParameterResolver: "headers",
+    QueryParameterResolver: "query_params",
+    PathParameterResolver: "path_params",
+    CookieParameterResolver: "cookies",
+}
+
+
+class CompiledEndpointArgsResolver:
+    """
+    Resolves the arguments of an endpoint with a function generated for its `EndpointArgsModel`.
+
+    Query, header, path and cookie parameters are read from the connection, validated and added
+    to the endpoint arguments in a single pass, producing the same values and errors as their resolvers.
+    Path parameters values already converted to their type by the path convertor are not validated again.
+    Other resolvers, like system parameters or grouped parameters, are still called one after another.
+
+    `source` holds the generated code, which also shows in tracebacks.
+    """
+
+    __slots__ = ("name", "source", "single_validation", "resolve")
+
+    def __init__(
+        self,
+        name: str,
+        source: str,
+        namespace: t.Dict[str, t.Any],
+        single_validation: bool = False,
+    ) -> None:
+        self.name = name
+        self.source = source
+        self.single_validation = single_validation
+
+        filename = f"<ellar compiled arguments {name}>"
+        exec(compile(source, filename, "exec"), namespace)
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(keepends=True),
+            filename,
+        )
+        self.resolve: t.Callable[["IExecutionContext"], t.Awaitable[ResolverResult]] = (
+            namespace[name]
+        )
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.name}>"
+
+
+class ParametersValidator:
+    """
+    Validates query, header, path and cookie parameters values with a single `TypeAdapter` call.
+
+    Parameters are the keys of a generated `TypedDict`, keeping the annotation and constraints
+    of their field, and validation errors are mapped back to the parameter `loc=(in_, alias)`.
+    Keys missing from the validated values are left out, and no value is returned when
+    any of them is invalid since the endpoint is not called.
+    """
+
+    __slots__ = ("_adapter", "_locs")
+
+    def __init__(self, name: str, fields: t.Dict[str, ModelField]) -> None:
+        items: t.Dict[str, t.Any] = {}
+        self._locs: t.Dict[str, t.Tuple[t.Any, ...]] = {}
+        for key, field in fields.items():
+            metadata = field.field_info.metadata
+            items[key] = (
+                Annotated[(field.field_info.annotation, *metadata)]
+                if metadata
+                else field.field_info.annotation
+            )
+            self._locs[key] = (field.field_info.in_.value, field.alias)  # type: ignore[attr-defined]
+        self._adapter: TypeAdapter[t.Dict[str, t.Any]] = TypeAdapter(
+            TypedDict(name, items, total=False)  # type: ignore[operator]
+        )
+
+    def validate(
+        self, inputs: t.Dict[str, t.Any]
+    ) -> t.Tuple[t.Dict[str, t.Any], t.Dict[str, t.List[t.Dict[str, t.Any]]]]:
+        try:
+            return self._adapter.validate_python(inputs, from_attributes=True), {}
+        except ValidationError as exc:
+            errors: t.DefaultDict[str, t.List[t.Dict[str, t.Any]]] = defaultdict(list)
+            for error in exc.errors():
+                key, *loc = error["loc"]
+                errors[str(key)].append(
+                    {**error, "loc": self._locs[str(key)] + tuple(loc)}
+                )
+            return {}, errors
+
+
+def _get_function_name(model: "EndpointArgsModel") -> str:
+    name = getattr(model, "operation_unique_id", None) or model.path
+    return "resolve_" + re.sub(r"\W", "_", name).strip("_")
+
+
+def _get_trusted_type(resolver: IRouteParameterResolver) -> t.Optional[t.Type]:
+    return getattr(resolver, "trusted_type", None)
+
+
+def _compile_read(
+    resolver: IRouteParameterResolver,
+    position: int,
+    source_name: str,
+    capture_raw_data: bool,
+) -> t.List[str]:
+    field = resolver.model_field
+    name, alias = field.name, field.alias
+    lines = [f"    # {type(resolver).__name__} {name!r}"]
+
+    if not isinstance(resolver, HeaderParameterResolver):
+        lines.append(f"    value_{position} = {source_name}.get({str(alias)!r})")
+    elif is_sequence_field(field):
+        lines.append(
+            f"    value_{position} = {source_name}.getlist({alias!r}) or field_{position}.default"
+        )
+    else:
+        lines.append(f"    value_{position} = {source_name}.get({alias!r})")
+    if capture_raw_data:
+        lines.append(f"    raw_data[{name!r}] = value_{position}")
+    return lines
+
+
+def _compile_missing(
+    resolver: IRouteParameterResolver, position: int, capture_raw_data: bool
+) -> t.List[str]:
+    field = resolver.model_field
+    if field.required:
+        loc = (field.field_info.in_.value, field.alias)  # type: ignore[attr-defined]
+        return [f"        errors.append(create_error(loc={loc!r}))"]
+    lines = [f"        values[{field.name!r}] = deepcopy(field_{position}.default)"]
+    if capture_raw_data:
+        # the resolver records the default as the raw value
+        lines.append(f"        raw_data[{field.name!r}] = values[{field.name!r}]")
+    return lines
+
+
+def _compile_validation(
+    resolver: IRouteParameterResolver, position: int, capture_raw_data: bool
+) -> t.List[str]:
+    field = resolver.model_field
+    name = field.name
+    loc = (field.field_info.in_.value, field.alias)  # type: ignore[attr-defined]
+    lines, indent = [], "    "
+
+    if isinstance(resolver, HeaderParameterResolver):
+        lines += [f"    if value_{position} is None:"] + _compile_missing(
+            resolver, position, capture_raw_data
+        )
+        lines.append("    else:")
+        indent = "        "
+    elif _get_trusted_type(resolver) is not None:
+        lines += [
+            f"    if type(value_{position}) is trusted_{position}:",
+            f"        values[{name!r}] = value_{position}",
+            "    else:",
+        ]
+        indent = "        "
+
+    return lines + [
+        f"{indent}value, value_errors = field_{position}.validate(value_{position}, {{}}, loc={loc!r})",
+        f"{indent}values[{name!r}] = value",
+        f"{indent}if value_errors:",
+        f"{indent}    errors.extend(value_errors)",
+    ]
+
+
+def _compile_validated_value(
+    resolver: IRouteParameterResolver, position: int, capture_raw_data: bool
+) -> t.List[str]:
+    name, key = resolver.model_field.name, f"p{position}"
+    lines = [f"    # {type(resolver).__name__} {name!r}"]
+    condition = "if"
+
+    if isinstance(resolver, HeaderParameterResolver):
+        lines += [f"    if value_{position} is None:"] + _compile_missing(
+            resolver, position, capture_raw_data
+        )
+        condition = "elif"
+    elif _get_trusted_type(resolver) is not None:
+        lines += [
+            f"    if type(value_{position}) is trusted_{position}:",
+            f"        values[{name!r}] = value_{position}",
+        ]
+        condition = "elif"
+
+    # `validated` is empty when any parameter is invalid
+    return lines + [
+        f"    {condition} {key!r} in field_errors:",
+        f"        values[{name!r}] = None",
+        f"        errors.extend(field_errors[{key!r}])",
+        "    else:",
+        f"        values[{name!r}] = validated.get({key!r})",
+    ]
+
+
+def _compile_resolver_call(
+    resolver: IRouteParameterResolver, position: int, capture_raw_data: bool
+) -> t.List[str]:
+    name = getattr(resolver, "parameter_name", None) or resolver.model_field.name
+    lines = [
+        f"    # {type(resolver).__name__} {name!r}",
+        f"    res = await resolver_{position}.resolve(ctx=ctx)",
+        "    if res.data:",
+        "        values.update(res.data)",
+        "    if res.errors:",
+        "        errors.extend(res.errors if isinstance(res.errors, list) else [res.errors])",
+    ]
+    if capture_raw_data:
+        lines.append("    raw_data.update(res.raw_data)")
+    return lines
+
+
+def compile_endpoint_args_model(
+    model: "EndpointArgsModel",
+    single_validation: bool = False,
+    capture_raw_data: bool = True,
+) -> CompiledEndpointArgsResolver:
+    """
+    Generates the function resolving the arguments of a built `EndpointArgsModel`
+
+    With `single_validation`, query, header, path and cookie parameters are validated together
+    by a `ParametersValidator` instead of one after another.
+    Without `capture_raw_data`, the raw values of the parameters are not recorded.
+    """
+    name = _get_function_name(model)
+    namespace: t.Dict[str, t.Any] = {
+        "create_error": HeaderParameterResolver.create_error,
+        "deepcopy": copy.deepcopy,
+        "model": model,
+        "request_tracer": request_tracer,
+    }
+    reads: t.List[str] = []
+    body: t.List[str] = []
+    sources: t.Dict[str, None] = {}
+    validated_fields: t.Dict[str, ModelField] = {}
+
+    for position, resolver in enumerate(model.get_route_models()):
+        source_name = _INLINE_SOURCES.get(type(resolver))
+        if source_name is None:
+            namespace[f"resolver_{position}"] = resolver
+            body += _compile_resolver_call(resolver, position, capture_raw_data)
+            continue
+
+        resolver.assert_field_info()  # type: ignore[attr-defined]
+        namespace[f"field_{position}"] = resolver.model_field
+        trusted_type = _get_trusted_type(resolver)
+        if trusted_type is not None:
+            namespace[f"trusted_{position}"] = trusted_type
+        sources[source_name] = None
+        if single_validation:
+            key = f"p{position}"
+            validated_fields[key] = resolver.model_field
+            reads += _compile_read(resolver, position, source_name, capture_raw_data)
+            if isinstance(resolver, HeaderParameterResolver):
+                reads.append(f"    if value_{position} is not None:")
+                reads.append(f"        inputs[{key!r}] = value_{position}")
+            elif trusted_type is not None:
+                reads.append(
+                    f"    if type(value_{position}) is not trusted_{position}:"
+                )
+                reads.append(f"        inputs[{key!r}] = value_{position}")
+            else:
+                reads.append(f"    inputs[{key!r}] = value_{position}")
+            body += _compile_validated_value(resolver, position, capture_raw_data)
+        else:
+            body += _compile_read(resolver, position, source_name, capture_raw_data)
+            body += _compile_validation(resolver, position, capture_raw_data)
+
+    lines = [
+        f"async def {name}(ctx):",
+        "    if request_tracer.enabled:",
+        '        request_tracer.trace("Resolving Compiled Endpoint Arguments", model)',
+        "    result = await model.resolve_body(ctx)",
+        "    if result.errors:",
+        "        return result",
+        "    values, errors, raw_data = result",
+    ]
+    if sources:
+        lines.append("    connection = ctx.switch_to_http_connection().get_client()")
+        lines += [
+            f"    {source_name} = connection.{source_name}" for source_name in sources
+        ]
+    if validated_fields:
+        namespace["validator"] = ParametersValidator(
+            f"{name}_parameters", validated_fields
+        )
+        lines.append("    inputs = {}")
+        lines += reads
+        lines.append("    validated, field_errors = validator.validate(inputs)")
+    lines += body
+    lines.append("    return result")
+
+    return CompiledEndpointArgsResolver(
+        name, "\n".join(lines) + "\n", namespace, single_validation=single_validation
+    )
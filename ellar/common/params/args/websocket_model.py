@@ -63,5 +63,6 @@ class WebsocketEndpointArgsModel(EndpointArgsModel):
             if res.errors:
                 assert isinstance(res.errors, list)
                 errors.extend(res.errors)
-            raw_data.update({parameter_resolver.model_field.name: res.raw_data})
+            if self._capture_raw_data:
+                raw_data.update({parameter_resolver.model_field.name: res.raw_data})
         return ResolverResult(values, errors, raw_data)
@@ -0,0 +1,89 @@
+import functools
+import json
+import typing as t
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+__all__ = [
+    "TBodyDecoder",
+    "BodyDecoderRegistry",
+    "body_decoders",
+    "decode_json",
+    "parse_content_type",
+]
+
+# Decodes the bytes of a request body. Malformed JSON bodies raise `json.JSONDecodeError`,
+# reported as a validation error, any other exception is reported as a `400` response.
+TBodyDecoder = t.Callable[[bytes], t.Any]
+
+
+@functools.lru_cache(maxsize=128)
+def parse_content_type(content_type: str) -> t.Tuple[str, str]:
+    """
+    Returns the lower cased `(maintype, subtype)` of a `Content-Type` header value,
+    `("text", "plain")` when it is not valid, as `email.message.Message` does.
+    """
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if media_type.count("/") != 1:
+        return "text", "plain"
+    maintype, subtype = media_type.split("/")
+    return maintype, subtype
+
+
+def decode_json(body: bytes) -> t.Any:
+    """
+    Decodes a JSON body with `orjson` when installed, `json` otherwise.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(body)
+        except orjson.JSONDecodeError:
+            # `json` accepts a few documents `orjson` rejects, like `NaN` or UTF-16 bodies,
+            # and reports decoding errors with its own messages.
+            pass
+    return json.loads(body)
+
+
+class BodyDecoderRegistry:
+    """
+    Decoders of request bodies by media type, used by body parameters.
+
+    A decoder is registered for a media type, like `application/json`, or for all the media types
+    of a structured syntax suffix, like `application/*+json`.
+    Bodies without `Content-Type` are decoded by the `application/json` decoder, and bodies
+    without a decoder are passed to body parameters as bytes.
+
+    Example:
+    >>> import yaml
+    >>> from ellar.common.params import body_decoders
+    >>> body_decoders.register("application/yaml", yaml.safe_load)
+    """
+
+    __slots__ = ("_decoders",)
+
+    def __init__(self) -> None:
+        self._decoders: t.Dict[str, TBodyDecoder] = {}
+
+    def register(self, media_type: str, decoder: TBodyDecoder) -> None:
+        self._decoders[media_type.lower()] = decoder
+
+    def unregister(self, media_type: str) -> None:
+        self._decoders.pop(media_type.lower(), None)
+
+    def get_decoder(self, content_type: t.Optional[str]) -> t.Optional[TBodyDecoder]:
+        if not content_type:
+            return self._decoders.get("application/json")
+
+        maintype, subtype = parse_content_type(content_type)
+        decoder = self._decoders.get(f"{maintype}/{subtype}")
+        if decoder is None and "+" in subtype:
+            decoder = self._decoders.get(f"{maintype}/*+{subtype.rsplit('+', 1)[1]}")
+        return decoder
+
+
+body_decoders = BodyDecoderRegistry()
+body_decoders.register("application/json", decode_json)
+body_decoders.register("application/*+json", decode_json)
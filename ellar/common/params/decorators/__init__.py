@@ -6,6 +6,7 @@ from typing_extensions import Annotated
 
 from . import models as param_functions
 from .inject import InjectShortcut, add_default_resolver, get_default_resolver
+from .stream import StreamBodyShortcut
 
 _Unset: t.Any = Undefined
 
@@ -22,6 +23,7 @@ __all__ = [
     "Query",
     "WsBody",
     "Inject",
+    "StreamBody",
 ]
 
 
@@ -101,6 +103,8 @@ class _ParamShortcut:
 
 
 if t.TYPE_CHECKING:  # pragma: nocover
+    from ..streaming import JsonArrayStream
+
     # mypy cheats
     T = t.TypeVar("T")
     Body = Annotated[T, param_functions.Body()]
@@ -112,6 +116,7 @@ if t.TYPE_CHECKING:  # pragma: nocover
     Query = Annotated[T, param_functions.Query()]
     WsBody = Annotated[T, param_functions.WsBody()]
     Inject = Annotated[T, InjectShortcut()]
+    StreamBody = Annotated[JsonArrayStream[T], StreamBodyShortcut()]
 
 else:
     Body = _ParamShortcut(param_functions.Body)
@@ -123,3 +128,4 @@ else:
     Query = _ParamShortcut(param_functions.Query)
     WsBody = _ParamShortcut(param_functions.WsBody)
     Inject = InjectShortcut()
+    StreamBody = StreamBodyShortcut()
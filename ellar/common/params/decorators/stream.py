@@ -0,0 +1,29 @@
+import typing as t
+
+from typing_extensions import Annotated
+
+from ..resolvers.system_parameters import JsonArrayStreamParameter
+from ..streaming import JsonArrayStream
+
+
+class StreamBodyShortcut:
+    """
+    Annotates a parameter with the items of a JSON array request body, validated while the body
+    is received, as a `JsonArrayStream`.
+
+    Example:
+    >>> async def endpoint(items: StreamBody[Item]): ...
+    >>> async def endpoint(items: StreamBody[Item, StreamBody.P(batch_size=500)]): ...
+    """
+
+    def __getitem__(self, args: t.Any) -> t.Any:
+        if isinstance(args, tuple):
+            return Annotated[
+                JsonArrayStream[args[0]], JsonArrayStreamParameter(**args[1])
+            ]
+        return Annotated[JsonArrayStream[args], JsonArrayStreamParameter()]
+
+    @classmethod
+    def P(cls, batch_size: int = 100) -> t.Dict[str, t.Any]:
+        """Arguments for StreamBody"""
+        return {"batch_size": batch_size}
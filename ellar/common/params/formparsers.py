@@ -0,0 +1,134 @@
+import typing as t
+
+from starlette.datastructures import FormData, Headers
+from starlette.formparsers import MultiPartException, MultiPartParser
+from starlette.requests import Request
+
+from .decoders import parse_content_type
+
+__all__ = [
+    "TUploadFileFactory",
+    "MultipartLimits",
+    "FileTooLarge",
+    "LimitedMultiPartParser",
+    "parse_form",
+]
+
+# Creates the binary file object an upload is written to, from its filename and part headers.
+# The file object must provide `write`, `seek`, `read` and `close`.
+TUploadFileFactory = t.Callable[[t.Optional[str], Headers], t.BinaryIO]
+
+
+class MultipartLimits:
+    """
+    Limits applied while parsing `multipart/form-data` request bodies.
+
+    :param max_file_size: Maximum size of an uploaded file in bytes, unlimited when None.
+    :param max_files: Maximum number of uploaded files.
+    :param max_fields: Maximum number of non-file fields.
+    :param max_part_size: Maximum size of a non-file field in bytes.
+    :param spool_max_size: Size in bytes from which uploads are written to a temporary file on disk
+    instead of being kept in memory.
+    :param file_factory: Creates the file object each upload is written to, instead of a temporary file,
+    to stream uploads straight to their target.
+    """
+
+    __slots__ = (
+        "max_file_size",
+        "max_files",
+        "max_fields",
+        "max_part_size",
+        "spool_max_size",
+        "file_factory",
+    )
+
+    def __init__(
+        self,
+        *,
+        max_file_size: t.Optional[int] = None,
+        max_files: t.Union[int, float] = 1000,
+        max_fields: t.Union[int, float] = 1000,
+        max_part_size: int = 1024 * 1024,
+        spool_max_size: int = 1024 * 1024,
+        file_factory: t.Optional[TUploadFileFactory] = None,
+    ) -> None:
+        self.max_file_size = max_file_size
+        self.max_files = max_files
+        self.max_fields = max_fields
+        self.max_part_size = max_part_size
+        self.spool_max_size = spool_max_size
+        self.file_factory = file_factory
+
+
+class FileTooLarge(MultiPartException):
+    """Raised when an uploaded file exceeds `MultipartLimits.max_file_size`"""
+
+
+class LimitedMultiPartParser(MultiPartParser):
+    """
+    `MultiPartParser` applying `MultipartLimits`.
+
+    File sizes are checked as the request body is received, so an oversized upload is rejected
+    without reading the rest of the body.
+
+    Starlette has no public hook for the part being parsed, so the parser relies on
+    `MultiPartParser._current_part` and `MultiPartParser._files_to_close_on_error`,
+    checked by the test suite against the installed Starlette version.
+    """
+
+    def __init__(
+        self,
+        headers: Headers,
+        stream: t.AsyncGenerator[bytes, None],
+        limits: MultipartLimits,
+    ) -> None:
+        super().__init__(
+            headers,
+            stream,
+            max_files=limits.max_files,
+            max_fields=limits.max_fields,
+            max_part_size=limits.max_part_size,
+        )
+        self.spool_max_size = limits.spool_max_size
+        self.limits = limits
+        self._current_file_size = 0
+
+    def on_part_begin(self) -> None:
+        super().on_part_begin()
+        self._current_file_size = 0
+
+    def on_part_data(self, data: bytes, start: int, end: int) -> None:
+        max_file_size = self.limits.max_file_size
+        if self._current_part.file is not None and max_file_size is not None:
+            self._current_file_size += end - start
+            if self._current_file_size > max_file_size:
+                raise FileTooLarge(
+                    f"File exceeded maximum size of {max_file_size} bytes."
+                )
+        super().on_part_data(data, start, end)
+
+    def on_headers_finished(self) -> None:
+        super().on_headers_finished()
+        upload = self._current_part.file
+        if upload is not None and self.limits.file_factory is not None:
+            # replaces the temporary file created for the upload
+            self._files_to_close_on_error.pop().close()
+            target = self.limits.file_factory(upload.filename, upload.headers)
+            self._files_to_close_on_error.append(target)
+            upload.file = target
+
+
+async def parse_form(request: Request, limits: MultipartLimits) -> FormData:
+    """
+    Parses the form data of a request, applying `limits` to `multipart/form-data` bodies.
+    Like `Request.form`, the form data is parsed once per request.
+    """
+    if request._form is None:
+        content_type = request.headers.get("content-type", "")
+        if parse_content_type(content_type) != ("multipart", "form-data"):
+            return await request.form(
+                max_files=limits.max_files, max_fields=limits.max_fields
+            )
+        parser = LimitedMultiPartParser(request.headers, request.stream(), limits)
+        request._form = await parser.parse()
+    return request._form
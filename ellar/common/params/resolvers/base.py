@@ -1,5 +1,6 @@
 import typing as t
 from abc import ABC, ABCMeta, abstractmethod
+from types import MappingProxyType
 
 from ellar.pydantic import (
     ModelField,
@@ -18,7 +19,11 @@ class ResolverResult(t.NamedTuple):
 
     data: t.Optional[t.Any]
     errors: t.Optional[t.List[t.Dict[str, t.Any]]]
-    raw_data: t.Dict[str, t.Any]
+    raw_data: t.Mapping[str, t.Any]
+
+
+# raw data of the resolvers that do not capture raw data, shared and read-only
+EMPTY_RAW_DATA: t.Mapping[str, t.Any] = MappingProxyType({})
 
 
 class RouteParameterModelField(ModelField):
@@ -27,6 +32,12 @@ class RouteParameterModelField(ModelField):
 
 class IRouteParameterResolver(ABC, metaclass=ABCMeta):
     model_field: t.Union[RouteParameterModelField, ModelField]
+    # `False` when `resolve` never waits on I/O, e.g. it only reads the connection scope.
+    # Such resolvers run inline when route parameters are resolved concurrently.
+    awaits_io: bool = True
+    # `False` when the route does not capture raw data, see `EndpointArgsModel.set_raw_data_capture`.
+    # `create_raw_data` then returns the shared read-only `EMPTY_RAW_DATA`.
+    capture_raw_data: bool = True
 
     @abstractmethod
     @t.no_type_check
@@ -46,7 +57,7 @@ class IRouteParameterResolver(ABC, metaclass=ABCMeta):
     @t.no_type_check
     def create_raw_data(
         self, data: t.Any, field_name: t.Optional[str] = None
-    ) -> t.Dict:
+    ) -> t.Mapping[str, t.Any]:
         """
         Creates the raw data for the parameter.
 
@@ -55,7 +66,7 @@ class IRouteParameterResolver(ABC, metaclass=ABCMeta):
             field_name: The name of the field.
 
         Returns:
-            `dict`: A dictionary containing the raw data.
+            `Mapping`: The raw data, read-only when the resolver does not capture raw data.
         """
 
 
@@ -67,7 +78,9 @@ class BaseRouteParameterResolver(IRouteParameterResolver, ABC):
 
     def create_raw_data(
         self, data: t.Any, field_name: t.Optional[str] = None
-    ) -> t.Dict:
+    ) -> t.Mapping[str, t.Any]:
+        if not self.capture_raw_data:
+            return EMPTY_RAW_DATA
         return {field_name or self.model_field.name: data}
 
     def assert_field_info(self) -> None:
@@ -1,11 +1,16 @@
 import typing as t
 
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
-from ellar.pydantic import ModelField
+from ellar.common.logging import request_tracer
+from ellar.pydantic import ModelField, is_sequence_field
 
 from .base import BaseRouteParameterResolver, ResolverResult
-from .parameter import BodyParameterResolver, FormParameterResolver
+from .parameter import (
+    BodyParameterResolver,
+    FormParameterResolver,
+    HeaderParameterResolver,
+    PathParameterResolver,
+)
 
 
 class BulkParameterResolver(BaseRouteParameterResolver):
@@ -17,6 +22,42 @@ class BulkParameterResolver(BaseRouteParameterResolver):
     ):
         super().__init__(*args, **kwargs)
         self._resolvers = resolvers or []
+        # grouped query, header, path or cookie parameters, validated once by `model_field`,
+        # by the key `model_field` validates each of them from
+        self._model_keys: t.Optional[t.Dict[str, BaseRouteParameterResolver]] = None
+        if not isinstance(self, BodyParameterResolver):
+            self.awaits_io = any(resolver.awaits_io for resolver in self._resolvers)
+            if all(
+                isinstance(resolver, (HeaderParameterResolver, PathParameterResolver))
+                for resolver in self._resolvers
+            ):
+                self._model_keys = self._get_model_keys()
+
+    def _get_model_keys(
+        self,
+    ) -> t.Optional[t.Dict[str, BaseRouteParameterResolver]]:
+        """
+        Maps the key each model field is validated from to the resolver of the field.
+        Returns None, resolving the parameters one after another, unless resolvers and model fields
+        match one to one.
+        """
+        fields = getattr(self.model_field.type_, "model_fields", {})
+        # resolvers are named after the alias of their model field, or its name
+        resolvers = {
+            resolver.model_field.name: resolver for resolver in self._resolvers
+        }
+        keys: t.Dict[str, BaseRouteParameterResolver] = {}
+        for name, field in fields.items():
+            resolver = resolvers.pop(field.alias or name, None)
+            if resolver is None:
+                return None
+            key = field.validation_alias or field.alias or name
+            keys[key if isinstance(key, str) else resolver.model_field.alias] = resolver
+
+        if resolvers or len(keys) != len(self._resolvers):
+            # resolvers without model field, or sharing a key
+            return None
+        return keys
 
     @property
     def resolvers(self) -> t.List[BaseRouteParameterResolver]:
@@ -28,12 +69,14 @@ class BulkParameterResolver(BaseRouteParameterResolver):
     async def resolve_handle(
         self, ctx: IExecutionContext, *args: t.Any, **kwargs: t.Any
     ) -> ResolverResult:
-        request_logger.debug(
-            f"Resolving Bulk Path Parameters - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Bulk Path Parameters", self)
+        if self._model_keys is not None:
+            return self.resolve_model(ctx, self._model_keys)
+
         values: t.Dict[str, t.Any] = {}
         errors = []
-        raw_data = {}
+        raw_data: t.Dict[str, t.Any] = {}
 
         for parameter_resolver in self._resolvers:
             res = await parameter_resolver.resolve(*args, ctx=ctx, **kwargs)
@@ -48,7 +91,8 @@ class BulkParameterResolver(BaseRouteParameterResolver):
             if res.errors:
                 errors += self.validate_error_sequence(res.errors)
 
-            raw_data.update(res.raw_data)
+            if self.capture_raw_data:
+                raw_data.update(res.raw_data)
 
         if errors:
             return ResolverResult(values, errors=errors, raw_data=raw_data)
@@ -65,6 +109,76 @@ class BulkParameterResolver(BaseRouteParameterResolver):
             return ResolverResult(values, errors=errors, raw_data=raw_data)
         return ResolverResult({self.model_field.name: v_}, errors=[], raw_data=raw_data)
 
+    def resolve_model(
+        self,
+        ctx: IExecutionContext,
+        model_keys: t.Dict[str, BaseRouteParameterResolver],
+    ) -> ResolverResult:
+        """
+        Validates the received values of the grouped parameters against `model_field` in a single call.
+        Validation errors keep the location of their parameter, `loc=(in_, alias)`.
+        """
+        data: t.Dict[str, t.Any] = {}
+        raw_data: t.Dict[str, t.Any] = {}
+        field_errors: t.Dict[str, t.List[t.Any]] = {}
+
+        for key, resolver in model_keys.items():
+            field = resolver.model_field
+            received_params = resolver.get_received_parameter(ctx=ctx)  # type:ignore[attr-defined]
+            if not isinstance(resolver, HeaderParameterResolver):
+                value = received_params.get(str(field.alias))
+            elif is_sequence_field(field):
+                value = received_params.getlist(field.alias) or field.default
+            else:
+                value = received_params.get(field.alias)
+            if self.capture_raw_data:
+                raw_data.update(resolver.create_raw_data(value))
+
+            if value is None and isinstance(resolver, HeaderParameterResolver):
+                # left out for the model default
+                if field.required:
+                    field_errors[key] = [
+                        self.create_error(loc=(field.field_info.in_.value, field.alias))
+                    ]
+                continue
+            data[key] = value
+
+        value, errors_ = self.model_field.validate(data, {})
+        if not errors_ and not field_errors:
+            return ResolverResult(
+                {self.model_field.name: value}, errors=[], raw_data=raw_data
+            )
+
+        model_errors: t.List[t.Dict[str, t.Any]] = []
+        for error in errors_ or []:
+            key, *loc = error["loc"] or ("",)
+            parameter_resolver = model_keys.get(str(key))
+            if parameter_resolver is None:
+                model_errors.append(
+                    {
+                        **error,
+                        "loc": (
+                            self.model_field.field_info.in_.value,
+                            self.model_field.alias,
+                        )
+                        + tuple(error["loc"]),
+                    }
+                )
+            elif key in data:
+                # missing required parameters are already reported
+                field = parameter_resolver.model_field
+                field_errors.setdefault(key, []).append(
+                    {**error, "loc": (field.field_info.in_.value, field.alias, *loc)}
+                )
+
+        # errors of each parameter, in resolvers order
+        errors = [
+            error for key in model_keys for error in field_errors.get(key, ())
+        ] + model_errors
+        return ResolverResult(
+            {}, errors=self.validate_error_sequence(errors), raw_data=raw_data
+        )
+
 
 class BulkFormParameterResolver(FormParameterResolver, BulkParameterResolver):
     def __init__(self, *args: t.Any, is_grouped: bool = False, **kwargs: t.Any):
@@ -82,9 +196,8 @@ class BulkFormParameterResolver(FormParameterResolver, BulkParameterResolver):
     async def resolve_grouped_fields(
         self, ctx: IExecutionContext, body: t.Any
     ) -> ResolverResult:
-        request_logger.debug(
-            f"Resolving Form Grouped Field - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Form Grouped Field", self)
         res = await self._get_resolver_data(ctx, body, by_alias=True)
         if res.errors:
             return res
@@ -115,7 +228,7 @@ class BulkFormParameterResolver(FormParameterResolver, BulkParameterResolver):
     ) -> ResolverResult:
         values: t.Dict[str, t.Any] = {}
         errors = []
-        raw_data = {}
+        raw_data: t.Dict[str, t.Any] = {}
         for parameter_resolver in self._resolvers:
             res_ = await parameter_resolver.resolve(ctx=ctx, body=body)
             if res_.data:
@@ -131,7 +244,8 @@ class BulkFormParameterResolver(FormParameterResolver, BulkParameterResolver):
                 values.update(value)
             if res_.errors:
                 errors += self.validate_error_sequence(res_.errors)
-            raw_data.update(res_.raw_data)
+            if self.capture_raw_data:
+                raw_data.update(res_.raw_data)
         return ResolverResult(values, errors, raw_data)
 
     async def resolve_handle(
@@ -141,7 +255,8 @@ class BulkFormParameterResolver(FormParameterResolver, BulkParameterResolver):
         body: t.Optional[t.Any] = None,
         **kwargs: t.Any,
     ) -> ResolverResult:
-        request_logger.debug(f"Resolving Form Parameters - '{self.__class__.__name__}'")
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Form Parameters", self)
         _body = body or await self.get_request_body(ctx)
         return await self._use_resolver(ctx, _body)
 
@@ -150,9 +265,8 @@ class BulkBodyParameterResolver(BulkParameterResolver, BodyParameterResolver):
     async def resolve_handle(
         self, ctx: IExecutionContext, *args: t.Any, **kwargs: t.Any
     ) -> ResolverResult:
-        request_logger.debug(
-            f"Resolving Request Body Parameters - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Request Body Parameters", self)
         _body = await self.get_request_body(ctx)
 
         res = await super().resolve_handle(ctx, *args, body=_body, **kwargs)
@@ -1,26 +1,25 @@
 import copy
-import email.message
 import json
 import typing as t
 
 import anyio
 from ellar.common.constants import (
+    MULTIPART_LIMITS_KEY,
     sequence_types,
 )
-from ellar.common.exceptions import RequestValidationError
+from ellar.common.exceptions import RequestEntityTooLarge, RequestValidationError
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_logger, request_tracer
 from ellar.pydantic import (
+    BaseModel,
     is_sequence_field,
     lenient_issubclass,
 )
-from ellar.pydantic import (
-    types as pydantic_types,
-)
 from ellar.pydantic.utils import (
     is_bytes_sequence_annotation,
     serialize_sequence_value,
 )
+from ellar.reflect import reflect
 from starlette.datastructures import (
     FormData,
     Headers,
@@ -31,10 +30,14 @@ from starlette.datastructures import (
 )
 from starlette.exceptions import HTTPException
 
+from ..decoders import body_decoders, decode_json
+from ..formparsers import FileTooLarge, MultipartLimits, parse_form
 from .base import BaseRouteParameterResolver, ResolverResult
 
 
 class HeaderParameterResolver(BaseRouteParameterResolver):
+    awaits_io = False
+
     @classmethod
     def get_received_parameter(
         cls, ctx: IExecutionContext
@@ -52,9 +55,8 @@ class HeaderParameterResolver(BaseRouteParameterResolver):
     ) -> ResolverResult:
         alias = alias or self.model_field.alias
         name = name or self.model_field.name
-        request_logger.debug(
-            f"Resolving Header Parameters - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Header Parameters", self)
         received_params = self.get_received_parameter(ctx=ctx)
         if is_sequence_field(self.model_field):
             value = received_params.getlist(alias) or self.model_field.default
@@ -97,6 +99,10 @@ class QueryParameterResolver(HeaderParameterResolver):
 
 
 class PathParameterResolver(BaseRouteParameterResolver):
+    awaits_io = False
+    # type of the values converted by the path convertor of the parameter, passed through without validation
+    trusted_type: t.Optional[t.Type] = None
+
     @classmethod
     def get_received_parameter(cls, ctx: IExecutionContext) -> t.Mapping[str, t.Any]:
         connection = ctx.switch_to_http_connection().get_client()
@@ -111,9 +117,16 @@ class PathParameterResolver(BaseRouteParameterResolver):
     ) -> ResolverResult:
         alias = alias or self.model_field.alias
         name = name or self.model_field.name
-        request_logger.debug(f"Resolving Path Parameters - '{self.__class__.__name__}'")
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Path Parameters", self)
         received_params = self.get_received_parameter(ctx=ctx)
         value = received_params.get(str(alias))
+        if self.trusted_type is not None and type(value) is self.trusted_type:
+            return ResolverResult(
+                data={name: value},
+                errors=[],
+                raw_data=self.create_raw_data(value, field_name=name),
+            )
         self.assert_field_info()
 
         v_, errors_ = self.model_field.validate(
@@ -136,6 +149,8 @@ class CookieParameterResolver(PathParameterResolver):
 
 
 class WsBodyParameterResolver(BaseRouteParameterResolver):
+    awaits_io = False
+
     async def resolve_handle(
         self,
         ctx: IExecutionContext,
@@ -147,9 +162,8 @@ class WsBodyParameterResolver(BaseRouteParameterResolver):
     ) -> t.Tuple:
         alias = alias or self.model_field.alias
         name = name or self.model_field.name
-        request_logger.debug(
-            f"Resolving Websocket Body Parameters - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Websocket Body Parameters", self)
         embed = getattr(self.model_field.field_info, "embed", False)
         received_body = {alias: body}
         loc = ("body",)
@@ -188,30 +202,23 @@ class WsBodyParameterResolver(BaseRouteParameterResolver):
 
 
 class BodyParameterResolver(WsBodyParameterResolver):
+    awaits_io = True
+
     def __init__(self, *args: t.Any, **kwargs: t.Any):
         super().__init__(*args, **kwargs)
+        # a single model body can be validated from the JSON document, see `VALIDATE_JSON_BODY`
+        self._validates_json = lenient_issubclass(self.model_field.type_, BaseModel)
 
     async def get_request_body(self, ctx: IExecutionContext) -> t.Any:
-        request_logger.debug(
-            f"Resolving Request Body Parameters - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Request Body Parameters", self)
         try:
             request = ctx.switch_to_http_connection().get_request()
             body_bytes = await request.body()
             if body_bytes:
-                json_body: t.Any = pydantic_types.Undefined
-                content_type_value = request.headers.get("content-type")
-                if not content_type_value:
-                    json_body = await request.json()
-                else:
-                    message = email.message.Message()
-                    message["content-type"] = content_type_value
-                    if message.get_content_maintype() == "application":
-                        subtype = message.get_content_subtype()
-                        if subtype == "json" or subtype.endswith("+json"):
-                            json_body = await request.json()
-                if json_body != pydantic_types.Undefined:
-                    body_bytes = json_body
+                decoder = body_decoders.get_decoder(request.headers.get("content-type"))
+                if decoder is not None:
+                    return decoder(body_bytes)
             return body_bytes
         except json.JSONDecodeError as e:
             request_logger.error("JSONDecodeError: ", exc_info=True)
@@ -227,12 +234,41 @@ class BodyParameterResolver(WsBodyParameterResolver):
                 ],
                 body=e.doc,
             ) from e
+        except RequestEntityTooLarge:
+            raise
         except Exception as e:
             request_logger.error("Unable to parse the body: ", exc_info=e)
             raise HTTPException(
                 status_code=400, detail="There was an error parsing the body"
             ) from e
 
+    async def resolve_json_body(
+        self, ctx: IExecutionContext
+    ) -> t.Optional[ResolverResult]:
+        """
+        Validates a JSON request body straight from its bytes.
+        Returns None when the body is not a JSON document, leaving it to `get_request_body`.
+        """
+        request = ctx.switch_to_http_connection().get_request()
+        decoder = body_decoders.get_decoder(request.headers.get("content-type"))
+        if decoder is not decode_json:
+            return None
+
+        body_bytes = await request.body()
+        if not body_bytes:
+            return None
+        if request_tracer.enabled:
+            request_tracer.trace("Validating JSON Request Body", self)
+        value, errors_ = self.model_field.validate_json(body_bytes, loc=("body",))
+        if errors_ and any(error["type"] == "json_invalid" for error in errors_):
+            # reported by `get_request_body` like any other malformed JSON body
+            return None
+        return ResolverResult(
+            data={self.model_field.name: value},
+            errors=self.validate_error_sequence(errors_),
+            raw_data=self.create_raw_data(body_bytes),
+        )
+
     async def resolve_handle(
         self,
         ctx: IExecutionContext,
@@ -240,6 +276,16 @@ class BodyParameterResolver(WsBodyParameterResolver):
         body: t.Optional[t.Any] = None,
         **kwargs: t.Any,
     ) -> t.Tuple:
+        if (
+            body is None
+            and self._validates_json
+            and not getattr(self.model_field.field_info, "embed", False)
+            and ctx.get_app().config.VALIDATE_JSON_BODY
+        ):
+            res = await self.resolve_json_body(ctx)
+            if res is not None:
+                return res
+
         body = body or await self.get_request_body(ctx)
         return await super(BodyParameterResolver, self).resolve_handle(
             ctx, *args, body=body, **kwargs
@@ -259,13 +305,20 @@ class FormParameterResolver(BodyParameterResolver):
         )
 
     async def get_request_body(self, ctx: IExecutionContext) -> t.Any:
-        request_logger.debug(
-            f"Resolving Request Form Parameters - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Request Form Parameters", self)
         try:
             request = ctx.switch_to_http_connection().get_request()
-            body_bytes = await request.form()
-            return body_bytes
+            limits: t.Optional[MultipartLimits] = reflect.get_metadata(
+                MULTIPART_LIMITS_KEY, ctx.get_handler()
+            )
+            if limits is None:
+                return await request.form()
+            return await parse_form(request, limits)
+        except FileTooLarge as e:
+            raise HTTPException(status_code=413, detail=e.message) from e
+        except RequestEntityTooLarge:
+            raise
         except Exception as e:
             request_logger.error("Unable to parse the body: ", exc_info=True)
             raise HTTPException(
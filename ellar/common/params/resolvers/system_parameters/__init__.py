@@ -6,6 +6,7 @@ from .provider import ProviderParameterInjector
 from .request import RequestParameter
 from .response import ResponseRequestParam
 from .session import HostRequestParam, SessionRequestParam
+from .stream import JsonArrayStreamParameter
 from .websocket import WebSocketParameter
 
 __all__ = [
@@ -20,4 +21,5 @@ __all__ = [
     "HostRequestParam",
     "SessionRequestParam",
     "BackgroundTasksParameter",
+    "JsonArrayStreamParameter",
 ]
@@ -8,6 +8,8 @@ from .base import SystemParameterResolver
 
 
 class BackgroundTasksParameter(SystemParameterResolver):
+    awaits_io = False
+
     async def resolve(self, ctx: IExecutionContext, **kwargs: t.Any) -> ResolverResult:
         res = ctx.switch_to_http_connection().get_response()
 
@@ -39,6 +39,8 @@ class SystemParameterResolver(IRouteParameterResolver, ABC):
         return self
 
     def create_raw_data(self, data: t.Any) -> t.Dict:
+        if not self.capture_raw_data:
+            return {}
         return {self.parameter_name: data}
 
     @abstractmethod
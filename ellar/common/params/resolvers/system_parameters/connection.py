@@ -7,6 +7,8 @@ from .base import SystemParameterResolver
 
 
 class ConnectionParam(SystemParameterResolver):
+    awaits_io = False
+
     async def resolve(self, ctx: IExecutionContext, **kwargs: t.Any) -> ResolverResult:
         connection = ctx.switch_to_http_connection().get_client()
         return ResolverResult(
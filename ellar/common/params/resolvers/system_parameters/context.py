@@ -7,5 +7,7 @@ from .base import SystemParameterResolver
 
 
 class ExecutionContextParameter(SystemParameterResolver):
+    awaits_io = False
+
     async def resolve(self, ctx: IExecutionContext, **kwargs: t.Any) -> ResolverResult:
         return ResolverResult({self.parameter_name: ctx}, [], self.create_raw_data(ctx))
@@ -14,6 +14,8 @@ class ProviderParameterInjector(SystemParameterResolver):
     Defines `Provider` resolver for route parameter based on the provided `service`
     """
 
+    awaits_io = False
+
     def __call__(
         self, parameter_name: str, parameter_annotation: t.Type[T]
     ) -> "ProviderParameterInjector":
@@ -7,6 +7,8 @@ from .base import SystemParameterResolver
 
 
 class RequestParameter(SystemParameterResolver):
+    awaits_io = False
+
     async def resolve(self, ctx: IExecutionContext, **kwargs: t.Any) -> ResolverResult:
         request = ctx.switch_to_http_connection().get_request()
         return ResolverResult(
@@ -7,6 +7,8 @@ from .base import SystemParameterResolver
 
 
 class ResponseRequestParam(SystemParameterResolver):
+    awaits_io = False
+
     async def resolve(self, ctx: IExecutionContext, **kwargs: t.Any) -> ResolverResult:
         response = ctx.switch_to_http_connection().get_response()
         return ResolverResult(
@@ -7,6 +7,7 @@ from .base import BaseConnectionParameterResolver
 
 class HostRequestParam(BaseConnectionParameterResolver):
     lookup_connection_field = None
+    awaits_io = False
 
     async def get_value(self, ctx: IExecutionContext) -> t.Any:
         connection = ctx.switch_to_http_connection().get_client()
@@ -16,3 +17,4 @@ class HostRequestParam(BaseConnectionParameterResolver):
 
 class SessionRequestParam(BaseConnectionParameterResolver):
     lookup_connection_field = "session"
+    awaits_io = False
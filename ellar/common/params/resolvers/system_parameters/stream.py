@@ -0,0 +1,46 @@
+import typing as t
+
+from ellar.common.exceptions import ImproperConfiguration
+from ellar.common.interfaces import IExecutionContext
+from ellar.common.params.resolvers.base import ResolverResult
+from ellar.common.params.streaming import JsonArrayStream
+from ellar.common.types import T
+from ellar.pydantic import TypeAdapter
+from typing_extensions import get_args
+
+from .base import SystemParameterResolver
+
+
+class JsonArrayStreamParameter(SystemParameterResolver):
+    """
+    Resolves a `JsonArrayStream` of the request body, validating its items with
+    the type argument of the parameter annotation, `JsonArrayStream[Item]`.
+    `data` is the maximum number of items validated at once.
+    """
+
+    # the request body is received while the stream is iterated
+    awaits_io = False
+
+    def __init__(self, batch_size: int = 100) -> None:
+        super().__init__(data=batch_size)
+        self._adapter: t.Optional[TypeAdapter[t.List[t.Any]]] = None
+
+    def __call__(self, parameter_name: str, parameter_annotation: t.Type[T]) -> t.Any:
+        super().__call__(parameter_name, parameter_annotation)
+        args = get_args(parameter_annotation)
+        if len(args) != 1:
+            raise ImproperConfiguration(
+                f"{parameter_name} annotation must be JsonArrayStream[<item type>]"
+            )
+        self._adapter = TypeAdapter(t.List[args[0]])  # type:ignore[valid-type]
+        return self
+
+    async def resolve(self, ctx: IExecutionContext, **kwargs: t.Any) -> ResolverResult:
+        assert self._adapter is not None
+        request = ctx.switch_to_http_connection().get_request()
+        stream: JsonArrayStream[t.Any] = JsonArrayStream(
+            request.stream(), self._adapter, self.data
+        )
+        return ResolverResult(
+            {self.parameter_name: stream}, [], self.create_raw_data(stream)
+        )
@@ -7,6 +7,8 @@ from .base import SystemParameterResolver
 
 
 class WebSocketParameter(SystemParameterResolver):
+    awaits_io = False
+
     async def resolve(self, ctx: IExecutionContext, **kwargs: t.Any) -> ResolverResult:
         websocket = ctx.switch_to_websocket().get_client()
         return ResolverResult(
@@ -0,0 +1,220 @@
+import json
+import re
+import typing as t
+
+from ellar.common.exceptions import RequestValidationError
+from ellar.pydantic import TypeAdapter, ValidationError
+
+from .decoders import decode_json
+
+__all__ = ["JsonArrayParser", "JsonArrayStream"]
+
+T = t.TypeVar("T")
+
+_TOKENS = re.compile(rb'[\[\]{}",]')
+_STRING_TOKENS = re.compile(rb'["\\]')
+_WHITESPACE = re.compile(rb"[ \t\n\r]*")
+
+_QUOTE, _COMMA = ord('"'), ord(",")
+_OPENING = (ord("["), ord("{"))
+_CLOSING = (ord("]"), ord("}"))
+
+
+class JsonArrayParser:
+    """
+    Incremental parser of a JSON array document.
+
+    `feed` returns the items completed by each received chunk, decoded by `decode_json`.
+    Only the bytes of the item being received are kept, so memory does not grow with the document size.
+    Malformed documents raise `json.JSONDecodeError` with their position in the document.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_offset",
+        "_position",
+        "_item_start",
+        "_depth",
+        "_in_string",
+        "_started",
+        "_ended",
+        "_count",
+    )
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        # position of the buffer in the document
+        self._offset = 0
+        # scan position and first byte of the current item, in the buffer
+        self._position = 0
+        self._item_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._started = False
+        self._ended = False
+        self._count = 0
+
+    def feed(self, chunk: bytes) -> t.List[t.Any]:
+        buffer = self._buffer
+        buffer += chunk
+        items: t.List[t.Any] = []
+        position = self._position
+        size = len(buffer)
+
+        while position < size:
+            if not self._started or self._ended:
+                position = _WHITESPACE.match(buffer, position).end()
+                if position == size:
+                    break
+                if self._ended:
+                    self._error("Extra data", position)
+                if buffer[position] != _OPENING[0]:
+                    self._error("Expecting '['", position)
+                self._started = True
+                position = self._item_start = position + 1
+                continue
+
+            if self._in_string:
+                match = _STRING_TOKENS.search(buffer, position)
+                if match is None:
+                    position = size
+                elif buffer[match.start()] == _QUOTE:
+                    self._in_string = False
+                    position = match.end()
+                elif match.end() < size:
+                    # skips the escaped character
+                    position = match.end() + 1
+                else:
+                    # waits for the escaped character
+                    position = match.start()
+                    break
+                continue
+
+            match = _TOKENS.search(buffer, position)
+            if match is None:
+                position = size
+                continue
+
+            token, position = buffer[match.start()], match.end()
+            if token == _QUOTE:
+                self._in_string = True
+            elif token in _OPENING:
+                self._depth += 1
+            elif self._depth:
+                if token in _CLOSING:
+                    self._depth -= 1
+            elif token == _COMMA:
+                items.append(self._decode_item(match.start()))
+                self._item_start = position
+            elif token == _CLOSING[0]:
+                if self._count or buffer[self._item_start : match.start()].strip():
+                    items.append(self._decode_item(match.start()))
+                self._ended = True
+            else:
+                self._error("Expecting ',' delimiter", match.start())
+
+        # drops the bytes of the items already decoded
+        keep_from = position if not self._started or self._ended else self._item_start
+        del buffer[:keep_from]
+        self._offset += keep_from
+        self._item_start -= min(keep_from, self._item_start)
+        self._position = position - keep_from
+        return items
+
+    def close(self) -> None:
+        """Checks the whole document was received."""
+        if not self._ended:
+            self._error(
+                "Expecting ']'" if self._started else "Expecting value",
+                len(self._buffer),
+            )
+
+    def _decode_item(self, end: int) -> t.Any:
+        item = bytes(self._buffer[self._item_start : end])
+        if not item.strip():
+            self._error("Expecting value", end)
+        try:
+            value = decode_json(item)
+        except json.JSONDecodeError as e:
+            self._error(e.msg, self._item_start + e.pos)
+        self._count += 1
+        return value
+
+    def _error(self, msg: str, position: int) -> t.NoReturn:
+        raise json.JSONDecodeError(msg, "", self._offset + position)
+
+
+class JsonArrayStream(t.Generic[T]):
+    """
+    Validated items of a JSON array request body, parsed while the body is received.
+
+    Items are decoded by a `JsonArrayParser` and validated by batches of at most `batch_size` items,
+    so memory stays bounded whatever the number of items.
+    Malformed documents and invalid items raise `RequestValidationError` with the location of the item,
+    `loc=("body", index, ...)`. The body can only be iterated once.
+
+    Example:
+    >>> @post("/import")
+    >>> async def import_items(items: StreamBody[Item]):
+    >>>     async for batch in items.batches():
+    >>>         await save(batch)
+    """
+
+    __slots__ = ("_chunks", "_adapter", "batch_size", "_index")
+
+    def __init__(
+        self,
+        chunks: t.AsyncIterator[bytes],
+        adapter: TypeAdapter[t.List[T]],
+        batch_size: int,
+    ) -> None:
+        self._chunks = chunks
+        self._adapter = adapter
+        self.batch_size = batch_size
+        self._index = 0
+
+    async def batches(self) -> t.AsyncIterator[t.List[T]]:
+        parser = JsonArrayParser()
+        batch: t.List[t.Any] = []
+        try:
+            async for chunk in self._chunks:
+                for item in parser.feed(chunk):
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        yield self._validate(batch)
+                        batch = []
+            parser.close()
+        except json.JSONDecodeError as e:
+            raise RequestValidationError(
+                [
+                    {
+                        "type": "json_invalid",
+                        "loc": ("body", e.pos),
+                        "msg": "JSON decode error",
+                        "input": {},
+                        "ctx": {"error": e.msg},
+                    }
+                ]
+            ) from e
+        if batch:
+            yield self._validate(batch)
+
+    def __aiter__(self) -> t.AsyncIterator[T]:
+        return self._iter_items()
+
+    async def _iter_items(self) -> t.AsyncIterator[T]:
+        async for batch in self.batches():
+            for item in batch:
+                yield item
+
+    def _validate(self, batch: t.List[t.Any]) -> t.List[T]:
+        index, self._index = self._index, self._index + len(batch)
+        try:
+            return self._adapter.validate_python(batch, from_attributes=True)
+        except ValidationError as exc:
+            raise RequestValidationError(
+                [
+                    {**err, "loc": ("body", index + err["loc"][0], *err["loc"][1:])}  # type:ignore[operator]
+                    for err in exc.errors()
+                ]
+            ) from exc
@@ -4,6 +4,7 @@ from .response_types import (
     JSONResponse,
     ORJSONResponse,
     PlainTextResponse,
+    RawJSONResponse,
     RedirectResponse,
     Response,
     StreamingResponse,
@@ -14,6 +15,7 @@ __all__ = [
     "JSONResponse",
     "UJSONResponse",
     "ORJSONResponse",
+    "RawJSONResponse",
     "StreamingResponse",
     "HTMLResponse",
     "FileResponse",
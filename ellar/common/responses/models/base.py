@@ -1,19 +1,63 @@
 import dataclasses
+import functools
 import typing as t
+import weakref
 from abc import ABC, abstractmethod
 
 from ellar.common.constants import SERIALIZER_FILTER_KEY
 from ellar.common.exceptions import RequestValidationError
 from ellar.common.interfaces import IExecutionContext, IResponseModel
-from ellar.common.logging import request_logger
-from ellar.common.serializer import BaseSerializer, SerializerFilter, serialize_object
-from ellar.pydantic import ModelField, create_model_field
+from ellar.common.logging import request_tracer
+from ellar.common.serializer import (
+    BaseSerializer,
+    SerializerFilter,
+    default_serializer_filter,
+    serialize_object,
+)
+from ellar.pydantic import (
+    BaseModel,
+    ModelField,
+    create_model_field,
+    lenient_issubclass,
+)
+from ellar.pydantic.types import IncEx, NoneType, UnionType
 from ellar.reflect import reflect
 from starlette.responses import Response
 
 from .type_converter import ResponseTypeDefinitionConverter
 
 
+def _get_schema_include(
+    annotation: t.Any, seen: t.FrozenSet[t.Type] = frozenset()
+) -> t.Optional[IncEx]:
+    """
+    Returns the pydantic `include` option keeping only the keys the schema declares in mappings
+    serialized without validation. None keeps everything.
+    """
+    if lenient_issubclass(annotation, BaseModel):
+        if annotation in seen:
+            # recursive schemas are only filtered down to their first level
+            return None
+        include: t.Dict[t.Any, t.Any] = {}
+        for name, field in annotation.model_fields.items():
+            nested = _get_schema_include(field.annotation, seen | {annotation})
+            for key in {name, field.alias, field.serialization_alias} - {None}:
+                include[key] = True if nested is None else nested
+        return include
+
+    origin = t.get_origin(annotation)
+    args = [arg for arg in t.get_args(annotation) if arg is not NoneType]
+    if origin in (t.Union, UnionType):
+        # the schema of values of other unions is only known by validating them
+        return _get_schema_include(args[0], seen) if len(args) == 1 else None
+    if lenient_issubclass(origin, (t.Sequence, t.AbstractSet, t.Mapping)) and args:
+        if origin is tuple and not (len(args) == 2 and args[1] is Ellipsis):
+            return None
+        nested = _get_schema_include(args[-1] if origin is not tuple else args[0], seen)
+        return None if nested is None else {"__all__": nested}
+    return None
+
+
 @dataclasses.dataclass
 class ResponseModelField(ModelField):
     """
@@ -27,41 +71,127 @@ class ResponseModelField(ModelField):
     types for the of validation and OPENAPI documentation
     """
 
+    def __post_init__(self) -> None:
+        super().__post_init__()
+        annotation = self.field_info.annotation
+        # pydantic returns instances of a model schema as they are, unless configured to revalidate them
+        self._model_type: t.Optional[t.Type[BaseModel]] = None
+        if (
+            lenient_issubclass(annotation, BaseModel)
+            and annotation.model_config.get("revalidate_instances", "never") == "never"
+        ):
+            self._model_type = annotation  # type: ignore[assignment]
+        self._schema_include = _get_schema_include(annotation)
+
+    def is_model_instance(self, obj: t.Any) -> bool:
+        """Whether `obj` is an instance of the model schema, valid without validation"""
+        return self._model_type is not None and type(obj) is self._model_type
+
+    def prepare_object(self, obj: t.Any) -> t.Any:
+        """
+        Returns `obj` validated against the schema.
+        Instances of the model schema are returned as they are, without being validated again.
+        """
+        if self.is_model_instance(obj):
+            return obj
+
+        values, errors = self.validate_object(obj)
+
+        if errors:
+            raise RequestValidationError(errors)
+        return values
+
     def validate_object(self, obj: t.Any) -> t.Any:
-        request_logger.debug(
-            f"Validating Response Object - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Validating Response Object", self)
         values, error = self.validate(obj, {}, loc=(self.alias,))
         if error:
             _errors = list(error) if isinstance(error, list) else [error]
             return None, _errors
         return values, []
 
-    def prep_and_serialize(
-        self, obj: t.Any, serializer_filter: t.Optional[SerializerFilter] = None
-    ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
-        request_logger.debug(f"Serializing Response Data - '{self.__class__.__name__}'")
-        _serializer_filter = (
-            serializer_filter.dict()
+    @classmethod
+    def get_serializer_filter(
+        cls, obj: t.Any, serializer_filter: t.Optional[SerializerFilter] = None
+    ) -> t.Dict:
+        return (
+            serializer_filter.dump_kwargs
             if serializer_filter
-            else obj._filter.dict()
+            else obj._filter.dump_kwargs
             if isinstance(obj, BaseSerializer)
             else {}
         )
 
-        values, errors = self.validate_object(obj)
+    def get_unvalidated_filter(self, serializer_filter: t.Dict) -> t.Dict:
+        """
+        Returns the serialization options of objects serialized without validation.
+        Mapping keys the schema does not declare are left out, unless the filter has its own `include`.
+        """
+        dump_kwargs = {**serializer_filter, "warnings": False}
+        if dump_kwargs.get("include") is None:
+            dump_kwargs["include"] = self._schema_include
+        return dump_kwargs
 
-        if errors:
-            raise RequestValidationError(errors)
+    def prep_and_serialize(
+        self,
+        obj: t.Any,
+        serializer_filter: t.Optional[SerializerFilter] = None,
+        validate: bool = True,
+    ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
+        if request_tracer.enabled:
+            request_tracer.trace("Serializing Response Data", self)
+        _serializer_filter = self.get_serializer_filter(obj, serializer_filter)
+        if not validate and not self.is_model_instance(obj):
+            return self.serialize(
+                obj, **self.get_unvalidated_filter(_serializer_filter)
+            )
 
+        values = self.prepare_object(obj)
         return self.serialize(values, **_serializer_filter)
 
+    def prep_and_serialize_json(
+        self,
+        obj: t.Any,
+        serializer_filter: t.Optional[SerializerFilter] = None,
+        validate: bool = True,
+    ) -> bytes:
+        """
+        Validates `obj`, unless `validate` is False, and serializes it to JSON bytes
+        with a single pydantic `dump_json` call.
+        """
+        if request_tracer.enabled:
+            request_tracer.trace("Serializing Response Data to JSON", self)
+        _serializer_filter = self.get_serializer_filter(obj, serializer_filter)
+        if not validate and not self.is_model_instance(obj):
+            return self.serialize_json(
+                obj, **self.get_unvalidated_filter(_serializer_filter)
+            )
+
+        values = self.prepare_object(obj)
+        return self.serialize_json(values, **_serializer_filter)
+
+    def compile_json_serializer(
+        self, serializer_filter: t.Optional[SerializerFilter] = None
+    ) -> t.Callable[[t.Any], bytes]:
+        """
+        Returns pydantic `dump_json` of the schema, bound to the `serializer_filter` options,
+        serializing objects returned by `prepare_object` to JSON bytes.
+        """
+        return functools.partial(
+            self._type_adapter.dump_json,
+            **(serializer_filter or default_serializer_filter).dump_kwargs,
+        )
+
     def __hash__(self) -> int:
         # Each ModelField is unique for our purposes, to allow making a dict from
         # ModelField to its JSON Schema.
         return id(self)
 
 
+# serializer filters of the route handlers, resolved when their application is built
+_route_serializer_filters: "weakref.WeakKeyDictionary[t.Callable, t.Optional[SerializerFilter]]" = weakref.WeakKeyDictionary()
+
+
 class BaseResponseModel(IResponseModel, ABC):
     """
     A base model representation of endpoint response. It provides essential information about a response type, just as
@@ -154,15 +284,12 @@ class BaseResponseModel(IResponseModel, ABC):
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
         """Please override this function to create a custom response"""
-        request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Creating Response from returned Handler value", self)
         response_args, headers = self.get_context_response(
             context=context, status_code=status_code
         )
-        serializer_filter: t.Optional[SerializerFilter] = reflect.get_metadata(
-            SERIALIZER_FILTER_KEY, context.get_handler()
-        )
+        serializer_filter = self.get_route_serializer_filter(context)
 
         response = self._response_type(
             **response_args,
@@ -171,6 +298,34 @@ class BaseResponseModel(IResponseModel, ABC):
         )
         return response
 
+    @classmethod
+    def resolve_route_serializer_filter(
+        cls, handler: t.Callable
+    ) -> t.Optional[SerializerFilter]:
+        """
+        Reads the `serializer_filter` of a route handler, kept for the responses of the route.
+        Called for each route when the application is built.
+        """
+        serializer_filter: t.Optional[SerializerFilter] = reflect.get_metadata(
+            SERIALIZER_FILTER_KEY, handler
+        )
+        try:
+            _route_serializer_filters[handler] = serializer_filter
+        except TypeError:  # pragma: no cover
+            # handlers without weak reference support are looked up per response
+            pass
+        return serializer_filter
+
+    @classmethod
+    def get_route_serializer_filter(
+        cls, context: IExecutionContext
+    ) -> t.Optional[SerializerFilter]:
+        handler = context.get_handler()
+        try:
+            return _route_serializer_filters[handler]
+        except (KeyError, TypeError):
+            return cls.resolve_route_serializer_filter(handler)
+
     @classmethod
     def get_context_response(
         cls, context: IExecutionContext, **kwargs: t.Any
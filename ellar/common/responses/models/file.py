@@ -2,7 +2,7 @@ import typing as t
 from enum import Enum
 
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 from ellar.common.serializer import Serializer, SerializerFilter
 from ellar.pydantic import field_validator
 
@@ -49,9 +49,8 @@ class FileResponseModel(ResponseModel):
     def create_response(
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
-        request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Creating Response from returned Handler value", self)
         response_args, headers = self.get_context_response(
             context=context, status_code=status_code
         )
@@ -107,9 +106,8 @@ class StreamingResponseModel(ResponseModel):
     def create_response(
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
-        request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Creating Response from returned Handler value", self)
 
         response_args, headers = self.get_context_response(
             context=context, status_code=status_code
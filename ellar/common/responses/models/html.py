@@ -1,7 +1,7 @@
 import typing as t
 
 from ellar.common.interfaces import IExecutionContext, ITemplateRenderingService
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 from ellar.common.templating import TemplateResponse
 
 from ..response_types import Response
@@ -27,9 +27,8 @@ class HTMLResponseModel(ResponseModel):
     def create_response(
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
-        request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Creating Response from returned Handler value", self)
         template_name = self._get_template_name(ctx=context)
         rendering_service: ITemplateRenderingService = (
             context.get_service_provider().get(ITemplateRenderingService)
@@ -1,13 +1,15 @@
+import random
 import typing as t
 
-from ellar.common.constants import SERIALIZER_FILTER_KEY
+from ellar.common.constants import RESPONSE_VALIDATION_KEY
+from ellar.common.exceptions import RequestValidationError
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
-from ellar.common.serializer import SerializerFilter
+from ellar.common.logging import request_tracer
+from ellar.common.serializer import BaseSerializer, SerializerFilter
 from ellar.pydantic import as_pydantic_validator, create_model_field
 from ellar.reflect import reflect
 
-from ..response_types import JSONResponse, Response
+from ..response_types import JSONResponse, RawJSONResponse, Response
 from .base import ResponseModel, ResponseModelField
 
 
@@ -37,53 +39,187 @@ DictModelField: ResponseModelField = t.cast(
 
 
 class JSONResponseModel(ResponseModel):
+    """
+    Handles endpoint models with a schema, validating and serializing the returned object with it.
+
+    With a compiled serializer, see `compile_serializer`, the returned object is serialized to JSON bytes
+    by pydantic `dump_json`, bound to the serializer filter of the route, and sent by a `RawJSONResponse`,
+    instead of being dumped to python objects encoded by `DEFAULT_JSON_CLASS`.
+
+    Returned objects are validated according to the response validation policy, see `set_response_validation`,
+    set from the `response_validation` of the route, `RESPONSE_VALIDATION` config otherwise,
+    on the response models of each application.
+    Instances of the model schema are never validated again. Objects that are not validated are serialized
+    by the schema serializer, leaving out the mapping keys the schema does not declare.
+    """
+
     response_type: t.Type[Response] = JSONResponse
+    _json_serializer: t.Optional[t.Callable[[t.Any], bytes]] = None
+    _json_serializer_filter: t.Optional[SerializerFilter] = None
+    # response validation policy and sample rate
+    _response_validation: t.Tuple[str, float] = ("always", 0.1)
+
+    @property
+    def serializes_json(self) -> bool:
+        return self._json_serializer is not None
+
+    def compile_serializer(
+        self,
+        enabled: bool = True,
+        serializer_filter: t.Optional[SerializerFilter] = None,
+    ) -> bool:
+        """
+        Compiles, or drops when not `enabled`, the serializer of returned objects straight to JSON bytes,
+        with the `serializer_filter` of the route. Returns whether the serializer is compiled.
+        """
+        self._json_serializer = None
+        self._json_serializer_filter = serializer_filter
+        if enabled:
+            _response_model_field = self.get_model_field()
+            assert _response_model_field, "schema must exist for JSONResponseModel"
+            self._json_serializer = _response_model_field.compile_json_serializer(
+                serializer_filter
+            )
+        return self.serializes_json
 
     def create_response(
         self, context: IExecutionContext, response_obj: t.Any, status_code: int
     ) -> Response:
-        request_logger.debug(
-            f"Creating Response from returned Handler value - '{self.__class__.__name__}'"
+        if request_tracer.enabled:
+            request_tracer.trace("Creating Response from returned Handler value", self)
+        response_args, headers = self.get_context_response(
+            context=context, status_code=status_code
         )
+        serializer_filter = self.get_route_serializer_filter(context)
+        validate, sampled = self.get_response_validation(context)
+        try:
+            if self.serializes_json:
+                return RawJSONResponse(
+                    **response_args,
+                    content=self.serialize_json(
+                        response_obj,
+                        serializer_filter=serializer_filter,
+                        validate=validate,
+                    ),
+                    headers=headers,
+                )
+            content = self.serialize(
+                response_obj, serializer_filter=serializer_filter, validate=validate
+            )
+        except RequestValidationError as exc:
+            if sampled:
+                self.report_validation_failure(context, exc)
+            raise
+
         json_response_class = t.cast(
             t.Type[JSONResponse],
             context.get_app().config.DEFAULT_JSON_CLASS or self._response_type,
         )
-        response_args, headers = self.get_context_response(
-            context=context, status_code=status_code
-        )
-        serializer_filter = reflect.get_metadata(
-            SERIALIZER_FILTER_KEY, context.get_handler()
-        )
         response = json_response_class(
             **response_args,
-            content=self.serialize(response_obj, serializer_filter=serializer_filter),
+            content=content,
             headers=headers,
         )
         return response
 
+    @classmethod
+    def resolve_route_response_validation(
+        cls,
+        handler: t.Callable,
+        policy: str = "always",
+        sample_rate: float = 0.1,
+    ) -> t.Tuple[str, float]:
+        """
+        Reads the `response_validation` policy of a route handler, `policy` and `sample_rate` otherwise.
+        """
+        route_policy, route_sample_rate = reflect.get_metadata(
+            RESPONSE_VALIDATION_KEY, handler
+        ) or (policy, None)
+        return (
+            route_policy,
+            sample_rate if route_sample_rate is None else route_sample_rate,
+        )
+
+    def set_response_validation(self, policy: str, sample_rate: float) -> None:
+        self._response_validation = (policy, sample_rate)
+
+    def get_response_validation(
+        self, context: IExecutionContext
+    ) -> t.Tuple[bool, bool]:
+        """
+        Returns whether the returned object is validated, and whether it was sampled for validation.
+        """
+        policy, sample_rate = self._response_validation
+        if policy == "always":
+            return True, False
+        if policy == "never":
+            return False, False
+        sampled = random.random() < sample_rate
+        return sampled, sampled
+
+    @classmethod
+    def report_validation_failure(
+        cls, context: IExecutionContext, exc: RequestValidationError
+    ) -> None:
+        hook = context.get_app().config.RESPONSE_VALIDATION_FAILURE_HOOK
+        if hook is not None:
+            hook(context, exc.errors())
+
     def serialize(
         self,
         response_obj: t.Any,
         serializer_filter: t.Optional[SerializerFilter] = None,
+        validate: bool = True,
     ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
         _response_model_field = self.get_model_field()
         assert _response_model_field, "schema must exist for JSONResponseModel"
         return _response_model_field.prep_and_serialize(
-            response_obj, serializer_filter=serializer_filter
+            response_obj, serializer_filter=serializer_filter, validate=validate
+        )
+
+    def serialize_json(
+        self,
+        response_obj: t.Any,
+        serializer_filter: t.Optional[SerializerFilter] = None,
+        validate: bool = True,
+    ) -> bytes:
+        _response_model_field = self.get_model_field()
+        assert _response_model_field, "schema must exist for JSONResponseModel"
+        json_serializer = self._json_serializer
+        if (
+            json_serializer is not None
+            and serializer_filter is self._json_serializer_filter
+            and (validate or _response_model_field.is_model_instance(response_obj))
+            # without route filter, serializers are dumped with their own filter
+            and (serializer_filter or not isinstance(response_obj, BaseSerializer))
+        ):
+            if request_tracer.enabled:
+                request_tracer.trace("Serializing Response Data to JSON", self)
+            return json_serializer(_response_model_field.prepare_object(response_obj))
+        return _response_model_field.prep_and_serialize_json(
+            response_obj, serializer_filter=serializer_filter, validate=validate
         )
 
 
 class EmptyAPIResponseModel(JSONResponseModel):
     model_field_or_schema = DictModelField
 
+    def compile_serializer(
+        self,
+        enabled: bool = True,
+        serializer_filter: t.Optional[SerializerFilter] = None,
+    ) -> bool:
+        # objects without schema are serialized by `serialize_object` when pydantic can not
+        return super().compile_serializer(False)
+
     def serialize(
         self,
         response_obj: t.Any,
         serializer_filter: t.Optional[SerializerFilter] = None,
+        validate: bool = True,
     ) -> t.Union[t.List[t.Dict], t.Dict, t.Any]:
         try:
-            return super().serialize(response_obj, serializer_filter)
+            return super().serialize(response_obj, serializer_filter, validate)
         except Exception:
             return self._serialize_with_serializer_object(
                 response_obj, serializer_filter
@@ -1,8 +1,10 @@
+import copy
 import typing as t
 
 from ellar.common.constants import SCOPE_RESPONSE_STARTED
 from ellar.common.interfaces import IExecutionContext, IResponseModel
-from ellar.common.logging import logger, request_logger
+from ellar.common.logging import logger, request_tracer
+from ellar.common.serializer import SerializerFilter
 from ellar.pydantic import BaseModel
 
 from ..response_types import Response
@@ -55,14 +57,44 @@ class RouteResponseModel:
                 description=description,
             )
 
+    def configure(
+        self,
+        compile_serializers: bool = True,
+        serializer_filter: t.Optional[SerializerFilter] = None,
+        response_validation: t.Tuple[str, float] = ("always", 0.1),
+    ) -> "RouteResponseModel":
+        """
+        Returns a copy of the route response models where the JSON response models compile,
+        or not, their serializer with the `serializer_filter` of the route, and validate
+        returned objects with the `response_validation` policy and sample rate.
+        """
+        route_response_model = copy.copy(self)
+        route_response_model.models = {}
+        for status_code, response_model in self.models.items():
+            if isinstance(response_model, JSONResponseModel):
+                response_model = copy.copy(response_model)
+                response_model.compile_serializer(
+                    compile_serializers, serializer_filter
+                )
+                response_model.set_response_validation(*response_validation)
+            route_response_model.models[status_code] = response_model
+        return route_response_model
+
+    @property
+    def serializes_json(self) -> bool:
+        return any(
+            isinstance(response_model, JSONResponseModel)
+            and response_model.serializes_json
+            for response_model in self.models.values()
+        )
+
     def response_resolver(
         self,
         ctx: IExecutionContext,
         endpoint_response_content: t.Union[t.Any, t.Tuple[int, t.Any]],
     ) -> ResponseResolver:
-        request_logger.debug(
-            f"Resolving Response Structure - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Response Structure", self)
         status_code: int = 200
         response_obj: t.Any = endpoint_response_content
 
@@ -94,18 +126,18 @@ class RouteResponseModel:
     def process_response(
         self, ctx: IExecutionContext, response_obj: t.Union[t.Any, t.Tuple[int, t.Any]]
     ) -> t.Optional[Response]:
-        request_logger.debug(
-            f"Response Processor Handler - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Response Processor Handler", self)
         if isinstance(response_obj, Response):
             return response_obj
         scope, _, _ = ctx.get_args()
 
         if scope.get(SCOPE_RESPONSE_STARTED) is True:  # pragma: no cover
             # Similar condition exists in EllarConsumer Manager
-            request_logger.debug(
-                f"Stopped Processing Since `response.send` has been called - '{self.__class__.__name__}'"
-            )
+            if request_tracer.enabled:
+                request_tracer.trace(
+                    "Stopped Processing Since `response.send` has been called", self
+                )
             return None
 
         resolver = self.response_resolver(ctx, response_obj)
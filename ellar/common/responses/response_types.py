@@ -34,6 +34,13 @@ except ImportError:  # pragma: no cover
     orjson = None  # type: ignore
 
 
+class RawJSONResponse(JSONResponse):
+    """JSON response of content already encoded to JSON bytes"""
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
 class UJSONResponse(JSONResponse):
     def render(self, content: Any) -> bytes:
         assert ujson is not None, "ujson must be installed to use UJSONResponse"
@@ -1,10 +1,12 @@
 from .base import (
     BaseSerializer,
+    ObjectSerializer,
     Serializer,
     SerializerBase,
     SerializerConfig,
     SerializerFilter,
     default_serializer_filter,
+    get_object_serializer,
     serialize_object,
 )
 
@@ -15,5 +17,7 @@ __all__ = [
     "SerializerBase",
     "BaseSerializer",
     "serialize_object",
+    "ObjectSerializer",
+    "get_object_serializer",
     "default_serializer_filter",
 ]
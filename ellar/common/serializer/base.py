@@ -1,5 +1,7 @@
 import dataclasses
+import functools
 import typing as t
+from contextvars import ContextVar
 from dataclasses import asdict, is_dataclass
 from enum import Enum
 from pathlib import PurePath
@@ -8,10 +10,9 @@ from types import GeneratorType
 from ellar.pydantic import (
     BaseConfig,
     BaseModel,
-    TypeAdapter,
     model_dump,
 )
-from ellar.utils.functional import LazyStrImport
+from ellar.utils.importer import import_from_string
 
 __pydantic_model__ = "__pydantic_core_schema__"
 __pydantic_config__ = "__pydantic_config__"
@@ -45,8 +46,15 @@ class SerializerConfig(BaseConfig):
     from_attributes = True
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class SerializerFilter:
+    """
+    Pydantic `model_dump` options of a serializer or route.
+
+    Filters are immutable, and their `model_dump` keyword arguments, `dump_kwargs`, are computed once
+    and shared by every serialization. `dump_kwargs` must not be modified, `dict()` returns a copy.
+    """
+
     include: t.Optional[
         t.Union[t.Set[t.Union[int, str]], t.Mapping[t.Union[int, str], t.Any]]
     ] = None
@@ -57,15 +65,20 @@ class SerializerFilter:
     exclude_unset: bool = False
     exclude_defaults: bool = False
     exclude_none: bool = False
+    dump_kwargs: t.Dict[str, t.Any] = dataclasses.field(
+        init=False, repr=False, compare=False
+    )
 
     def __post_init__(self) -> None:
-        self._type_adapter: TypeAdapter[t.Any] = TypeAdapter(self.__class__)
+        dump_kwargs = {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.init
+        }
+        object.__setattr__(self, "dump_kwargs", dump_kwargs)
 
     def dict(self) -> t.Dict:
-        return self._type_adapter.dump_python(  # type:ignore[no-any-return]
-            self,
-            mode="json",
-        )
+        return dict(self.dump_kwargs)
 
 
 default_serializer_filter = SerializerFilter()
@@ -75,9 +88,9 @@ class BaseSerializer:
     _filter: SerializerFilter
 
     def _get_filter(self, **kwargs: t.Any) -> t.Dict:
-        _filter = self._filter.dict()
-        _filter.update(kwargs)
-        return _filter
+        if not kwargs:
+            return self._filter.dump_kwargs
+        return {**self._filter.dump_kwargs, **kwargs}
 
     def __init_subclass__(cls, **kwargs: t.Any) -> None:
         if __skip_filter__ in kwargs:
@@ -97,13 +110,13 @@ class SerializerBase(BaseSerializer, __skip_filter__=True):
         self, serializer_filter: t.Optional[SerializerFilter] = None
     ) -> t.Dict:
         _filter = serializer_filter or self._filter
-        return self.model_dump(**_filter.dict())
+        return self.model_dump(**_filter.dump_kwargs)
 
     def serialize_json(
         self, serializer_filter: t.Optional[SerializerFilter] = None
     ) -> str:
         _filter = serializer_filter or self._filter
-        return self.model_dump_json(**_filter.dict())
+        return self.model_dump_json(**_filter.dump_kwargs)
 
     def dict(self, **kwargs: t.Any) -> t.Dict:
         return self.model_dump(**kwargs)
@@ -121,61 +134,239 @@ class Serializer(SerializerBase, BaseModel, __skip_filter__=True):
     model_config = {"from_attributes": True}
 
 
+@functools.lru_cache(maxsize=1)
 def _lazy_current_config() -> t.Any:
-    return LazyStrImport("ellar.core:current_config")
+    return import_from_string("ellar.core:current_config")
 
 
-def serialize_object(
-    obj: t.Any,
-    encoders: t.Optional[t.Dict[t.Any, t.Callable[[t.Any], t.Any]]] = None,
-    serializer_filter: t.Optional[SerializerFilter] = None,
+# how a type is serialized, from its entry in `ObjectSerializer` dispatch table
+_VALUE, _MAPPING, _SEQUENCE, _CONVERT = range(4)
+# entry of the types returned as they are
+_IDENTITY: t.Tuple[int, t.Any] = (_VALUE, None)
+_SEQUENCE_TYPES = (list, set, frozenset, GeneratorType, tuple)
+
+
+def _get_enum_value(obj: Enum) -> t.Any:
+    return obj.value
+
+
+def _serialize_serializer(
+    obj: BaseSerializer, serializer_filter: t.Optional[SerializerFilter]
+) -> t.Any:
+    return obj.serialize(serializer_filter)
+
+
+def _dump_model(
+    obj: BaseModel, serializer_filter: t.Optional[SerializerFilter]
 ) -> t.Any:
-    _encoders = (
-        encoders if encoders else _lazy_current_config().SERIALIZER_CUSTOM_ENCODER
+    return model_dump(
+        obj,
+        mode="json",
+        **(serializer_filter or default_serializer_filter).dump_kwargs,
     )
-    if isinstance(obj, (BaseModel, BaseSerializer)):
-        if isinstance(obj, BaseSerializer):
-            obj_dict = obj.serialize(serializer_filter)
-        else:
-            obj_dict = model_dump(
-                obj,
-                mode="json",
-                **(serializer_filter or default_serializer_filter).dict(),
-            )
-
-        return serialize_object(obj_dict, _encoders)
-    if is_dataclass(obj):
-        return serialize_object(
-            asdict(obj),
-            encoders=_encoders,
-            serializer_filter=serializer_filter,
-        )
-    if isinstance(obj, dict):
-        return {
-            str(k): serialize_object(v, _encoders, serializer_filter)
-            for k, v in obj.items()
-        }
-    if isinstance(obj, Enum):
-        return obj.value
-    if isinstance(obj, PurePath):
-        return str(obj)
-    if isinstance(obj, (str, int, float, type(None))):
-        return obj
-    if isinstance(obj, (list, set, frozenset, GeneratorType, tuple)):
-        return [serialize_object(item, _encoders, serializer_filter) for item in obj]
-
-    encoder = _encoders.get(type(obj))
-    if encoder:
-        return encoder(obj)
 
+
+def _dump_dataclass(
+    obj: t.Any, serializer_filter: t.Optional[SerializerFilter]
+) -> t.Any:
+    return asdict(obj)
+
+
+def _get_data(obj: t.Any, serializer_filter: t.Optional[SerializerFilter]) -> t.Any:
     errors = []
     try:
-        data = dict(obj)
+        return dict(obj)
     except Exception as e1:
         errors.append(e1)
         try:
-            data = vars(obj)
+            return vars(obj)
         except Exception as e2:
             errors.append(e2)
             raise ValueError(errors) from e2
-    return serialize_object(data, _encoders, serializer_filter)
+
+
+def _get_vars(obj: t.Any, serializer_filter: t.Optional[SerializerFilter]) -> t.Any:
+    try:
+        return vars(obj)
+    except Exception:
+        return _get_data(obj, serializer_filter)
+
+
+class ObjectSerializer:
+    """
+    Converts objects to JSON compatible values, as `serialize_object` does.
+
+    How an object is converted is looked up once for its type and kept in a dispatch table,
+    including whether `dict(obj)` or `vars(obj)` gives the data of the types without encoder.
+    Nested values are walked without recursion, so deep structures do not reach the recursion limit,
+    up to `max_depth` levels to stop on circular references.
+    The dispatch table keeps up to `max_types` types, the types seen after are looked up on each use.
+
+    :param encoders: Encoders of the types without builtin conversion, by exact type.
+    """
+
+    __slots__ = ("encoders", "max_depth", "max_types", "_dispatch")
+
+    def __init__(
+        self,
+        encoders: t.Mapping[t.Any, t.Callable[[t.Any], t.Any]],
+        max_depth: int = 10000,
+        max_types: int = 1024,
+    ) -> None:
+        self.encoders = dict(encoders)
+        self.max_depth = max_depth
+        self.max_types = max_types
+        self._dispatch: t.Dict[t.Type, t.Tuple[int, t.Any]] = dict.fromkeys(
+            (str, int, float, bool, type(None)), _IDENTITY
+        )
+
+    def _get_entry(self, type_: t.Type) -> t.Tuple[int, t.Any]:
+        entry = self._dispatch.get(type_)
+        if entry is None:
+            entry = self._create_entry(type_)
+            self._set_entry(type_, entry)
+        return entry
+
+    def _set_entry(self, type_: t.Type, entry: t.Tuple[int, t.Any]) -> None:
+        if type_ in self._dispatch or len(self._dispatch) < self.max_types:
+            self._dispatch[type_] = entry
+
+    def _create_entry(self, type_: t.Type) -> t.Tuple[int, t.Any]:
+        if issubclass(type_, BaseSerializer):
+            return _CONVERT, _serialize_serializer
+        if issubclass(type_, BaseModel):
+            return _CONVERT, _dump_model
+        if is_dataclass(type_):
+            return _CONVERT, _dump_dataclass
+        if issubclass(type_, dict):
+            return _MAPPING, None
+        if issubclass(type_, Enum):
+            return _VALUE, _get_enum_value
+        if issubclass(type_, PurePath):
+            return _VALUE, str
+        if issubclass(type_, (str, int, float)):
+            return _IDENTITY
+        if issubclass(type_, _SEQUENCE_TYPES):
+            return _SEQUENCE, None
+
+        encoder = self.encoders.get(type_)
+        if encoder:
+            return _VALUE, encoder
+        return _CONVERT, self._learn_data
+
+    def _learn_data(
+        self, obj: t.Any, serializer_filter: t.Optional[SerializerFilter]
+    ) -> t.Any:
+        # learns whether `dict(obj)` or `vars(obj)` gives the data of the objects of this type
+        try:
+            data = dict(obj)
+            self._set_entry(type(obj), (_CONVERT, _get_data))
+        except Exception:
+            data = _get_data(obj, serializer_filter)
+            self._set_entry(type(obj), (_CONVERT, _get_vars))
+        return data
+
+    def serialize(
+        self, obj: t.Any, serializer_filter: t.Optional[SerializerFilter] = None
+    ) -> t.Any:
+        dispatch = self._dispatch
+        root: t.List[t.Any] = [None]
+        # values to convert, with the container and key of their result
+        stack: t.List[t.Tuple[t.Any, t.Any, t.Any, int]] = [(root, 0, obj, 0)]
+
+        while stack:
+            target, key, value, depth = stack.pop()
+            kind, func = dispatch.get(type(value)) or self._get_entry(type(value))
+
+            if kind == _VALUE:
+                target[key] = value if func is None else func(value)
+                continue
+            if kind == _CONVERT:
+                stack.append((target, key, func(value, serializer_filter), depth))
+                continue
+
+            depth += 1
+            if depth > self.max_depth:
+                raise ValueError(
+                    f"Object exceeds the maximum depth of {self.max_depth}, "
+                    "it may contain a circular reference."
+                )
+
+            pending: t.List[t.Tuple[t.Any, t.Any, t.Any, int]] = []
+            result: t.Any
+            if kind == _MAPPING:
+                result = {}
+                for k, item in value.items():
+                    k = str(k)
+                    entry = dispatch.get(type(item))
+                    if entry is _IDENTITY:
+                        result[k] = item
+                    elif entry is not None and entry[0] == _VALUE:
+                        result[k] = entry[1](item)
+                    else:
+                        # keeps the position of the key until its value is converted
+                        result[k] = None
+                        pending.append((result, k, item, depth))
+                if len(result) != len(value):
+                    # keys converted to the same string, the last value is kept
+                    result = {}
+                    pending = [
+                        (result, str(k), item, depth) for k, item in value.items()
+                    ]
+            else:
+                result = list(value)
+                for index, item in enumerate(result):
+                    entry = dispatch.get(type(item))
+                    if entry is _IDENTITY:
+                        continue
+                    if entry is not None and entry[0] == _VALUE:
+                        result[index] = entry[1](item)
+                    else:
+                        pending.append((result, index, item, depth))
+
+            target[key] = result
+            pending.reverse()
+            stack.extend(pending)
+
+        return root[0]
+
+
+# serializer of the application in context, see `App.object_serializer`
+_object_serializer_context_var: ContextVar[t.Optional[ObjectSerializer]] = ContextVar(
+    "ellar.common.serializer.ObjectSerializer", default=None
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_object_serializer(
+    encoders: t.Tuple[t.Tuple[t.Any, t.Callable[[t.Any], t.Any]], ...],
+) -> ObjectSerializer:
+    return ObjectSerializer(dict(encoders))
+
+
+def get_object_serializer(
+    encoders: t.Mapping[t.Any, t.Callable[[t.Any], t.Any]],
+) -> ObjectSerializer:
+    """
+    Returns the `ObjectSerializer` of `encoders`, shared by the calls with the same encoders
+    so the types are looked up once. Used for the calls outside an application context.
+    """
+    try:
+        return _get_object_serializer(tuple(encoders.items()))
+    except TypeError:  # pragma: no cover
+        # unhashable encoders
+        return ObjectSerializer(encoders)
+
+
+def serialize_object(
+    obj: t.Any,
+    encoders: t.Optional[t.Dict[t.Any, t.Callable[[t.Any], t.Any]]] = None,
+    serializer_filter: t.Optional[SerializerFilter] = None,
+) -> t.Any:
+    if encoders:
+        serializer = get_object_serializer(encoders)
+    else:
+        serializer = _object_serializer_context_var.get() or get_object_serializer(
+            _lazy_current_config().SERIALIZER_CUSTOM_ENCODER
+        )
+    return serializer.serialize(obj, serializer_filter)
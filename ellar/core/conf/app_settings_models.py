@@ -15,7 +15,7 @@ from ellar.core.conf.mixins import ConfigDefaultTypesMixin
 from ellar.di import ProviderConfig
 from ellar.di.injector.tree_manager import ModuleTreeManager
 from ellar.pydantic import ENCODERS_BY_TYPE as encoders_by_type
-from ellar.pydantic import AllowTypeOfSource, field_validator
+from ellar.pydantic import AllowTypeOfSource, Field, field_validator
 from jinja2 import BaseLoader
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware import Middleware
@@ -159,6 +159,34 @@ class ConfigSchema(Serializer, ConfigDefaultTypesMixin):
 
     REDIRECT_SLASHES: bool = False
 
+    FLATTEN_ROUTES: bool = False
+
+    ROUTE_MATCH_CACHE_SIZE: int = 0
+
+    ROUTE_MATCHER: t.Literal["trie", "regex"] = "trie"
+
+    CONCURRENT_PARAMETER_RESOLUTION: bool = False
+
+    COMPILE_ROUTE_PARAMETERS: bool = False
+
+    SINGLE_PASS_PARAMETER_VALIDATION: bool = False
+
+    CAPTURE_PARAMETERS_RAW_DATA: bool = True
+
+    VALIDATE_JSON_BODY: bool = False
+
+    MAX_REQUEST_BODY_SIZE: t.Optional[int] = None
+
+    COMPILE_RESPONSE_SERIALIZERS: bool = False
+
+    RESPONSE_VALIDATION: t.Literal["always", "never", "sample"] = "always"
+
+    RESPONSE_VALIDATION_SAMPLE_RATE: float = Field(0.1, ge=0, le=1)
+
+    RESPONSE_VALIDATION_FAILURE_HOOK: t.Optional[
+        t.Callable[[t.Any, t.List[t.Dict[str, t.Any]]], t.Any]
+    ] = None
+
     STATIC_FOLDER_PACKAGES: t.Optional[t.List[t.Union[str, t.Tuple[str, str]]]] = []
 
     STATIC_DIRECTORIES: t.Optional[t.List[t.Union[str, t.Any]]] = []
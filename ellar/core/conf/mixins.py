@@ -49,6 +49,48 @@ class ConfigDefaultTypesMixin:
     # Enable or Disable Application Router route searching by appending backslash
     REDIRECT_SLASHES: bool
 
+    # Register Controller and ModuleRouter operations under their full path for request dispatch,
+    # instead of matching their mount first and then scanning the mount routes
+    FLATTEN_ROUTES: bool
+
+    # Size of the Application Router LRU cache of matched routes. `0` disables the cache
+    ROUTE_MATCH_CACHE_SIZE: int
+
+    # Strategy used to find the routes that may match a request path. `trie` or `regex`
+    ROUTE_MATCHER: t.Literal["trie", "regex"]
+
+    # Resolve route parameters waiting on I/O, like custom system parameters, concurrently
+    CONCURRENT_PARAMETER_RESOLUTION: bool
+
+    # Resolve route operations arguments with a function generated for each endpoint
+    COMPILE_ROUTE_PARAMETERS: bool
+
+    # Validate query, header, path and cookie parameters of a route with a single pydantic call
+    SINGLE_PASS_PARAMETER_VALIDATION: bool
+
+    # Record the raw values of route parameters while resolving them
+    CAPTURE_PARAMETERS_RAW_DATA: bool
+
+    # Validate JSON request bodies of single model body parameters straight from the request bytes
+    VALIDATE_JSON_BODY: bool
+
+    # Maximum size in bytes of request bodies, rejected with a 413 response when exceeded
+    MAX_REQUEST_BODY_SIZE: t.Optional[int]
+
+    # Serialize route responses with a schema straight to JSON bytes
+    COMPILE_RESPONSE_SERIALIZERS: bool
+
+    # Validation of the objects returned by routes with a response schema: "always", "never" or "sample"
+    RESPONSE_VALIDATION: t.Literal["always", "never", "sample"]
+
+    # Fraction of the responses validated with the "sample" response validation
+    RESPONSE_VALIDATION_SAMPLE_RATE: float
+
+    # Called with the execution context and the errors of the sampled responses failing validation
+    RESPONSE_VALIDATION_FAILURE_HOOK: t.Optional[
+        t.Callable[[t.Any, t.List[t.Dict[str, t.Any]]], t.Any]
+    ]
+
     # Define references to static folders in python packages.
     # eg STATIC_FOLDER_PACKAGES = [('boostrap4', 'statics')]
     STATIC_FOLDER_PACKAGES: t.Optional[t.List[t.Union[str, t.Tuple[str, str]]]]
@@ -5,6 +5,8 @@ from contextvars import ContextVar
 
 from ellar.common.constants import ELLAR_CONFIG_MODULE
 from ellar.common.logging import logger
+from ellar.common.serializer import ObjectSerializer
+from ellar.common.serializer.base import _object_serializer_context_var
 from ellar.core.conf import Config
 from ellar.di import EllarInjector
 from ellar.utils.functional import SimpleLazyObject, empty
@@ -51,11 +53,14 @@ def _clear_lazy_objects() -> None:
 @asynccontextmanager
 async def injector_context(
     injector: EllarInjector,
+    object_serializer: t.Optional[ObjectSerializer] = None,
 ) -> t.AsyncGenerator[EllarInjector, t.Any]:
     _clear_lazy_objects()
     _injector_reset_token = _injector_context_var.set(injector)
+    _serializer_reset_token = _object_serializer_context_var.set(object_serializer)
 
     yield injector
 
+    _object_serializer_context_var.reset(_serializer_reset_token)
     _injector_context_var.reset(_injector_reset_token)
     _clear_lazy_objects()
@@ -15,11 +15,15 @@ class GuardConsumer(IGuardsConsumer):
     async def execute(
         self, context: IExecutionContext, route_operation: "RouteOperationBase"
     ) -> None:
-        await self.run_route_guards(context)
+        await self.run_route_guards(context, route_operation)
 
     @t.no_type_check
-    async def run_route_guards(self, context: IExecutionContext) -> None:
-        for guard in self._get_guards(context):
+    async def run_route_guards(
+        self,
+        context: IExecutionContext,
+        route_operation: t.Optional["RouteOperationBase"] = None,
+    ) -> None:
+        for guard in self._get_guards(context, route_operation):
             await self.run_guard(context, guard)
 
     async def run_guard(
@@ -29,17 +33,24 @@ class GuardConsumer(IGuardsConsumer):
         if not result:
             guard_instance.raise_exception()
 
-    def _get_guards(self, context: IExecutionContext) -> t.Iterable["GuardCanActivate"]:
+    def _get_guards(
+        self,
+        context: IExecutionContext,
+        route_operation: t.Optional["RouteOperationBase"] = None,
+    ) -> t.Iterable["GuardCanActivate"]:
         app = context.get_app()
-        reflector = app.reflector
-
-        targets = [context.get_handler(), context.get_class()]
 
-        return map(
-            functools.partial(self.get_guard_instance, context),
-            reflector.get_all_and_override(GUARDS_KEY, *targets)
-            or context.get_app().get_guards(),
-        )
+        if hasattr(route_operation, "get_execution_plan"):
+            guards = route_operation.get_execution_plan(app).get_guards()
+        else:
+            # e.g. socket.io gateways
+            targets = [context.get_handler(), context.get_class()]
+            guards = (
+                app.reflector.get_all_and_override(GUARDS_KEY, *targets)
+                or app.get_guards()
+            )
+
+        return map(functools.partial(self.get_guard_instance, context), guards)
 
     def get_guard_instance(
         self,
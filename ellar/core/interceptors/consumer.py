@@ -3,7 +3,7 @@ import typing as t
 
 from ellar.common import EllarInterceptor, IExecutionContext, IInterceptorsConsumer
 from ellar.common.constants import ROUTE_INTERCEPTORS, SCOPE_RESPONSE_STARTED
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 from ellar.di import injectable
 
 if t.TYPE_CHECKING:  # pragma: no cover
@@ -23,17 +23,27 @@ class EllarInterceptorConsumer(IInterceptorsConsumer):
             )
         return interceptor
 
+    def _get_interceptors(
+        self, context: IExecutionContext, route_operation: "RouteOperationBase"
+    ) -> t.Sequence[t.Union[t.Type[EllarInterceptor], EllarInterceptor]]:
+        app = context.get_app()
+        if hasattr(route_operation, "get_execution_plan"):
+            return route_operation.get_execution_plan(app).get_interceptors()
+
+        return (
+            app.reflector.get_all_and_override(
+                ROUTE_INTERCEPTORS, *[context.get_handler(), context.get_class()]
+            )
+            or app.get_interceptors()
+        )
+
     async def execute(
         self, context: IExecutionContext, route_operation: "RouteOperationBase"
     ) -> t.Any:
-        reflector = context.get_app().reflector
         route_interceptors: t.List[EllarInterceptor] = list(
             map(
                 functools.partial(self.get_interceptor, context),
-                reflector.get_all_and_override(
-                    ROUTE_INTERCEPTORS, *[context.get_handler(), context.get_class()]
-                )
-                or context.get_app().get_interceptors(),
+                self._get_interceptors(context, route_operation),
             )
         )
         route_interceptors_length = len(route_interceptors or [])
@@ -52,8 +62,9 @@ class EllarInterceptorConsumer(IInterceptorsConsumer):
             res = await route_operation.handle_request(context=context)
 
         if context.get_args()[0][SCOPE_RESPONSE_STARTED]:
-            request_logger.debug(
-                f"Stopped Processing Since `response.send` has been called - '{self.__class__.__name__}'"
-            )
+            if request_tracer.enabled:
+                request_tracer.trace(
+                    "Stopped Processing Since `response.send` has been called", self
+                )
             return
         await route_operation.handle_response(context, res)
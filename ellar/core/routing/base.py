@@ -3,21 +3,21 @@ from abc import ABC, abstractmethod
 from functools import cached_property
 
 from ellar.common import constants
-from ellar.common.interfaces import (
-    IExecutionContext,
-    IExecutionContextFactory,
-    IGuardsConsumer,
-    IInterceptorsConsumer,
-)
-from ellar.common.logging import request_logger
+from ellar.common.interfaces import IExecutionContext
+from ellar.common.logging import request_tracer
 from ellar.common.types import TReceive, TScope, TSend
 from ellar.core.execution_context import current_injector
 from ellar.di import register_request_scope_context
 from ellar.reflect import reflect
 from starlette.routing import Match
 
+from .body_limit import limit_request_body
+from .execution_plan import RouteCompileOptions, RouteExecutionPlan
+
 if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.app import App
     from ellar.core.versioning.resolver import BaseAPIVersioningResolver
+    from ellar.di import EllarInjector
 
 __all__ = [
     "RouteOperationBase",
@@ -27,6 +27,7 @@ __all__ = [
 
 class RouteOperationBase:
     methods: t.Set[str]
+    _execution_plan: t.Optional[RouteExecutionPlan] = None
 
     def __init__(self, endpoint: t.Callable) -> None:
         self.endpoint = endpoint
@@ -43,25 +44,63 @@ class RouteOperationBase:
         """compute route models"""
 
     async def app(self, scope: TScope, receive: TReceive, send: TSend) -> None:
-        request_logger.debug(
-            f"Started Computing Execution Context - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Started Computing Execution Context", self)
+        plan = self.get_execution_plan(scope["app"])
+        if plan.max_body_size is not None and scope["type"] == "http":
+            receive = limit_request_body(scope, receive, plan.max_body_size)
 
-        execution_context_factory = current_injector.get(IExecutionContextFactory)
-        context = execution_context_factory.create_context(
+        context = plan.get_execution_context_factory().create_context(
             operation=self, scope=scope, receive=receive, send=send
         )
         register_request_scope_context(IExecutionContext, context)
 
-        interceptor_consumer = current_injector.get(IInterceptorsConsumer)
-        guard_consumer = current_injector.get(IGuardsConsumer)
+        if plan.fast_path:
+            if request_tracer.enabled:
+                request_tracer.trace("No Guards and Interceptors to run", self)
+            response_obj = await self.handle_request(context=context)
+            if scope[constants.SCOPE_RESPONSE_STARTED]:
+                return
+            await self.handle_response(context, response_obj)
+            return
 
-        request_logger.debug(
-            f"Running Guards and Interceptors - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Running Guards and Interceptors", self)
+
+        await plan.get_guards_consumer().execute(context, self)
+        await plan.get_interceptors_consumer().execute(context, self)
+
+    def get_execution_plan(self, app: "App") -> RouteExecutionPlan:
+        """
+        Returns the guards and interceptors execution plan of this operation for `app`.
+        The plan is built on first use when it was not built with the application.
+        """
+        plan = self._execution_plan
+        if plan is None or plan.app is not app:
+            plan = self.build_execution_plan(app, current_injector)
+        return plan
+
+    def build_execution_plan(
+        self, app: "App", injector: "EllarInjector"
+    ) -> RouteExecutionPlan:
+        """
+        Compiles the guards and interceptors execution plan of this operation.
+        `injector` must be the injector of the module the operation belongs to.
+        """
+        self._execution_plan = RouteExecutionPlan(self, app, injector)
+        return self._execution_plan
+
+    def get_endpoint_args_model(self, options: RouteCompileOptions) -> t.Any:
+        """
+        Returns the endpoint arguments model of this operation for an application built with `options`.
+        """
+        return getattr(self, "endpoint_parameter_model", None)
 
-        await guard_consumer.execute(context, self)
-        await interceptor_consumer.execute(context, self)
+    def get_response_model(self, options: RouteCompileOptions) -> t.Any:
+        """
+        Returns the response model of this operation for an application built with `options`.
+        """
+        return getattr(self, "response_model", None)
 
     def get_controller_type(self) -> t.Any:
         """
@@ -86,9 +125,8 @@ class RouteOperationBase:
 
     @cached_property
     def allowed_version(self) -> t.Set[t.Union[int, float, str]]:
-        request_logger.debug(
-            f"Resolving Endpoint Versions - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Endpoint Versions", self)
         versions = (
             reflect.get_metadata(constants.VERSIONING_KEY, self.endpoint) or set()
         )
@@ -112,25 +150,27 @@ class RouteOperationBase:
         return _methods
 
     def matches(self, scope: TScope) -> t.Tuple[Match, TScope]:
-        request_logger.debug(
-            f"Matching Endpoint URL, path={scope['path']}- '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Matching Endpoint URL", self, path=scope["path"])
 
         match = super().matches(scope)  # type: ignore
-        if match[0] is Match.FULL:
-            version_scheme_resolver: "BaseAPIVersioningResolver" = t.cast(
-                "BaseAPIVersioningResolver",
-                scope.get(constants.SCOPE_API_VERSIONING_RESOLVER),
-            )
-            if not version_scheme_resolver.can_activate(
-                route_versions=self.allowed_version
-            ):
-                request_logger.debug(
-                    f"URL Matched with invalid Version - '{self.__class__.__name__}'"
-                )
-                return Match.NONE, {}
+        if match[0] is Match.FULL and not self.can_activate_version(scope):
+            return Match.NONE, {}
         return match  # type: ignore
 
+    def can_activate_version(self, scope: TScope) -> bool:
+        version_scheme_resolver: "BaseAPIVersioningResolver" = t.cast(
+            "BaseAPIVersioningResolver",
+            scope.get(constants.SCOPE_API_VERSIONING_RESOLVER),
+        )
+        if not version_scheme_resolver.can_activate(
+            route_versions=self.allowed_version
+        ):
+            if request_tracer.enabled:
+                request_tracer.trace("URL Matched with invalid Version", self)
+            return False
+        return True
+
     def __hash__(self) -> int:  # pragma: no cover
         return hash(self.endpoint)
 
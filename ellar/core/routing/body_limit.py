@@ -0,0 +1,41 @@
+import typing as t
+
+from ellar.common.exceptions import RequestEntityTooLarge
+from ellar.common.types import TMessage, TReceive, TScope
+
+__all__ = ["limit_request_body"]
+
+
+def _get_content_length(scope: TScope) -> t.Optional[int]:
+    for name, value in scope["headers"]:
+        if name == b"content-length":
+            try:
+                return int(value)
+            except ValueError:
+                return None
+    return None
+
+
+def limit_request_body(scope: TScope, receive: TReceive, max_size: int) -> TReceive:
+    """
+    Admits the request body of `scope` when it is at most `max_size` bytes.
+
+    The `Content-Length` header is checked right away, and the returned `receive` counts the
+    received bytes, raising `RequestEntityTooLarge` as soon as `max_size` is exceeded.
+    """
+    content_length = _get_content_length(scope)
+    if content_length is not None and content_length > max_size:
+        raise RequestEntityTooLarge()
+
+    received = 0
+
+    async def _receive() -> TMessage:
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > max_size:
+                raise RequestEntityTooLarge()
+        return message
+
+    return _receive
@@ -1,7 +1,7 @@
 import typing as t
 
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 from ellar.common.models import ControllerBase
 
 
@@ -15,7 +15,8 @@ class ControllerRouteOperationBase:
         self.controller = controller
 
     def _get_controller_instance(self, ctx: IExecutionContext) -> ControllerBase:
-        request_logger.debug("Getting Controller Instance")
+        if request_tracer.enabled:
+            request_tracer.trace("Getting Controller Instance", self)
         service_provider = ctx.get_service_provider()
 
         controller_instance: ControllerBase = service_provider.get(self.controller)
@@ -26,6 +27,6 @@ class ControllerRouteOperationBase:
     # def __call__(
     #     self, context: IExecutionContext, *args: t.Any, **kwargs: t.Any
     # ) -> t.Any:
-    #     request_logger.debug("Calling Controller Endpoint manually")
+    #     request_tracer.trace("Calling Controller Endpoint manually", self)
     #     controller_instance = self._get_controller_instance(ctx=context)
     #     return self.endpoint(controller_instance, *args, **kwargs)
@@ -1,7 +1,7 @@
 import typing as t
 
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 from ellar.core.routing.route import RouteOperation
 from starlette.concurrency import run_in_threadpool
 
@@ -16,9 +16,8 @@ class ControllerRouteOperation(ControllerRouteOperationBase, RouteOperation):
         return self.controller
 
     async def run(self, context: IExecutionContext, kwargs: t.Dict) -> t.Any:
-        request_logger.debug(
-            f"Executing Controller Endpoint from '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Executing Controller Endpoint", self)
         controller_instance = self._get_controller_instance(ctx=context)
         if self._is_coroutine:
             return await self.endpoint(controller_instance, **kwargs)
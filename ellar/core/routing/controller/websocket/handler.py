@@ -1,7 +1,7 @@
 import typing as t
 
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 from ellar.common.models import ControllerBase
 
 from ...websocket import WebSocketExtraHandler
@@ -20,16 +20,14 @@ class ControllerWebSocketExtraHandler(WebSocketExtraHandler):
         )
 
         receiver_kwargs.update(extra_kwargs)
-        request_logger.debug(
-            f"Executing on_receive handler from {self.__class__.__name__}"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Executing on_receive handler", self)
         await self.on_receive(self.controller_instance, **receiver_kwargs)
 
     async def execute_on_connect(self, *, context: IExecutionContext) -> None:
         if self.on_connect:
-            request_logger.debug(
-                f"Executing on_connect handler from {self.__class__.__name__}"
-            )
+            if request_tracer.enabled:
+                request_tracer.trace("Executing on_connect handler", self)
             await self.on_connect(
                 self.controller_instance, context.switch_to_websocket().get_client()
             )
@@ -40,9 +38,8 @@ class ControllerWebSocketExtraHandler(WebSocketExtraHandler):
         self, *, context: IExecutionContext, close_code: int
     ) -> None:
         if self.on_disconnect:
-            request_logger.debug(
-                f"Executing on_disconnect handler from {self.__class__.__name__}"
-            )
+            if request_tracer.enabled:
+                request_tracer.trace("Executing on_disconnect handler", self)
             await self.on_disconnect(
                 self.controller_instance,
                 context.switch_to_websocket().get_client(),
@@ -1,7 +1,7 @@
 import typing as t
 
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 
 from ...websocket import WebsocketRouteOperation
 from ..base import ControllerRouteOperationBase
@@ -22,14 +22,12 @@ class ControllerWebsocketRouteOperation(
         return ControllerWebSocketExtraHandler
 
     async def run(self, context: IExecutionContext, kwargs: t.Dict) -> t.Any:
-        request_logger.debug(
-            f"Running Websocket Endpoint handler from '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Running Websocket Endpoint handler", self)
         controller_instance = self._get_controller_instance(ctx=context)
         if self._use_extra_handler:
-            request_logger.debug(
-                f"Switched Websocket Extra Handler from '{self.__class__.__name__}'"
-            )
+            if request_tracer.enabled:
+                request_tracer.trace("Switched Websocket Extra Handler", self)
             ws_extra_handler_type = (
                 self._extra_handler_type or self.get_websocket_handler()
             )
@@ -0,0 +1,227 @@
+import typing as t
+
+from ellar.common.constants import GUARDS_KEY, MAX_BODY_SIZE_KEY, ROUTE_INTERCEPTORS
+from ellar.common.interfaces import (
+    IExecutionContextFactory,
+    IGuardsConsumer,
+    IInterceptorsConsumer,
+)
+from ellar.common.logging import logger
+from ellar.common.responses import JSONResponse
+from ellar.core.execution_context import current_injector
+from ellar.core.guards import GuardConsumer
+from ellar.core.interceptors import EllarInterceptorConsumer
+from ellar.di import SingletonScope
+from ellar.pydantic import ENCODERS_BY_TYPE
+from injector import ScopeDecorator
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.app import App
+    from ellar.common import EllarInterceptor, GuardCanActivate
+    from ellar.core.conf import Config
+    from ellar.di import EllarInjector
+
+    from .base import RouteOperationBase
+
+__all__ = ["RouteExecutionPlan", "RouteCompileOptions"]
+
+T = t.TypeVar("T")
+# resolved instance, or a type that is resolved per request
+TPlanItem = t.Union[T, t.Type[T]]
+
+
+class RouteCompileOptions(t.NamedTuple):
+    """
+    Route parameters and responses settings of an application, read from its config once.
+    """
+
+    capture_raw_data: bool = True
+    concurrent_parameter_resolution: bool = False
+    compile_route_parameters: bool = False
+    single_pass_parameter_validation: bool = False
+    compile_response_serializers: bool = False
+    response_validation: str = "always"
+    response_validation_sample_rate: float = 0.1
+
+    @classmethod
+    def from_config(cls, config: "Config") -> "RouteCompileOptions":
+        return cls(
+            capture_raw_data=config.CAPTURE_PARAMETERS_RAW_DATA,
+            concurrent_parameter_resolution=config.CONCURRENT_PARAMETER_RESOLUTION,
+            compile_route_parameters=config.COMPILE_ROUTE_PARAMETERS
+            or config.SINGLE_PASS_PARAMETER_VALIDATION,
+            single_pass_parameter_validation=config.SINGLE_PASS_PARAMETER_VALIDATION,
+            compile_response_serializers=cls._can_compile_response_serializers(config),
+            response_validation=config.RESPONSE_VALIDATION,
+            response_validation_sample_rate=config.RESPONSE_VALIDATION_SAMPLE_RATE,
+        )
+
+    @classmethod
+    def _can_compile_response_serializers(cls, config: "Config") -> bool:
+        """
+        Compiled response serializers write JSON with pydantic, without the custom encoders
+        and the JSON response class of the application.
+        """
+        if not config.COMPILE_RESPONSE_SERIALIZERS:
+            return False
+
+        if config.SERIALIZER_CUSTOM_ENCODER != ENCODERS_BY_TYPE:
+            reason = "SERIALIZER_CUSTOM_ENCODER defines custom encoders"
+        elif config.DEFAULT_JSON_CLASS is not JSONResponse:
+            reason = f"DEFAULT_JSON_CLASS is {config.DEFAULT_JSON_CLASS.__name__}"
+        else:
+            return True
+
+        logger.warning(
+            f"COMPILE_RESPONSE_SERIALIZERS is turned off: {reason}, "
+            f"which pydantic does not use to write JSON."
+        )
+        return False
+
+
+class RouteExecutionPlan:
+    """
+    Guards and interceptors of a route operation, compiled once per application.
+
+    Guards and interceptors defined on the route handler or its controller are read once,
+    and the ones registered as singletons are resolved with the operation module injector.
+    Other types, e.g. request scoped ones, are still resolved per request.
+
+    Operations without guards or interceptors of their own use the application global ones,
+    which are compiled again whenever they change.
+
+    The execution context factory and the guards and interceptors consumers are resolved
+    the same way. When the default consumers are used and there is no guard or interceptor to run,
+    `fast_path` is `True` and the operation calls its handler directly.
+
+    `max_body_size` is the request body size limit of the route handler or its controller,
+    `MAX_REQUEST_BODY_SIZE` config otherwise.
+
+    `endpoint_args_model` and `response_model` are the models of the operation configured with
+    the application `RouteCompileOptions`. Route operations are shared by the applications built
+    from the same modules, so each application resolves arguments and responses with its own models.
+    """
+
+    __slots__ = (
+        "app",
+        "_injector",
+        "_guards",
+        "_interceptors",
+        "_global_guards",
+        "_global_interceptors",
+        "_context_factory",
+        "_guards_consumer",
+        "_interceptors_consumer",
+        "_default_consumers",
+        "max_body_size",
+        "endpoint_args_model",
+        "response_model",
+    )
+
+    def __init__(
+        self,
+        operation: "RouteOperationBase",
+        app: "App",
+        injector: "EllarInjector",
+    ) -> None:
+        self.app = app
+        self._injector = injector
+
+        targets = (operation.endpoint, operation.get_controller_type())
+        guards = app.reflector.get_all_and_override(GUARDS_KEY, *targets)
+        interceptors = app.reflector.get_all_and_override(ROUTE_INTERCEPTORS, *targets)
+        max_body_size = app.reflector.get_all_and_override(MAX_BODY_SIZE_KEY, *targets)
+        self.max_body_size: t.Optional[int] = (
+            app.config.MAX_REQUEST_BODY_SIZE if max_body_size is None else max_body_size
+        )
+
+        options = app.router.get_compile_options(app)
+        self.endpoint_args_model: t.Any = operation.get_endpoint_args_model(options)
+        self.response_model: t.Any = operation.get_response_model(options)
+
+        self._guards: t.Optional[t.Tuple[TPlanItem["GuardCanActivate"], ...]] = (
+            self._compile(guards) if guards else None
+        )
+        self._interceptors: t.Optional[t.Tuple[TPlanItem["EllarInterceptor"], ...]] = (
+            self._compile(interceptors) if interceptors else None
+        )
+        # (source, compiled) of the application global guards and interceptors
+        self._global_guards: t.Tuple[t.Tuple, t.Tuple] = ((), ())
+        self._global_interceptors: t.Tuple[t.Tuple, t.Tuple] = ((), ())
+
+        self._context_factory = self._resolve_singleton(IExecutionContextFactory)
+        self._guards_consumer = self._resolve_singleton(IGuardsConsumer)
+        self._interceptors_consumer = self._resolve_singleton(IInterceptorsConsumer)
+        self._default_consumers = (
+            type(self._guards_consumer) is GuardConsumer
+            and type(self._interceptors_consumer) is EllarInterceptorConsumer
+        )
+
+    @property
+    def fast_path(self) -> bool:
+        """Whether the operation runs without guards and interceptors"""
+        return (
+            self._default_consumers
+            and not self.get_guards()
+            and not self.get_interceptors()
+        )
+
+    def get_execution_context_factory(self) -> IExecutionContextFactory:
+        return t.cast(IExecutionContextFactory, self._get(self._context_factory))
+
+    def get_guards_consumer(self) -> IGuardsConsumer:
+        return t.cast(IGuardsConsumer, self._get(self._guards_consumer))
+
+    def get_interceptors_consumer(self) -> IInterceptorsConsumer:
+        return t.cast(IInterceptorsConsumer, self._get(self._interceptors_consumer))
+
+    @property
+    def uses_global_guards(self) -> bool:
+        return self._guards is None
+
+    @property
+    def uses_global_interceptors(self) -> bool:
+        return self._interceptors is None
+
+    def get_guards(self) -> t.Sequence[TPlanItem["GuardCanActivate"]]:
+        if self._guards is not None:
+            return self._guards
+
+        source = tuple(self.app.get_guards())
+        if source != self._global_guards[0]:
+            self._global_guards = (source, self._compile(source))
+        return self._global_guards[1]
+
+    def get_interceptors(self) -> t.Sequence[TPlanItem["EllarInterceptor"]]:
+        if self._interceptors is not None:
+            return self._interceptors
+
+        source = tuple(self.app.get_interceptors())
+        if source != self._global_interceptors[0]:
+            self._global_interceptors = (source, self._compile(source))
+        return self._global_interceptors[1]
+
+    @classmethod
+    def _get(cls, item: t.Any) -> t.Any:
+        if isinstance(item, type):
+            return current_injector.get(item)
+        return item
+
+    def _compile(self, items: t.Iterable[t.Any]) -> t.Tuple[t.Any, ...]:
+        return tuple(self._resolve_singleton(item) for item in items)
+
+    def _resolve_singleton(self, item: t.Any) -> t.Any:
+        if not isinstance(item, type):
+            return item
+
+        try:
+            binding, _ = self._injector.container.get_binding(item)
+            scope = binding.scope
+            if isinstance(scope, ScopeDecorator):
+                scope = scope.scope
+            if isinstance(scope, type) and issubclass(scope, SingletonScope):
+                return self._injector.get(item)
+        except Exception:
+            # left to the request, where it fails the same way it always did
+            pass
+        return item
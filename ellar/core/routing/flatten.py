@@ -0,0 +1,137 @@
+import re
+import typing as t
+
+from ellar.common.types import TReceive, TScope, TSend
+from starlette._utils import get_route_path
+from starlette.routing import BaseRoute, Match, compile_path
+
+from .base import RouteOperationBase
+from .mount import EllarControllerMount
+
+__all__ = ["FlattenedMountRoute", "flatten_routes"]
+
+_ROUTE_PATH_GROUP = "_ellar_route_path"
+
+
+class FlattenedMountRoute(BaseRoute):
+    """
+    A route operation registered under its full prefixed path.
+
+    It matches with a single regex what `EllarControllerMount` resolves by matching the mount
+    and then scanning its child routes. The resulting scope is the same as what the mount would have
+    produced, and handling is still done by the mount, so its middleware and module context are preserved.
+    """
+
+    def __init__(
+        self, mounts: t.Sequence[EllarControllerMount], operation: BaseRoute
+    ) -> None:
+        self.mounts = tuple(mounts)
+        self.operation = operation
+        self.path = "".join(mount.path for mount in self.mounts) + getattr(
+            operation, "path", ""
+        )
+
+        prefix_regex, _, self.param_convertors = compile_path(
+            "".join(mount.path for mount in self.mounts)
+        )
+        operation_regex: t.Pattern[str] = operation.path_regex  # type:ignore[attr-defined]
+        self.path_regex = re.compile(
+            f"{prefix_regex.pattern[:-1]}(?P<{_ROUTE_PATH_GROUP}>{operation_regex.pattern[1:-1]})$"
+        )
+        self._lookups = [
+            (mount._lookup_key, route)
+            for mount, route in zip(self.mounts, self.mounts[1:] + (operation,))
+        ]
+
+    @property
+    def root_mount(self) -> EllarControllerMount:
+        return self.mounts[0]
+
+    @property
+    def methods(self) -> t.Optional[t.Set[str]]:
+        return getattr(self.operation, "methods", None)
+
+    @property
+    def allowed_version(self) -> t.Optional[t.Set[t.Union[int, float, str]]]:
+        return getattr(self.operation, "allowed_version", None)
+
+    def matches(self, scope: TScope) -> t.Tuple[Match, TScope]:
+        if scope["type"] not in ("http", "websocket"):  # pragma: no cover
+            return Match.NONE, {}
+
+        route_path = get_route_path(scope)
+        match = self.path_regex.match(route_path)
+        if match is None:
+            return Match.NONE, {}
+
+        root_path = scope.get("root_path", "")
+        remaining_path = match.group(_ROUTE_PATH_GROUP)
+        path_params = dict(scope.get("path_params", {}))
+        for key, convertor in self.param_convertors.items():
+            path_params[key] = convertor.convert(match.group(key))
+
+        child_scope = {
+            "path_params": path_params,
+            "app_root_path": scope.get("app_root_path", root_path),
+            "root_path": root_path + route_path[: -len(remaining_path)],
+            "endpoint": self.mounts[-1].app,
+        }
+        operation_scope = dict(scope)
+        operation_scope.update(child_scope)
+
+        operation_match, operation_child_scope = self.operation.matches(operation_scope)
+        if operation_match == Match.NONE or (
+            # nested mounts drop partial matches of their children
+            operation_match == Match.PARTIAL and len(self.mounts) > 1
+        ):
+            return Match.NONE, {}
+
+        child_scope.update(operation_child_scope)
+        child_scope.update(self._lookups)
+        return operation_match, child_scope
+
+    async def handle(self, scope: TScope, receive: TReceive, send: TSend) -> None:
+        await self.root_mount.handle(scope, receive, send)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, operation={self.operation!r})"
+
+
+def _flatten_mount(
+    mount: EllarControllerMount, parents: t.Tuple[EllarControllerMount, ...] = ()
+) -> t.Optional[t.List[BaseRoute]]:
+    mounts = parents + (mount,)
+    result: t.List[BaseRoute] = []
+
+    for route in mount.routes:
+        if isinstance(route, EllarControllerMount):
+            nested = _flatten_mount(route, mounts)
+            if nested is None:
+                return None
+            result.extend(nested)
+        elif isinstance(route, RouteOperationBase):
+            try:
+                result.append(FlattenedMountRoute(mounts, route))
+            except (ValueError, re.error):
+                # duplicated parameter name between mount and operation
+                return None
+        else:
+            return None
+    return result
+
+
+def flatten_routes(routes: t.Sequence[BaseRoute]) -> t.List[BaseRoute]:
+    """
+    Replaces every `EllarControllerMount` with its operations registered under their full path.
+    The order of the sorted routes is preserved, so precedence stays the same.
+    Mounts with children that can not be flattened are left as they are.
+    """
+    result: t.List[BaseRoute] = []
+    for route in routes:
+        if isinstance(route, EllarControllerMount):
+            flattened = _flatten_mount(route)
+            if flattened is not None:
+                result.extend(flattened)
+                continue
+        result.append(route)
+    return result
@@ -1,11 +1,8 @@
 import functools
 import typing as t
 
-from ellar.common.constants import (
-    MODULE_COMPONENT,
-    SCOPE_API_VERSIONING_RESOLVER,
-)
-from ellar.common.logging import logger, request_logger
+from ellar.common.constants import MODULE_COMPONENT, SCOPE_API_VERSIONING_RESOLVER
+from ellar.common.logging import logger, request_tracer
 from ellar.common.types import TReceive, TScope, TSend
 from ellar.reflect import fail_silently, reflect
 from starlette._utils import get_route_path
@@ -16,10 +13,14 @@ from starlette.routing import BaseRoute, Match, Route, Router
 from starlette.routing import Mount as StarletteMount
 from starlette.types import ASGIApp
 
+from .base import RouteOperationBase
+from .execution_plan import RouteCompileOptions
 from .route import RouteOperation
-from .route_collections import RouteCollection
+from .route_cache import RouteMatchCache
+from .route_collections import RouteCollection, TRouteMatcher
 
 if t.TYPE_CHECKING:
+    from ellar.app import App
     from ellar.core.modules import ModuleRefBase
     from ellar.core.versioning.resolver import BaseAPIVersioningResolver
 
@@ -37,15 +38,24 @@ class EllarControllerMount(StarletteMount):
         name: t.Optional[str] = None,
         include_in_schema: bool = False,
         middleware: t.Optional[t.Sequence[Middleware]] = None,
+        route_matcher: TRouteMatcher = "trie",
     ) -> None:
         app = Router()
-        app.routes = RouteCollection(routes)  # type:ignore
+        app.routes = RouteCollection(routes, route_matcher=route_matcher)  # type:ignore
         super().__init__(path=path, app=app, name=name, middleware=[])
         self.include_in_schema = include_in_schema
 
         self.middleware = [] if middleware is None else list(middleware)
         self._middleware_stack: t.Optional[ASGIApp] = None
 
+    def set_route_matcher(self, route_matcher: TRouteMatcher) -> None:
+        """Sets the strategy used to find candidate routes in this mount and its nested mounts"""
+        routes = t.cast(RouteCollection, self.routes)
+        routes.set_route_matcher(route_matcher)
+        for route in routes:
+            if isinstance(route, EllarControllerMount):
+                route.set_route_matcher(route_matcher)
+
     @functools.cached_property
     def _lookup_key(self) -> str:
         return f"EllarControllerMountRoute_{id(self)}"
@@ -61,9 +71,8 @@ class EllarControllerMount(StarletteMount):
         return app
 
     def matches(self, scope: TScope) -> t.Tuple[Match, TScope]:
-        request_logger.debug(
-            f"Matching URL Handler path={scope['path']} - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Matching URL Handler", self, path=scope["path"])
         match, _child_scope = super().matches(scope)
         if match == Match.FULL:
             scope_copy = dict(scope)
@@ -71,7 +80,17 @@ class EllarControllerMount(StarletteMount):
             partial: t.Optional["RouteOperation"] = None
             partial_scope = {}
 
-            for route in self.routes:
+            routes = t.cast(RouteCollection, self.routes)
+            matched_route, child_scope = routes.match_static_route(scope_copy)
+            if matched_route is None:
+                matched_route, child_scope = routes.match_versioned_route(scope_copy)
+
+            if matched_route is not None:
+                _child_scope.update(child_scope)
+                _child_scope[self._lookup_key] = matched_route
+                return Match.FULL, _child_scope
+
+            for route in routes.get_candidate_routes(scope_copy):
                 # Determine if any route matches the incoming scope,
                 # and hand over to the matching route if found.
                 match, child_scope = route.matches(scope_copy)
@@ -95,9 +114,10 @@ class EllarControllerMount(StarletteMount):
         return Match.NONE, {}
 
     async def _app_handler(self, scope: TScope, receive: TReceive, send: TSend) -> None:
-        request_logger.debug(
-            f"Executing Matched URL Handler, path={scope['path']} - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace(
+                "Executing Matched URL Handler", self, path=scope["path"]
+            )
         route = t.cast(t.Optional[Route], scope.get(self._lookup_key))
         if route:
             del scope[self._lookup_key]
@@ -137,6 +157,9 @@ class ApplicationRouter(Router):
         on_startup: t.Optional[t.Sequence[t.Callable]] = None,
         on_shutdown: t.Optional[t.Sequence[t.Callable]] = None,
         lifespan: t.Optional[t.Callable[[t.Any], t.AsyncContextManager]] = None,
+        flatten_routes: bool = False,
+        match_cache_size: int = 0,
+        route_matcher: TRouteMatcher = "trie",
     ):
         super().__init__(
             routes=None,
@@ -147,32 +170,111 @@ class ApplicationRouter(Router):
             lifespan=lifespan,
         )
         self.default = router_default_decorator(self.default)
-        self.routes: RouteCollection = RouteCollection(routes)
+        self.routes: RouteCollection = RouteCollection(
+            routes,
+            flatten=flatten_routes,
+            match_cache=(
+                RouteMatchCache(match_cache_size) if match_cache_size > 0 else None
+            ),
+            route_matcher=route_matcher,
+        )
+        self._set_mounts_route_matcher(self.routes)
+        self._compile_options: t.Optional[RouteCompileOptions] = None
+
+    def _set_mounts_route_matcher(self, routes: t.Iterable[BaseRoute]) -> None:
+        for route in routes:
+            if isinstance(route, EllarControllerMount):
+                route.set_route_matcher(self.routes.route_matcher)
+
+    def _get_module_ref(self, route: BaseRoute) -> t.Optional["ModuleRefBase"]:
+        # flattened operations are registered to the module through their controller mount
+        target = getattr(route, "root_mount", route)
+        return t.cast(
+            t.Optional["ModuleRefBase"],
+            fail_silently(reflect.get_metadata_search_safe, MODULE_COMPONENT, target),
+        )
+
+    @property
+    def route_match_cache(self) -> t.Optional[RouteMatchCache]:
+        return self.routes.match_cache
+
+    def get_compile_options(self, app: "App") -> RouteCompileOptions:
+        """
+        Returns the route parameters and responses settings of `app`, read from its config once.
+        """
+        if self._compile_options is None:
+            self._compile_options = RouteCompileOptions.from_config(app.config)
+        return self._compile_options
+
+    def build_execution_plans(self, app: "App") -> None:
+        """
+        Compiles the guards and interceptors execution plan of every route operation,
+        using the injector of the module each operation belongs to.
+        """
+        self._compile_options = RouteCompileOptions.from_config(app.config)
+        for route in self.routes:
+            module_ref = self._get_module_ref(route)
+            injector = module_ref.container.injector if module_ref else app.injector
+            for operation in _get_route_operations(route):
+                plan = operation.build_execution_plan(app, injector)
+                logger.debug(
+                    f"{operation} runs with the "
+                    f"{'fast' if plan.fast_path else 'guards and interceptors'} execution path"
+                )
+                if getattr(plan.endpoint_args_model, "compiled_resolver", None):
+                    logger.debug(f"{operation} resolves compiled endpoint arguments")
+                if getattr(plan.response_model, "serializes_json", False):
+                    logger.debug(f"{operation} serializes responses to JSON bytes")
+
+    def _match_route(self, scope: TScope) -> t.Tuple[t.Optional[BaseRoute], TScope]:
+        route, child_scope = self.routes.match_static_route(scope)
+        if route is None:
+            route, child_scope = self.routes.match_versioned_route(scope)
+
+        if route is not None:
+            return route, child_scope
 
-    def _get_route_handler(
-        self, scope: TScope
-    ) -> t.Optional[t.Union[BaseRoute, RedirectResponse]]:
         partial = None
         partial_scope: t.Dict = {}
 
-        for route in self.routes:
+        for route in self.routes.get_candidate_routes(scope):
             # Determine if any route matches the incoming scope,
             # and hand over to the matching route if found.
             match, child_scope = route.matches(scope)
             if match == Match.FULL:
-                scope.update(child_scope)
-                return route
+                return route, child_scope
 
             elif match == Match.PARTIAL and partial is None:
                 partial = route
                 partial_scope = dict(child_scope)
 
         if partial is not None:
-            #  Handle partial matches. These are cases where an endpoint is
+            #  Handle partial matches. These are cases where an endpoint is
             # able to handle the request, but is not a preferred option.
             # We use this in particular to deal with "405 Method Not Allowed".
-            scope.update(partial_scope, partial=True)
-            return partial
+            partial_scope.update(partial=True)
+            return partial, partial_scope
+
+        return None, {}
+
+    def _get_route_handler(
+        self, scope: TScope
+    ) -> t.Optional[t.Union[BaseRoute, RedirectResponse]]:
+        cache = self.routes.match_cache
+        cache_key = cache.get_key(scope) if cache is not None else None
+
+        if cache is not None and cache_key is not None:
+            cached = cache.get(cache_key)
+            if cached is not None:
+                scope.update(cached[1])
+                return cached[0]
+
+        route, child_scope = self._match_route(scope)
+        if route is not None:
+            if cache is not None and cache_key is not None:
+                cache.set(cache_key, route, child_scope)
+            scope.update(child_scope)
+            return route
 
         route_path = get_route_path(scope)
         if scope["type"] == "http" and self.redirect_slashes and route_path != "/":
@@ -182,11 +284,9 @@ class ApplicationRouter(Router):
             else:
                 redirect_scope["path"] = redirect_scope["path"] + "/"
 
-            for route in self.routes:
-                match, child_scope = route.matches(redirect_scope)
-                if match != Match.NONE:
-                    redirect_url = URL(scope=redirect_scope)
-                    return RedirectResponse(url=str(redirect_url))
+            if self.routes.has_matching_route(redirect_scope):
+                redirect_url = URL(scope=redirect_scope)
+                return RedirectResponse(url=str(redirect_url))
 
         return None
 
@@ -207,10 +307,7 @@ class ApplicationRouter(Router):
         if isinstance(route, RedirectResponse):
             return await route(scope, receive, send)
 
-        module_ref: t.Optional["ModuleRefBase"] = t.cast(
-            t.Optional["ModuleRefBase"],
-            fail_silently(reflect.get_metadata_search_safe, MODULE_COMPONENT, route),
-        )
+        module_ref = self._get_module_ref(route)
         if scope.get("partial", False) is False and module_ref:
             async with module_ref.module_context.context(route) as module_context:
                 return await module_context.handle(scope, receive, send)
@@ -221,6 +318,7 @@ class ApplicationRouter(Router):
     def add(self, route: t.Union[BaseRoute, t.Callable]) -> None:
         if not isinstance(route, BaseRoute):
             raise RuntimeError(f"Invalid type passed to router - {route}")
+        self._set_mounts_route_matcher([route])
         self.routes.append(route)
 
     def extend(self, routes: t.Sequence[t.Union[BaseRoute, t.Callable]]) -> None:
@@ -244,3 +342,11 @@ class ApplicationRouter(Router):
             "class in `routers` parameter. eg @Module(routers=[ellar.core.host(my_asgi_app)]"
         )
         return super().host(host=host, app=app, name=name)
+
+
+def _get_route_operations(route: BaseRoute) -> t.Iterator[RouteOperationBase]:
+    if isinstance(route, RouteOperationBase):
+        yield route
+    elif isinstance(route, EllarControllerMount):
+        for child in route.routes:
+            yield from _get_route_operations(child)
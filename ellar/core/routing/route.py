@@ -4,9 +4,13 @@ import typing as t
 from ellar.common import constants
 from ellar.common.exceptions import ImproperConfiguration, RequestValidationError
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 from ellar.common.params import ExtraEndpointArg, RequestEndpointArgsModel
-from ellar.common.responses.models import RouteResponseModel
+from ellar.common.responses.models import (
+    BaseResponseModel,
+    JSONResponseModel,
+    RouteResponseModel,
+)
 from ellar.reflect import reflect
 from ellar.utils import generate_operation_unique_id, get_name
 from starlette.concurrency import run_in_threadpool
@@ -15,6 +19,14 @@ from starlette.routing import Route as StarletteRoute
 from starlette.routing import compile_path
 
 from .base import RouteOperationBase
+from .execution_plan import RouteCompileOptions
+
+# endpoint arguments models settings: raw data capture, concurrent resolution, compiled, single pass validation
+TEndpointArgsModelKey = t.Tuple[bool, bool, bool, bool]
+# response models settings: compiled serializer, response validation policy and sample rate
+TResponseModelKey = t.Tuple[bool, str, float]
+
+_DEFAULT_ENDPOINT_ARGS_MODEL_KEY: TEndpointArgsModelKey = (True, False, False, False)
 
 
 class RouteOperation(RouteOperationBase, StarletteRoute):
@@ -29,6 +41,9 @@ class RouteOperation(RouteOperationBase, StarletteRoute):
         "endpoint_parameter_model",
         "response_model",
         "_defined_responses",
+        "_extra_route_args",
+        "_endpoint_args_models",
+        "_response_models",
     )
 
     def __init__(
@@ -57,6 +72,12 @@ class RouteOperation(RouteOperationBase, StarletteRoute):
 
         self.endpoint_parameter_model: RequestEndpointArgsModel = constants.NOT_SET
         self.response_model: RouteResponseModel = constants.NOT_SET
+        self._extra_route_args: t.List["ExtraEndpointArg"] = []
+        # models configured for the applications, by their settings
+        self._endpoint_args_models: t.Dict[
+            TEndpointArgsModelKey, RequestEndpointArgsModel
+        ] = {}
+        self._response_models: t.Dict[TResponseModelKey, RouteResponseModel] = {}
 
         reflect.define_metadata(
             constants.CONTROLLER_OPERATION_HANDLER_KEY, self, self.endpoint
@@ -70,14 +91,11 @@ class RouteOperation(RouteOperationBase, StarletteRoute):
         if not isinstance(extra_route_args, list):  # pragma: no cover
             extra_route_args = [extra_route_args]
 
+        self._extra_route_args = extra_route_args
+        self._endpoint_args_models.clear()
+        self._response_models.clear()
         if self.endpoint_parameter_model is constants.NOT_SET:
-            self.endpoint_parameter_model = self.request_endpoint_args_model(
-                path=self.path_format,
-                endpoint=self.endpoint,
-                operation_unique_id=self.get_operation_unique_id(methods=self.methods),
-                param_converters=self.param_convertors,
-                extra_endpoint_args=extra_route_args,
-            )
+            self.endpoint_parameter_model = self._create_endpoint_args_model()
         self.endpoint_parameter_model.build_model()
 
         response_override: t.Union[t.Dict, t.Any] = reflect.get_metadata(
@@ -95,6 +113,74 @@ class RouteOperation(RouteOperationBase, StarletteRoute):
             route_responses=self._defined_responses
         )
 
+    def _create_endpoint_args_model(self) -> RequestEndpointArgsModel:
+        return self.request_endpoint_args_model(
+            path=self.path_format,
+            endpoint=self.endpoint,
+            operation_unique_id=self.get_operation_unique_id(methods=self.methods),
+            param_converters=self.param_convertors,
+            extra_endpoint_args=self._extra_route_args,
+        )
+
+    def get_endpoint_args_model(
+        self, options: RouteCompileOptions
+    ) -> RequestEndpointArgsModel:
+        """
+        Returns the endpoint arguments model configured with `options`,
+        unless the operation sets its own raw data capture with `capture_raw_data`.
+        Models are built once per settings, `endpoint_parameter_model` serves the default ones.
+        """
+        route_capture = reflect.get_metadata(
+            constants.CAPTURE_RAW_DATA_KEY, self.endpoint
+        )
+        key: TEndpointArgsModelKey = (
+            options.capture_raw_data if route_capture is None else route_capture,
+            options.concurrent_parameter_resolution,
+            options.compile_route_parameters,
+            options.single_pass_parameter_validation,
+        )
+        if key == _DEFAULT_ENDPOINT_ARGS_MODEL_KEY:
+            return self.endpoint_parameter_model
+
+        model = self._endpoint_args_models.get(key)
+        if model is None:
+            capture, concurrent, compiled, single_validation = key
+            model = self._create_endpoint_args_model()
+            model.build_model()
+            model.set_raw_data_capture(capture)
+            model.set_concurrent_resolution(concurrent)
+            model.compile(single_validation=single_validation, enabled=compiled)
+            self._endpoint_args_models[key] = model
+        return model
+
+    def get_response_model(self, options: RouteCompileOptions) -> RouteResponseModel:
+        """
+        Returns the response model configured with `options`, unless the operation sets
+        its own validation policy with `response_validation`.
+        Models are built once per settings, `response_model` serves the default ones.
+        """
+        key: TResponseModelKey = (
+            options.compile_response_serializers,
+            *JSONResponseModel.resolve_route_response_validation(
+                self.endpoint,
+                options.response_validation,
+                options.response_validation_sample_rate,
+            ),
+        )
+        compiled, policy, _ = key
+        if not compiled and policy == "always":
+            return self.response_model
+
+        model = self._response_models.get(key)
+        if model is None:
+            model = self.response_model.configure(
+                compiled,
+                BaseResponseModel.resolve_route_serializer_filter(self.endpoint),
+                response_validation=key[1:],
+            )
+            self._response_models[key] = model
+        return model
+
     def get_operation_unique_id(
         self,
         methods: t.Union[t.Set[str], t.Sequence[str], str],
@@ -111,19 +197,20 @@ class RouteOperation(RouteOperationBase, StarletteRoute):
         )
 
     async def run(self, context: IExecutionContext, kwargs: t.Dict) -> t.Any:
-        request_logger.debug(
-            f"Executing Request Endpoint Handler - '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Executing Request Endpoint Handler", self)
         if self._is_coroutine:
             return await self.endpoint(**kwargs)
         else:
             return await run_in_threadpool(self.endpoint, **kwargs)
 
     async def handle_request(self, context: IExecutionContext) -> t.Any:
-        request_logger.debug(
-            f"Resolving Request Endpoint Handler Dependencies - '{self.__class__.__name__}'"
-        )
-        res = await self.endpoint_parameter_model.resolve_dependencies(ctx=context)
+        if request_tracer.enabled:
+            request_tracer.trace(
+                "Resolving Request Endpoint Handler Dependencies", self
+            )
+        plan = self.get_execution_plan(context.get_app())
+        res = await plan.endpoint_args_model.resolve_dependencies(ctx=context)
         if res.errors:
             raise RequestValidationError(res.errors)
 
@@ -132,8 +219,10 @@ class RouteOperation(RouteOperationBase, StarletteRoute):
     async def handle_response(
         self, context: IExecutionContext, response_obj: t.Any
     ) -> None:
-        request_logger.debug(f"Processing Response - '{self.__class__.__name__}'")
-        response = self.response_model.process_response(
+        if request_tracer.enabled:
+            request_tracer.trace("Processing Response", self)
+        plan = self.get_execution_plan(context.get_app())
+        response = plan.response_model.process_response(
             ctx=context, response_obj=response_obj
         )
         if isinstance(response, Response):
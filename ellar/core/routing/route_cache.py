@@ -0,0 +1,102 @@
+import typing as t
+from collections import OrderedDict
+
+from ellar.common.constants import SCOPE_API_VERSIONING_RESOLVER
+from ellar.common.types import TScope
+from starlette.routing import BaseRoute
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.core.versioning.resolver import BaseAPIVersioningResolver
+
+__all__ = ["RouteMatchCache", "RouteMatchCacheInfo"]
+
+
+class RouteMatchCacheInfo(t.NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class RouteMatchCache:
+    """
+    Bounded LRU cache of route matches keyed on the request
+    type, method, host, path and resolved API version.
+
+    Only matched routes are cached. Misses are not, because the not-found and
+    redirect responses depend on more than the request path.
+    """
+
+    __slots__ = ("maxsize", "hits", "misses", "_entries")
+
+    def __init__(self, maxsize: int) -> None:
+        assert maxsize > 0, "Route match cache size must be greater than 0"
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[t.Hashable, t.Tuple[BaseRoute, TScope]]" = (
+            OrderedDict()
+        )
+
+    @classmethod
+    def get_key(cls, scope: TScope) -> t.Optional[t.Hashable]:
+        resolver = t.cast(
+            t.Optional["BaseAPIVersioningResolver"],
+            scope.get(SCOPE_API_VERSIONING_RESOLVER),
+        )
+        host = next(
+            (value for key, value in scope.get("headers", ()) if key == b"host"), None
+        )
+        path_params = scope.get("path_params")
+        key = (
+            scope["type"],
+            scope.get("method"),
+            host,
+            scope.get("root_path", ""),
+            scope["path"],
+            # `can_activate` depends on the default version too
+            (resolver.resolve(), str(resolver.default_version)) if resolver else None,
+            # path parameters set before routing, e.g. by URL versioning
+            tuple(path_params.items()) if path_params else (),
+        )
+        try:
+            hash(key)
+        except TypeError:  # pragma: no cover
+            return None
+        return key
+
+    def get(self, key: t.Hashable) -> t.Optional[t.Tuple[BaseRoute, TScope]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        route, child_scope = entry
+        return route, self._copy_child_scope(child_scope)
+
+    def set(self, key: t.Hashable, route: BaseRoute, child_scope: TScope) -> None:
+        self._entries[key] = (route, self._copy_child_scope(child_scope))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def cache_info(self) -> RouteMatchCacheInfo:
+        return RouteMatchCacheInfo(
+            hits=self.hits,
+            misses=self.misses,
+            maxsize=self.maxsize,
+            currsize=len(self._entries),
+        )
+
+    @classmethod
+    def _copy_child_scope(cls, child_scope: TScope) -> TScope:
+        # `path_params` is exposed to the request and must not be shared across requests
+        child_scope = dict(child_scope)
+        if "path_params" in child_scope:
+            child_scope["path_params"] = dict(child_scope["path_params"])
+        return child_scope
@@ -2,17 +2,68 @@ import typing as t
 import uuid
 from collections import OrderedDict
 
+from ellar.common.constants import NOT_SET, SCOPE_API_VERSIONING_RESOLVER
 from ellar.common.exceptions import ImproperConfiguration
+from ellar.common.types import TScope
 from ellar.utils import generate_controller_operation_unique_id
-from starlette.routing import BaseRoute, Host, Mount
+from starlette._utils import get_route_path
+from starlette.routing import BaseRoute, Host, Match, Mount
+
+from .route_cache import RouteMatchCache
+from .route_index import SlashRedirectIndex, StaticRouteIndex
+from .route_regex import RegexRouteMatcher
+from .route_trie import RouteTrie
+
+if t.TYPE_CHECKING:  # pragma: no cover
+    from ellar.core.versioning.resolver import BaseAPIVersioningResolver
+
+_TVersionKey = t.Tuple[t.Optional[str], bool]
+
+TRouteMatcher = t.Literal["trie", "regex"]
+ROUTE_MATCHERS: t.Tuple[str, ...] = t.get_args(TRouteMatcher)
 
 
 class RouteCollection(t.Sequence[BaseRoute]):
-    __slots__ = ("_routes", "_served_routes")
+    __slots__ = (
+        "_routes",
+        "_served_routes",
+        "_dispatch_routes",
+        "_trie",
+        "_route_matcher",
+        "_regex_matcher",
+        "_static_index",
+        "_slash_redirect_index",
+        "_route_versions",
+        "_known_versions",
+        "_version_tries",
+        "_flatten",
+        "_match_cache",
+    )
 
-    def __init__(self, routes: t.Optional[t.Sequence[BaseRoute]] = None) -> None:
+    def __init__(
+        self,
+        routes: t.Optional[t.Sequence[BaseRoute]] = None,
+        flatten: bool = False,
+        match_cache: t.Optional[RouteMatchCache] = None,
+        route_matcher: TRouteMatcher = "trie",
+    ) -> None:
+        self._check_route_matcher(route_matcher)
         self._routes: t.Dict[int, BaseRoute] = OrderedDict()
         self._served_routes: t.List[BaseRoute] = []
+        # routes used for request dispatch.
+        # Same as `_served_routes` unless controller mounts are flattened
+        self._dispatch_routes: t.List[BaseRoute] = []
+        self._trie = RouteTrie()
+        self._route_matcher = route_matcher
+        self._regex_matcher: t.Optional[RegexRouteMatcher] = None
+        self._static_index = StaticRouteIndex([], self._trie)
+        self._slash_redirect_index = SlashRedirectIndex([])
+        # versions of each dispatch route, `None` for routes that are not versioned
+        self._route_versions: t.List[t.Optional[t.Set]] = []
+        self._known_versions: t.Set = set()
+        self._version_tries: t.Dict[_TVersionKey, t.Optional[RouteTrie]] = {}
+        self._flatten = flatten
+        self._match_cache = match_cache
         self.extend([] if routes is None else list(routes))
 
     def __contains__(self, item: t.Any) -> bool:
@@ -45,12 +96,156 @@ class RouteCollection(t.Sequence[BaseRoute]):
         self.sort_routes()
         return self
 
+    @property
+    def match_cache(self) -> t.Optional[RouteMatchCache]:
+        return self._match_cache
+
+    @property
+    def route_matcher(self) -> TRouteMatcher:
+        return self._route_matcher
+
+    def set_route_matcher(self, route_matcher: TRouteMatcher) -> None:
+        self._check_route_matcher(route_matcher)
+        if route_matcher != self._route_matcher:
+            self._route_matcher = route_matcher
+            self.sort_routes()
+
+    def match_static_route(
+        self, scope: TScope
+    ) -> t.Tuple[t.Optional[BaseRoute], TScope]:
+        """
+        Resolves routes without path parameters with a hash lookup.
+        Returns `(None, {})` when the scope must go through `get_candidate_routes`.
+        """
+        return self._static_index.match(scope)
+
+    def has_matching_route(self, scope: TScope) -> bool:
+        """
+        Returns whether any route matches the scope, fully or partially.
+        Used to decide on `redirect_slashes` redirects.
+        """
+        if self._slash_redirect_index.match(scope):
+            return True
+
+        for route in self.get_candidate_routes(scope):
+            match, _ = route.matches(scope)
+            if match != Match.NONE:
+                return True
+        return False
+
+    def match_versioned_route(
+        self, scope: TScope
+    ) -> t.Tuple[t.Optional[BaseRoute], TScope]:
+        """
+        Looks for a full match among routes that can be activated by the request version only.
+        Routes of other versions can never fully match, but they can still produce a partial match,
+        so `(None, {})` means the scope must go through `get_candidate_routes`.
+        """
+        trie = self._get_version_trie(scope)
+        if trie is None:
+            return None, {}
+
+        positions = trie.lookup(get_route_path(scope))
+        routes = (
+            self._dispatch_routes
+            if positions is None
+            else [self._dispatch_routes[i] for i in positions]
+        )
+        for route in routes:
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return route, child_scope
+        return None, {}
+
+    def _get_version_trie(self, scope: TScope) -> t.Optional[RouteTrie]:
+        resolver = t.cast(
+            t.Optional["BaseAPIVersioningResolver"],
+            scope.get(SCOPE_API_VERSIONING_RESOLVER),
+        )
+        if resolver is None:
+            return None
+
+        version = resolver.resolve()
+        if str(version) == str(NOT_SET):
+            return None
+
+        key: _TVersionKey = (
+            version if version in self._known_versions else None,
+            version == str(resolver.default_version),
+        )
+        if key not in self._version_tries:
+            self._version_tries[key] = self._build_version_trie(*key)
+        return self._version_tries[key]
+
+    def _build_version_trie(
+        self, version: t.Optional[str], is_default: bool
+    ) -> t.Optional[RouteTrie]:
+        # mirrors `BaseAPIVersioningResolver.can_activate`
+        positions = [
+            position
+            for position, versions in enumerate(self._route_versions)
+            if versions is None or (version in versions if versions else is_default)
+        ]
+        if len(positions) == len(self._dispatch_routes):
+            # nothing to filter out
+            return None
+
+        trie = RouteTrie()
+        for position in positions:
+            trie.insert(position, self._dispatch_routes[position])
+        return trie
+
+    def get_candidate_routes(self, scope: TScope) -> t.Iterable[BaseRoute]:
+        """
+        Returns, in precedence order, the routes that may match the scope path.
+        Routes left out are guaranteed to return `Match.NONE` for this scope.
+        """
+        if self._regex_matcher is not None:
+            return self._regex_matcher.get_candidate_routes(get_route_path(scope))
+
+        positions = self._trie.lookup(get_route_path(scope))
+        if positions is None:
+            return self._dispatch_routes
+        return [self._dispatch_routes[i] for i in positions]
+
     def sort_routes(self) -> None:
-        # TODO: flatten the routes for faster look up
         self._served_routes = list(self._routes.values())
         self._served_routes.sort(
             key=lambda e: e.host if isinstance(e, Host) else e.path  # type: ignore
         )
+        self._dispatch_routes = self._served_routes
+        if self._flatten:
+            from .flatten import flatten_routes
+
+            self._dispatch_routes = flatten_routes(self._served_routes)
+
+        self._trie = RouteTrie(self._dispatch_routes)
+        self._regex_matcher = (
+            RegexRouteMatcher(self._dispatch_routes, self._trie)
+            if self._route_matcher == "regex"
+            else None
+        )
+        self._static_index = StaticRouteIndex(self._dispatch_routes, self._trie)
+        self._slash_redirect_index = SlashRedirectIndex(self._dispatch_routes)
+
+        self._route_versions = [
+            getattr(route, "allowed_version", None) for route in self._dispatch_routes
+        ]
+        self._known_versions = {
+            version for versions in self._route_versions for version in versions or ()
+        }
+        # built on demand, at most two tries per known version
+        self._version_tries = {}
+
+        if self._match_cache is not None:
+            self._match_cache.clear()
+
+    @classmethod
+    def _check_route_matcher(cls, route_matcher: str) -> None:
+        if route_matcher not in ROUTE_MATCHERS:
+            raise ImproperConfiguration(
+                f"Invalid route matcher '{route_matcher}'. Expected one of {ROUTE_MATCHERS}."
+            )
 
     def _compute_operation_hash(self, operation: BaseRoute) -> None:
         if not isinstance(operation, BaseRoute):
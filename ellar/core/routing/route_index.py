@@ -0,0 +1,144 @@
+import typing as t
+
+from ellar.common.types import TScope
+from starlette._utils import get_route_path
+from starlette.routing import PARAM_REGEX, BaseRoute, Host, Match, Mount, Route
+
+from .base import RouteOperationBase
+from .route_trie import RouteTrie
+
+__all__ = ["StaticRouteIndex", "SlashRedirectIndex"]
+
+
+def _get_static_path(route: BaseRoute) -> t.Optional[str]:
+    path = getattr(route, "path", None)
+    if (
+        isinstance(route, (Mount, Host))
+        or not isinstance(path, str)
+        or not path.startswith("/")
+        or PARAM_REGEX.search(path)
+    ):
+        return None
+    return path
+
+
+class StaticRouteIndex:
+    """
+    `(method, path)` hash index of routes without path parameters.
+
+    An entry is only created when every route that precedes the indexed routes
+    and can match the same path is itself one of the static routes registered for that path.
+    So when an indexed route matches, it is the same route a full scan would have picked.
+    When none of them matches, the caller falls back to the full scan.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, routes: t.Sequence[BaseRoute], trie: RouteTrie) -> None:
+        self._index: t.Dict[t.Tuple[str, str], t.Tuple[BaseRoute, ...]] = {}
+
+        groups: t.Dict[str, t.List[int]] = {}
+        for position, route in enumerate(routes):
+            path = _get_static_path(route)
+            if path is not None:
+                groups.setdefault(path, []).append(position)
+
+        for path, positions in groups.items():
+            candidates = trie.lookup(path)
+            if candidates is None:  # pragma: no cover
+                continue
+
+            by_method: t.Dict[str, t.List[int]] = {}
+            for position in positions:
+                methods = getattr(routes[position], "methods", None)
+                if not methods:
+                    # route accepts any method, leave the path to the full scan
+                    by_method.clear()
+                    break
+                for method in methods:
+                    by_method.setdefault(method, []).append(position)
+
+            static_positions = set(positions)
+            for method, indexed in by_method.items():
+                last = indexed[-1]
+                if all(c in static_positions for c in candidates if c < last):
+                    self._index[(method, path)] = tuple(routes[i] for i in indexed)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def match(self, scope: TScope) -> t.Tuple[t.Optional[BaseRoute], TScope]:
+        if scope["type"] != "http":
+            return None, {}
+
+        routes = self._index.get((scope["method"], get_route_path(scope)))
+        if routes is None:
+            return None, {}
+
+        for route in routes:
+            if type(route).matches is RouteOperationBase.matches:
+                # the path is an exact match, only the version is left to check
+                if t.cast(RouteOperationBase, route).can_activate_version(scope):
+                    return route, {
+                        "endpoint": route.endpoint,  # type:ignore[attr-defined]
+                        "path_params": dict(scope.get("path_params", {})),
+                    }
+                continue
+
+            match, child_scope = route.matches(scope)
+            if match == Match.FULL:
+                return route, child_scope
+
+        return None, {}
+
+
+def _get_unmatched_methods(route: BaseRoute) -> t.Optional[t.FrozenSet[str]]:
+    # HTTP methods for which `route.matches` may return `Match.NONE` on its own path,
+    # `None` when it is not known.
+    route_type = type(route)
+    if not isinstance(route, Route):
+        return None
+    if route_type.matches is Route.matches:
+        # full or partial match on any method
+        return frozenset()
+    if route_type.matches is RouteOperationBase.matches and route.methods:
+        # partial match on other methods, a full match can still be rejected by the version
+        return frozenset(route.methods)
+    return None
+
+
+class SlashRedirectIndex:
+    """
+    Index of paths without parameters used for `redirect_slashes`.
+
+    Maps each path to the HTTP methods for which the routes registered under it can still
+    return `Match.NONE`. A request to the slash variant of an indexed path with any other method
+    is redirected without matching routes again.
+    """
+
+    __slots__ = ("_index",)
+
+    def __init__(self, routes: t.Sequence[BaseRoute]) -> None:
+        self._index: t.Dict[str, t.FrozenSet[str]] = {}
+
+        for route in routes:
+            path = _get_static_path(route)
+            if path is None:
+                continue
+            unmatched = _get_unmatched_methods(route)
+            if unmatched is None:
+                continue
+            if path in self._index:
+                unmatched = self._index[path] & unmatched
+            self._index[path] = unmatched
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def match(self, scope: TScope) -> bool:
+        """
+        Returns `True` when a route is known to match the scope, at least partially.
+        `False` means the routes have to be matched.
+        """
+        unmatched = self._index.get(get_route_path(scope))
+        return unmatched is not None and scope["method"] not in unmatched
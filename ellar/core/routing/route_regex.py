@@ -0,0 +1,112 @@
+import bisect
+import re
+import typing as t
+
+from starlette.routing import BaseRoute, Host
+
+from .route_trie import RouteTrie
+
+__all__ = ["RegexRouteMatcher"]
+
+_NAMED_GROUP = re.compile(r"\(\?P<\w+>")
+# inline flags, lookarounds, conditionals, named or numbered backreferences
+_UNMERGEABLE = re.compile(r"\(\?(?!:)|\\[1-9]|\(\?P=")
+
+
+def _get_mergeable_pattern(route: BaseRoute) -> t.Optional[str]:
+    regex = getattr(route, "path_regex", None)
+    if isinstance(route, Host) or not isinstance(regex, re.Pattern):
+        return None
+
+    pattern = regex.pattern
+    if not (pattern.startswith("^") and pattern.endswith("$")):  # pragma: no cover
+        return None
+
+    # route parameters are extracted later by the winning route itself
+    pattern = _NAMED_GROUP.sub("(?:", pattern[1:-1])
+    if _UNMERGEABLE.search(pattern):
+        return None
+    try:
+        re.compile(pattern)
+    except re.error:  # pragma: no cover
+        return None
+    return pattern
+
+
+class RegexRouteMatcher:
+    """
+    Compiles the `path_regex` of every route into a single alternation regex.
+
+    A request path is matched in one pass and `lastgroup` gives the first route, in precedence order,
+    whose regex matches. Routes whose regex can not be merged, like `Host` routes or routes with
+    custom convertors using lookarounds or backreferences, are always returned as candidates.
+
+    The combined regex is compiled once, when the matcher is created. Routes after a matched one are
+    checked lazily with their own `path_regex`, among the positions given by the route trie.
+    """
+
+    __slots__ = ("_routes", "_trie", "_path_regexes", "_unmerged", "_regex")
+
+    def __init__(
+        self, routes: t.Sequence[BaseRoute], trie: t.Optional[RouteTrie] = None
+    ) -> None:
+        self._routes = routes
+        self._trie = trie
+        patterns: t.List[str] = []
+        # `path_regex` of the merged routes, by position
+        self._path_regexes: t.Dict[int, t.Pattern[str]] = {}
+        # positions of routes that are checked on every request
+        self._unmerged: t.List[int] = []
+
+        for position, route in enumerate(routes):
+            pattern = _get_mergeable_pattern(route)
+            if pattern is None:
+                self._unmerged.append(position)
+            else:
+                patterns.append(f"(?P<_{position}>{pattern})$")
+                self._path_regexes[position] = route.path_regex  # type: ignore[attr-defined]
+
+        self._regex: t.Optional[t.Pattern[str]] = (
+            re.compile(f"^(?:{'|'.join(patterns)})") if patterns else None
+        )
+
+    def match(self, route_path: str) -> t.Optional[int]:
+        """
+        Returns the position of the first merged route whose regex matches `route_path`.
+        """
+        if self._regex is None:
+            return None
+
+        match = self._regex.match(route_path)
+        if match is None:
+            return None
+        return int(t.cast(str, match.lastgroup)[1:])
+
+    def get_candidate_routes(self, route_path: str) -> t.Iterator[BaseRoute]:
+        """
+        Yields, in precedence order, the routes that may match `route_path`.
+
+        Merged routes are only yielded when their regex matches. The routes following a matched one
+        are checked lazily, when the matched route does not fully match, e.g. for `405` partial
+        matches or another API version.
+        """
+        position = self.match(route_path)
+        if position is None:
+            for i in self._unmerged:
+                yield self._routes[i]
+            return
+
+        for i in self._unmerged[: bisect.bisect_left(self._unmerged, position)]:
+            yield self._routes[i]
+        yield self._routes[position]
+
+        positions = self._trie.lookup(route_path) if self._trie is not None else None
+        following: t.Iterable[int] = (
+            range(position + 1, len(self._routes))
+            if positions is None
+            else positions[bisect.bisect_right(positions, position) :]
+        )
+        for i in following:
+            path_regex = self._path_regexes.get(i)
+            if path_regex is None or path_regex.match(route_path):
+                yield self._routes[i]
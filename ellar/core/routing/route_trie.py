@@ -0,0 +1,156 @@
+import re
+import typing as t
+
+from starlette.convertors import (
+    CONVERTOR_TYPES,
+    Convertor,
+    FloatConvertor,
+    IntegerConvertor,
+    PathConvertor,
+    StringConvertor,
+    UUIDConvertor,
+)
+from starlette.routing import PARAM_REGEX, BaseRoute, Host, Mount
+
+__all__ = ["RouteTrie"]
+
+# Convertors whose regex is known to never match across a `/`.
+# Any other convertor is treated like `path` and consumes the rest of the URL.
+_SEGMENT_CONVERTORS = (StringConvertor, IntegerConvertor, FloatConvertor, UUIDConvertor)
+
+
+class _TrieNode:
+    __slots__ = ("static", "params", "wildcard", "leaves", "tails")
+
+    def __init__(self) -> None:
+        self.static: t.Dict[str, "_TrieNode"] = {}
+        # keyed by convertor regex so routes sharing a typed segment share a node
+        self.params: t.Dict[str, t.Tuple[t.Pattern[str], "_TrieNode"]] = {}
+        self.wildcard: t.Optional["_TrieNode"] = None
+        # routes whose template ends exactly at this node
+        self.leaves: t.List[int] = []
+        # routes that accept one or more remaining segments from this node
+        self.tails: t.List[int] = []
+
+    def get_static(self, segment: str) -> "_TrieNode":
+        node = self.static.get(segment)
+        if node is None:
+            node = self.static[segment] = _TrieNode()
+        return node
+
+    def get_param(self, regex: str) -> "_TrieNode":
+        item = self.params.get(regex)
+        if item is None:
+            item = self.params[regex] = (re.compile(regex), _TrieNode())
+        return item[1]
+
+    def get_wildcard(self) -> "_TrieNode":
+        if self.wildcard is None:
+            self.wildcard = _TrieNode()
+        return self.wildcard
+
+
+class RouteTrie:
+    """
+    Segment trie compiled from a sorted list of routes.
+
+    The trie is used as a pre-filter: `lookup` returns, in their original order,
+    the positions of every route that can possibly match a path. Route precedence,
+    versioning and `405` partial matches are still decided by each route's `matches`,
+    but only the returned candidates are evaluated, so the cost of a lookup is bound
+    to the length of the path and not to the number of routes registered.
+    """
+
+    __slots__ = ("_root", "_always")
+
+    def __init__(self, routes: t.Sequence[BaseRoute] = ()) -> None:
+        self._root = _TrieNode()
+        # routes that can not be indexed by path, e.g. `Host`
+        self._always: t.List[int] = []
+
+        for index, route in enumerate(routes):
+            self.insert(index, route)
+
+    def insert(self, index: int, route: BaseRoute) -> None:
+        path = getattr(route, "path", None)
+        if isinstance(route, Host) or not isinstance(path, str):
+            self._always.append(index)
+            return
+
+        if isinstance(route, Mount):
+            # Mount compiles to `{mount.path}/{path:path}`
+            self._insert_template(index, path, is_mount=True)
+        elif path.startswith("/"):
+            self._insert_template(index, path, is_mount=False)
+        else:  # pragma: no cover
+            self._always.append(index)
+
+    def _insert_template(self, index: int, path: str, is_mount: bool) -> None:
+        node = self._root
+        segments = path[1:].split("/") if path else []
+
+        for segment in segments:
+            params = list(PARAM_REGEX.finditer(segment))
+            if not params:
+                node = node.get_static(segment)
+                continue
+
+            convertors = [self._get_convertor(item) for item in params]
+            if not all(isinstance(c, _SEGMENT_CONVERTORS) for c in convertors):
+                # `{name:path}` or custom convertor: accepts everything that follows
+                node.tails.append(index)
+                return
+
+            if len(params) == 1 and params[0].group(0) == segment:
+                node = node.get_param(convertors[0].regex)
+            else:
+                # mixed segment like `{name}.{ext}`, verified later by the route regex
+                node = node.get_wildcard()
+
+        if is_mount:
+            node.tails.append(index)
+        else:
+            node.leaves.append(index)
+
+    @classmethod
+    def _get_convertor(cls, param: t.Match[str]) -> Convertor:
+        _, convertor_type = param.groups("str")
+        return CONVERTOR_TYPES.get(convertor_type.lstrip(":"), PathConvertor())
+
+    def lookup(self, route_path: str) -> t.Optional[t.List[int]]:
+        """
+        Returns the sorted positions of routes that may match `route_path`.
+        `None` means the path can not be resolved by the trie and all routes must be checked.
+        """
+        if not route_path.startswith("/") or "\n" in route_path:
+            # `$` in route regex also matches before a trailing newline
+            return None
+
+        segments = route_path[1:].split("/")
+        size = len(segments)
+        found = list(self._always)
+        stack = [(self._root, 0)]
+
+        while stack:
+            node, depth = stack.pop()
+            if depth == size:
+                found.extend(node.leaves)
+                continue
+
+            if node.tails:
+                found.extend(node.tails)
+
+            segment = segments[depth]
+            child = node.static.get(segment)
+            if child is not None:
+                stack.append((child, depth + 1))
+
+            for pattern, child in node.params.values():
+                if pattern.fullmatch(segment):
+                    stack.append((child, depth + 1))
+
+            if node.wildcard is not None:
+                stack.append((node.wildcard, depth + 1))
+
+        found.sort()
+        return found
@@ -4,7 +4,7 @@ import typing as t
 
 from ellar.common.exceptions import WebSocketRequestValidationError
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 from ellar.common.params import WebsocketEndpointArgsModel
 from starlette import status
 from starlette.exceptions import WebSocketException
@@ -36,9 +36,8 @@ class WebSocketExtraHandler:
     async def dispatch(
         self, context: "IExecutionContext", **receiver_kwargs: t.Any
     ) -> None:
-        request_logger.debug(
-            f"Running Websocket Dispatch Action from '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Running Websocket Dispatch Action", self)
         websocket = context.switch_to_websocket().get_client()
         await self.execute_on_connect(context=context)
         close_code = status.WS_1000_NORMAL_CLOSURE
@@ -68,9 +67,8 @@ class WebSocketExtraHandler:
     async def _resolve_receiver_dependencies(
         self, context: "IExecutionContext", data: t.Any
     ) -> t.Dict:
-        request_logger.debug(
-            f"Resolving Receiver Dependencies from '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving Receiver Dependencies", self)
         res = await self.route_parameter_model.resolve_ws_body_dependencies(
             ctx=context, body_data=data
         )
@@ -92,16 +90,14 @@ class WebSocketExtraHandler:
         )
 
         receiver_kwargs.update(extra_kwargs)
-        request_logger.debug(
-            f"Executing on_receive handler from '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Executing on_receive handler", self)
         await self.on_receive(**receiver_kwargs)
 
     async def execute_on_connect(self, *, context: "IExecutionContext") -> None:
         if self.on_connect is not None:
-            request_logger.debug(
-                f"Executing on_connect handler from '{self.__class__.__name__}'"
-            )
+            if request_tracer.enabled:
+                request_tracer.trace("Executing on_connect handler", self)
             await self.on_connect(context.switch_to_websocket().get_client())
             return
         await context.switch_to_websocket().get_client().accept()
@@ -110,17 +106,15 @@ class WebSocketExtraHandler:
         self, *, context: "IExecutionContext", close_code: int
     ) -> None:
         if self.on_disconnect is not None:
-            request_logger.debug(
-                f"Executing on_disconnect handler from '{self.__class__.__name__}'"
-            )
+            if request_tracer.enabled:
+                request_tracer.trace("Executing on_disconnect handler", self)
             await self.on_disconnect(
                 context.switch_to_websocket().get_client(), close_code
             )
 
     async def decode(self, websocket: "WebSocket", message: Message) -> t.Any:
-        request_logger.debug(
-            f"Decoding websocket stream message from '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Decoding websocket stream message", self)
         if self.encoding == "text":
             if "text" not in message:
                 raise WebSocketException(
@@ -10,7 +10,7 @@ from ellar.common.exceptions import (
     WebSocketRequestValidationError,
 )
 from ellar.common.interfaces import IExecutionContext
-from ellar.common.logging import request_logger
+from ellar.common.logging import request_tracer
 from ellar.common.params import ExtraEndpointArg, WebsocketEndpointArgsModel
 from ellar.reflect import reflect
 from ellar.utils import get_name
@@ -86,13 +86,11 @@ class WebsocketRouteOperation(WebsocketRouteOperationBase, StarletteWebSocketRou
         self._handlers_kwargs.update({handler_name: handler})
 
     async def run(self, context: IExecutionContext, kwargs: t.Dict) -> t.Any:
-        request_logger.debug(
-            f"Running Websocket Endpoint handler from '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Running Websocket Endpoint handler", self)
         if self._use_extra_handler:
-            request_logger.debug(
-                f"Switched Websocket Extra Handler from '{self.__class__.__name__}'"
-            )
+            if request_tracer.enabled:
+                request_tracer.trace("Switched Websocket Extra Handler", self)
             ws_extra_handler_type = (
                 self._extra_handler_type or self.get_websocket_handler()
             )
@@ -105,9 +103,8 @@ class WebsocketRouteOperation(WebsocketRouteOperationBase, StarletteWebSocketRou
             return await self.endpoint(**kwargs)
 
     async def handle_request(self, context: IExecutionContext) -> t.Any:
-        request_logger.debug(
-            f"Resolving request handler dependencies '{self.__class__.__name__}'"
-        )
+        if request_tracer.enabled:
+            request_tracer.trace("Resolving request handler dependencies", self)
         res = await self.endpoint_parameter_model.resolve_dependencies(ctx=context)
         if res.errors:
             websocket = context.switch_to_websocket().get_client()
@@ -8,6 +8,7 @@ from pydantic import (
     GetCoreSchemaHandler,
     PrivateAttr,
     TypeAdapter,
+    ValidationError,
     create_model,
     field_validator,
     model_validator,
@@ -51,6 +52,7 @@ __all__ = [
     "BaseModel",
     "BaseConfig",
     "TypeAdapter",
+    "ValidationError",
     "EmailStr",
     "create_model",
     "as_pydantic_validator",
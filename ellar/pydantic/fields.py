@@ -67,6 +67,20 @@ class ModelField:
             ]
             return None, updated_loc_errors
 
+    def validate_json(
+        self,
+        value: t.Union[str, bytes],
+        *,
+        loc: t.Tuple[t.Union[int, str], ...] = (),
+    ) -> t.Tuple[t.Any, t.Union[t.List[t.Dict[str, t.Any]], None]]:
+        """Validates a JSON document without decoding it to python objects first"""
+        try:
+            return self._type_adapter.validate_json(value), None
+        except ValidationError as exc:
+            return None, [
+                {**err, "loc": loc + err.get("loc", ())} for err in exc.errors()
+            ]
+
     def serialize(
         self,
         value: t.Any,
@@ -78,6 +92,7 @@ class ModelField:
         exclude_unset: bool = False,
         exclude_defaults: bool = False,
         exclude_none: bool = False,
+        warnings: bool = True,
     ) -> t.Any:
         return self._type_adapter.dump_python(
             value,
@@ -88,6 +103,30 @@ class ModelField:
             exclude_unset=exclude_unset,
             exclude_defaults=exclude_defaults,
             exclude_none=exclude_none,
+            warnings=warnings,
+        )
+
+    def serialize_json(
+        self,
+        value: t.Any,
+        *,
+        include: t.Union[IncEx, None] = None,
+        exclude: t.Union[IncEx, None] = None,
+        by_alias: bool = True,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        warnings: bool = True,
+    ) -> bytes:
+        return self._type_adapter.dump_json(
+            value,
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            warnings=warnings,
         )
 
     def __hash__(self) -> int:
@@ -7,6 +7,7 @@ from uuid import uuid4
 import click.testing
 import pytest
 from ellar.reflect import reflect
+from ellar.testing import Test
 from pydantic import create_model
 from starlette.testclient import TestClient
 
@@ -22,6 +23,21 @@ def test_client_factory(anyio_backend_name, anyio_backend_options):
     )
 
 
+@pytest.fixture
+def config_test_module():
+    """
+    Creates test modules of the same routers, controllers or modules with other config settings:
+
+        config_test_module(routers=[router], COMPILE_ROUTE_PARAMETERS=True).get_test_client()
+    """
+
+    def _create(**kwargs):
+        config_module = {key: kwargs.pop(key) for key in list(kwargs) if key.isupper()}
+        return Test.create_test_module(config_module=config_module, **kwargs)
+
+    return _create
+
+
 @pytest.fixture(
     name="model_with_path", params=[PurePath, PurePosixPath, PureWindowsPath]
 )
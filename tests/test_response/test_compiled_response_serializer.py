@@ -0,0 +1,213 @@
+import logging
+import typing as t
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from ellar.common import (
+    ModuleRouter,
+    Serializer,
+    serializer_filter,
+)
+from ellar.common.responses import ORJSONResponse, RawJSONResponse
+from ellar.common.responses.models import JSONResponseModel
+from ellar.common.serializer import SerializerFilter
+from ellar.pydantic import BaseModel, Field, ModelField
+from ellar.testing import Test
+
+
+class Item(BaseModel):
+    name: str = Field(..., alias="aliased_name")
+    price: t.Optional[Decimal] = None
+    created: date = date(2024, 1, 1)
+    tags: t.List[str] = []
+
+
+class ItemSerializer(Serializer):
+    _filter = SerializerFilter(exclude={"tags"})
+
+    name: str
+    price: float = 0
+    tags: t.List[str] = []
+
+
+router = ModuleRouter("/items")
+
+
+@router.get("/one", response={200: Item})
+def get_one():
+    return {"aliased_name": "one", "price": "1.50", "tags": ["é"]}
+
+
+@router.get("/many", response=t.List[Item])
+def get_many():
+    return [Item(aliased_name="a"), Item(aliased_name="b", price=2)]
+
+
+@router.get("/filtered", response=Item)
+@serializer_filter(exclude_unset=True, exclude={"tags"})
+def get_filtered():
+    return Item(aliased_name="filtered", price=3, tags=["x"])
+
+
+@router.get("/serializer", response=ItemSerializer)
+def get_serializer():
+    return ItemSerializer(name="serializer", tags=["x"])
+
+
+@router.get("/invalid", response=Item)
+def get_invalid():
+    return {"price": "free"}
+
+
+@router.get("/status", response={200: Item, 201: t.Dict[str, int]})
+def get_status():
+    return {"created": 1}, 201
+
+
+@router.get("/untyped")
+def get_untyped():
+    return {"date": date(2024, 1, 1)}
+
+
+tm = Test.create_test_module(routers=[router])
+client = tm.get_test_client()
+
+compiled_tm = Test.create_test_module(
+    routers=[router], config_module={"COMPILE_RESPONSE_SERIALIZERS": True}
+)
+compiled_client = compiled_tm.get_test_client()
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/items/one",
+        "/items/many",
+        "/items/filtered",
+        "/items/serializer",
+        "/items/invalid",
+        "/items/status",
+        "/items/untyped",
+    ],
+)
+def test_compiled_serializer_returns_the_same_responses(path):
+    expected = client.get(path)
+    response = compiled_client.get(path)
+
+    assert response.status_code == expected.status_code
+    assert response.headers["content-type"] == expected.headers["content-type"]
+    assert response.json() == expected.json()
+
+
+def _get_response_models(app):
+    return {
+        (route.path, status_code): model
+        for mount in app.router.routes
+        for route in getattr(mount, "routes", ())
+        for status_code, model in route.get_execution_plan(
+            app
+        ).response_model.models.items()
+    }
+
+
+def test_compiled_serializer_dumps_json_once(monkeypatch):
+    calls = []
+
+    def _serialize(self, *args, **kwargs):  # pragma: no cover
+        calls.append(self)
+
+    monkeypatch.setattr(ModelField, "serialize", _serialize)
+    monkeypatch.setattr(ModelField, "serialize_json", _serialize)
+    response = compiled_client.get("/items/one")
+
+    assert (
+        response.content
+        == (
+            '{"aliased_name":"one","price":"1.50","created":"2024-01-01","tags":["é"]}'
+        ).encode()
+    )
+    assert calls == []
+
+
+def test_response_models_are_compiled_with_the_application():
+    models = _get_response_models(compiled_tm.create_application())
+
+    assert models[("/one", 200)].serializes_json is True
+    assert models[("/status", 201)].serializes_json is True
+    # responses without schema are still serialized by `serialize_object`
+    assert models[("/untyped", 200)].serializes_json is False
+    # the serializer filter of the route is bound to the compiled serializer
+    assert models[("/filtered", 200)]._json_serializer.keywords == {
+        "include": None,
+        "exclude": {"tags"},
+        "by_alias": True,
+        "exclude_unset": True,
+        "exclude_defaults": False,
+        "exclude_none": False,
+    }
+
+    assert not any(
+        model.serializes_json
+        for model in _get_response_models(tm.create_application()).values()
+    )
+
+
+def test_applications_sharing_operations_keep_their_response_models(
+    config_test_module,
+):
+    unvalidated_tm = config_test_module(
+        routers=[router],
+        COMPILE_RESPONSE_SERIALIZERS=True,
+        RESPONSE_VALIDATION="never",
+    )
+    compiled_models = _get_response_models(unvalidated_tm.create_application())
+    default_models = _get_response_models(tm.create_application())
+
+    assert compiled_models[("/one", 200)].serializes_json is True
+    assert not any(model.serializes_json for model in default_models.values())
+
+    unvalidated_client = unvalidated_tm.get_test_client()
+    for _ in range(2):
+        response = unvalidated_client.get("/items/invalid")
+        assert response.headers["content-type"] == "application/json"
+        assert response.status_code == 200
+        assert client.get("/items/invalid").status_code == 422
+
+
+@pytest.mark.parametrize(
+    "config, reason",
+    [
+        (
+            {"SERIALIZER_CUSTOM_ENCODER": {Decimal: str}},
+            "SERIALIZER_CUSTOM_ENCODER defines custom encoders",
+        ),
+        (
+            {"DEFAULT_JSON_CLASS": ORJSONResponse},
+            "DEFAULT_JSON_CLASS is ORJSONResponse",
+        ),
+    ],
+)
+def test_serializers_are_not_compiled_for_custom_json_encoding(
+    caplog, config_test_module, config, reason
+):
+    config_tm = config_test_module(
+        routers=[router], COMPILE_RESPONSE_SERIALIZERS=True, **config
+    )
+    with caplog.at_level(logging.WARNING, logger="ellar"):
+        app = config_tm.create_application()
+
+    assert f"COMPILE_RESPONSE_SERIALIZERS is turned off: {reason}" in caplog.text
+    assert not any(
+        model.serializes_json for model in _get_response_models(app).values()
+    )
+    response = config_tm.get_test_client().get("/items/one")
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_raw_json_response_sends_encoded_content():
+    response = RawJSONResponse(b'{"a":1}', status_code=201)
+
+    assert response.body == b'{"a":1}'
+    assert response.media_type == "application/json"
+    assert JSONResponseModel._json_serializer is None
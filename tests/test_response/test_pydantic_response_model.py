@@ -187,3 +187,22 @@ def test_valid_ellipsis(test_client_factory):
         "k1": {"aliased_name": "foo", "owner_ids": None, "price": None},
         "k3": {"aliased_name": "baz", "owner_ids": [1, 2, 3], "price": 2.0},
     }
+
+
+def test_route_serializer_filter_is_resolved_with_the_application(
+    test_client_factory, monkeypatch
+):
+    from ellar.reflect import reflect
+
+    client = test_client_factory(app)
+    get_metadata = type(reflect).get_metadata
+    keys = []
+
+    def _get_metadata(self, key, target):
+        keys.append(key)
+        return get_metadata(self, key, target)
+
+    monkeypatch.setattr(type(reflect), "get_metadata", _get_metadata)
+    response = client.get("/items/valid-exclude-unset")
+    assert response.json() == {"aliased_name": "valid", "price": 1.0}
+    assert common.constants.SERIALIZER_FILTER_KEY not in keys
@@ -0,0 +1,206 @@
+import typing as t
+
+import pytest
+from ellar.common import ModuleRouter, response_validation
+from ellar.common.constants import RESPONSE_VALIDATION_KEY
+from ellar.common.responses.models import ResponseModelField
+from ellar.pydantic import BaseModel
+from ellar.reflect import reflect
+from pydantic import ConfigDict
+
+
+class Item(BaseModel):
+    name: str
+    price: float = 0
+
+
+class Order(BaseModel):
+    items: t.List[Item]
+
+
+class Account(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    username: str
+
+
+class AccountORM:
+    def __init__(self, username: str, password: str) -> None:
+        self.username = username
+        self.password = password
+
+
+failures: t.List[t.Tuple[str, t.List[t.Dict]]] = []
+
+
+def _failure_hook(context, errors):
+    failures.append((context.get_handler().__name__, errors))
+
+
+router = ModuleRouter("/items")
+
+
+@router.get("/instance", response=Item)
+def get_instance():
+    return Item(name="instance", price=1)
+
+
+@router.get("/dict", response=Item)
+def get_dict():
+    return {"name": "dict", "price": "2"}
+
+
+@router.get("/invalid", response=Item)
+def get_invalid():
+    return {"price": "free"}
+
+
+@router.get("/never", response=Item)
+@response_validation("never")
+def get_never():
+    return {"name": "never", "price": 3, "secret": "undeclared"}
+
+
+@router.get("/never-orm", response=Account)
+@response_validation("never")
+def get_never_orm():
+    return AccountORM("john", "secret")
+
+
+@router.get("/never-nested", response=Order)
+@response_validation("never")
+def get_never_nested():
+    return {"items": [{"name": "a", "secret": "undeclared"}], "total": 1}
+
+
+@router.get("/sampled", response=Item)
+@response_validation("sample", sample_rate=1)
+def get_sampled():
+    return {"price": "free"}
+
+
+@router.get("/not-sampled", response=Item)
+@response_validation("sample", sample_rate=0)
+def get_not_sampled():
+    return {"price": "free"}
+
+
+@pytest.fixture(params=[False, True], ids=["python", "json"])
+def client_factory(request, config_test_module):
+    def _create(**config):
+        failures.clear()
+        return config_test_module(
+            routers=[router],
+            COMPILE_RESPONSE_SERIALIZERS=request.param,
+            RESPONSE_VALIDATION_FAILURE_HOOK=_failure_hook,
+            **config,
+        ).get_test_client()
+
+    return _create
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    calls = []
+    validate_object = ResponseModelField.validate_object
+
+    def _validate_object(self, obj):
+        calls.append(obj)
+        return validate_object(self, obj)
+
+    monkeypatch.setattr(ResponseModelField, "validate_object", _validate_object)
+    return calls
+
+
+def test_model_instances_are_not_validated_again(client_factory, validations):
+    response = client_factory().get("/items/instance")
+
+    assert response.json() == {"name": "instance", "price": 1.0}
+    assert validations == []
+
+
+def test_returned_objects_are_always_validated_by_default(client_factory, validations):
+    client = client_factory()
+
+    assert client.get("/items/dict").json() == {"name": "dict", "price": 2.0}
+    assert validations == [{"name": "dict", "price": "2"}]
+    assert client.get("/items/invalid").status_code == 422
+
+
+def test_never_policy_serializes_objects_without_validation(
+    client_factory, validations
+):
+    client = client_factory(RESPONSE_VALIDATION="never")
+
+    # values are not converted, and keys the schema does not declare are left out
+    assert client.get("/items/never").json() == {"name": "never", "price": 3}
+    assert client.get("/items/never-orm").json() == {"username": "john"}
+    assert client.get("/items/never-nested").json() == {"items": [{"name": "a"}]}
+    assert client.get("/items/dict").json() == {"name": "dict", "price": "2"}
+    assert client.get("/items/instance").json() == {"name": "instance", "price": 1.0}
+    assert client.get("/items/invalid").json() == {"price": "free"}
+    assert validations == []
+    assert failures == []
+
+
+def test_sampled_validation_failures_are_reported(client_factory):
+    client = client_factory()
+    response = client.get("/items/sampled")
+
+    assert response.status_code == 422
+    assert [
+        (name, [error["loc"] for error in errors]) for name, errors in failures
+    ] == [("get_sampled", [["response_model", "name"], ["response_model", "price"]])]
+
+
+def test_objects_not_sampled_are_not_validated(client_factory, validations):
+    response = client_factory().get("/items/not-sampled")
+
+    assert response.json() == {"price": "free"}
+    assert validations == []
+    assert failures == []
+
+
+def test_config_policy_applies_to_routes_without_policy(client_factory):
+    client = client_factory(
+        RESPONSE_VALIDATION="sample", RESPONSE_VALIDATION_SAMPLE_RATE=0
+    )
+    assert client.get("/items/invalid").status_code == 200
+    assert failures == []
+
+    client = client_factory(
+        RESPONSE_VALIDATION="sample", RESPONSE_VALIDATION_SAMPLE_RATE=1
+    )
+    assert client.get("/items/invalid").status_code == 422
+    assert [name for name, _ in failures] == ["get_invalid"]
+
+    # failures of the "always" policy are not sampled failures
+    assert client_factory().get("/items/invalid").status_code == 422
+    assert failures == []
+
+
+def test_response_validation_is_resolved_with_the_application(
+    client_factory, monkeypatch
+):
+    client = client_factory(
+        RESPONSE_VALIDATION="sample", RESPONSE_VALIDATION_SAMPLE_RATE=0
+    )
+    get_metadata = type(reflect).get_metadata
+    keys = []
+
+    def _get_metadata(self, key, target):
+        keys.append(key)
+        return get_metadata(self, key, target)
+
+    monkeypatch.setattr(type(reflect), "get_metadata", _get_metadata)
+    assert client.get("/items/sampled").status_code == 422
+    assert client.get("/items/invalid").status_code == 200
+    assert RESPONSE_VALIDATION_KEY not in keys
+    assert [name for name, _ in failures] == ["get_sampled"]
+
+
+def test_response_validation_policy_must_be_valid():
+    with pytest.raises(AssertionError):
+        response_validation("sometimes")
+    with pytest.raises(AssertionError):
+        response_validation("sample", sample_rate=2)
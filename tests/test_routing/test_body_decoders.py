@@ -0,0 +1,134 @@
+import email.message
+import math
+from unittest.mock import patch
+
+import pytest
+from ellar.common import Body, ModuleRouter
+from ellar.common.params import body_decoders
+from ellar.common.params.decoders import decode_json, parse_content_type
+from ellar.pydantic import BaseModel, ModelField
+from ellar.testing import Test
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+router = ModuleRouter("/decoders")
+
+
+@router.post("/item")
+def create_item(item: Item):
+    return item
+
+
+@router.post("/raw")
+def raw_body(body: str = Body()):
+    return {"body": body}
+
+
+tm = Test.create_test_module(routers=[router])
+client = tm.get_test_client()
+
+
+@pytest.mark.parametrize(
+    "content_type",
+    [
+        "application/json",
+        "Application/JSON; charset=utf-8",
+        " application/vnd.api+json ; q=1",
+        "text/plain",
+        "application",
+        "a/b/c",
+        "",
+    ],
+)
+def test_parse_content_type_matches_email_message(content_type):
+    message = email.message.Message()
+    message["content-type"] = content_type
+    assert parse_content_type(content_type) == (
+        message.get_content_maintype(),
+        message.get_content_subtype(),
+    )
+
+
+def test_body_decoders_lookup():
+    assert body_decoders.get_decoder(None) is decode_json
+    assert body_decoders.get_decoder("application/json; charset=utf-8") is decode_json
+    assert body_decoders.get_decoder("application/problem+json") is decode_json
+    assert body_decoders.get_decoder("text/json") is None
+    assert body_decoders.get_decoder("text/plain") is None
+
+
+def test_decode_json_falls_back_to_json_module():
+    assert decode_json(b'{"a": [1, 2]}') == {"a": [1, 2]}
+    # rejected by orjson
+    assert math.isnan(decode_json(b"NaN"))
+    assert decode_json('{"a": 1}'.encode("utf-16")) == {"a": 1}
+
+
+def test_registered_decoder_decodes_body():
+    assert client.post(
+        "/decoders/raw", content=b"a,b", headers={"content-type": "text/csv"}
+    ).json() == {"body": "a,b"}
+
+    body_decoders.register("text/*+csv", lambda body: body.decode().upper())
+    try:
+        response = client.post(
+            "/decoders/raw", content=b"a,b", headers={"content-type": "text/x+csv"}
+        )
+    finally:
+        body_decoders.unregister("text/*+csv")
+    assert response.json() == {"body": "A,B"}
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        b'{"name": "Foo", "price": 2.5}',
+        b'{"name": "Foo", "price": "x"}',
+        b'{"name": "Foo"',
+        b"",
+    ],
+)
+def test_validate_json_body_matches_decoded_body_validation(
+    config_test_module, content
+):
+    expected = client.post("/decoders/item", content=content)
+    validating_client = config_test_module(
+        routers=[router], VALIDATE_JSON_BODY=True
+    ).get_test_client()
+    response = validating_client.post(
+        "/decoders/item",
+        content=content,
+        headers={"content-type": "application/json"},
+    )
+
+    assert response.status_code == expected.status_code
+    assert response.json() == expected.json()
+
+
+def test_validate_json_body_skips_decoding(config_test_module):
+    validating_client = config_test_module(
+        routers=[router], VALIDATE_JSON_BODY=True
+    ).get_test_client()
+
+    with (
+        patch.object(
+            ModelField,
+            "validate_json",
+            autospec=True,
+            side_effect=ModelField.validate_json,
+        ) as validate_json,
+        patch.object(
+            ModelField, "validate", autospec=True, side_effect=ModelField.validate
+        ) as validate,
+    ):
+        response = validating_client.post(
+            "/decoders/item", json={"name": "Foo", "price": 2.5}
+        )
+
+    assert response.json() == {"name": "Foo", "price": 2.5}
+    assert [call.args[0].name for call in validate_json.call_args_list] == ["item"]
+    assert "item" not in [call.args[0].name for call in validate.call_args_list]
@@ -291,6 +291,10 @@ def test_wrong_headers():
 
 def test_other_exceptions():
     client = tm.get_test_client()
-    with patch("json.loads", side_effect=Exception):
+    # decoded with `json` when orjson is not installed
+    with (
+        patch("ellar.common.params.decoders.orjson", None),
+        patch("json.loads", side_effect=Exception),
+    ):
         response = client.post("/product", json={"test": "test2"})
         assert response.status_code == 400, response.text
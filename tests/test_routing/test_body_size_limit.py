@@ -0,0 +1,126 @@
+import typing as t
+
+import pytest
+from ellar.common import (
+    Body,
+    Controller,
+    ControllerBase,
+    ModuleRouter,
+    max_body_size,
+    post,
+)
+from ellar.common.exceptions import RequestEntityTooLarge
+from ellar.core.connection import Request
+from ellar.core.routing.body_limit import limit_request_body
+from ellar.testing import Test
+
+router = ModuleRouter("/router")
+
+
+@router.post("/limited")
+@max_body_size(10)
+def limited(items: t.List[int] = Body()):
+    return {"count": len(items)}
+
+
+@router.post("/unlimited")
+def unlimited(items: t.List[int] = Body()):
+    return {"count": len(items)}
+
+
+@router.post("/raw")
+@max_body_size(10)
+async def raw(request: Request):
+    return {"size": len(await request.body())}
+
+
+@Controller("/controller")
+@max_body_size(10)
+class LimitedController(ControllerBase):
+    @post("/default")
+    def default(self, items: t.List[int] = Body()):
+        return {"count": len(items)}
+
+    @post("/override")
+    @max_body_size(100)
+    def override(self, items: t.List[int] = Body()):
+        return {"count": len(items)}
+
+
+tm = Test.create_test_module(routers=[router], controllers=[LimitedController])
+client = tm.get_test_client()
+
+
+def _chunks(body: bytes) -> t.Iterator[bytes]:
+    for index in range(0, len(body), 4):
+        yield body[index : index + 4]
+
+
+@pytest.mark.parametrize(
+    "path, body, status_code",
+    [
+        ("/router/limited", b"[1,2,3,4]", 200),
+        ("/router/limited", b"[1,2,3,4,5]", 413),
+        ("/router/unlimited", b"[1,2,3,4,5]", 200),
+        ("/router/raw", b"[1,2,3,4,5]", 413),
+        ("/controller/default", b"[1,2,3,4,5]", 413),
+        ("/controller/override", b"[1,2,3,4,5]", 200),
+    ],
+)
+def test_route_and_controller_body_size_limits(path, body, status_code):
+    response = client.post(path, content=body)
+    chunked = client.post(path, content=_chunks(body))
+
+    assert response.status_code == chunked.status_code == status_code
+    if status_code == 413:
+        assert response.json() == {"detail": "Request Entity Too Large"}
+
+
+def test_max_request_body_size_config_applies_to_routes_without_limit(
+    config_test_module,
+):
+    limited_client = config_test_module(
+        routers=[router], controllers=[LimitedController], MAX_REQUEST_BODY_SIZE=5
+    ).get_test_client()
+
+    assert limited_client.post("/router/unlimited", content=b"[1,2]").status_code == 200
+    assert (
+        limited_client.post("/router/unlimited", content=b"[1,2,3]").status_code == 413
+    )
+    assert (
+        limited_client.post("/controller/override", content=b"[1,2,3]").status_code
+        == 200
+    )
+    # the limit belongs to the application built with it
+    assert client.post("/router/unlimited", content=b"[1,2,3]").status_code == 200
+
+
+def test_content_length_is_checked_before_reading_the_body():
+    scope = {"type": "http", "headers": [(b"content-length", b"11")]}
+
+    async def receive():  # pragma: no cover
+        raise AssertionError("the body must not be read")
+
+    with pytest.raises(RequestEntityTooLarge):
+        limit_request_body(scope, receive, 10)
+
+
+@pytest.mark.asyncio
+async def test_streamed_body_is_rejected_as_soon_as_the_limit_is_crossed():
+    messages = [
+        {"type": "http.request", "body": b"x" * 6, "more_body": True},
+        {"type": "http.request", "body": b"x" * 6, "more_body": True},
+        {"type": "http.request", "body": b"x" * 6, "more_body": False},
+    ]
+    received = []
+
+    async def receive():
+        received.append(messages[len(received)])
+        return received[-1]
+
+    limited_receive = limit_request_body({"type": "http", "headers": []}, receive, 10)
+    assert await limited_receive() == messages[0]
+    with pytest.raises(RequestEntityTooLarge):
+        await limited_receive()
+
+    assert len(received) == 2
@@ -0,0 +1,236 @@
+import linecache
+import typing as t
+
+import pytest
+from ellar.common import Controller, Cookie, Header, Inject, ModuleRouter, Query, get
+from ellar.common.params.args.compiler import (
+    CompiledEndpointArgsResolver,
+    ParametersValidator,
+)
+from ellar.core.connection import Request
+from ellar.pydantic import BaseModel
+from ellar.testing import Test
+
+
+class Filter(BaseModel):
+    limit: int = 10
+    offset: int = 0
+
+
+router = ModuleRouter("/items")
+
+
+@router.get("/{item_id:int}")
+async def get_item(
+    item_id: int,
+    request: Inject[Request],
+    x_token: str = Header(),
+    x_tags: t.List[str] = Header([]),
+    q: t.Optional[str] = None,
+    page: int = Query(1, gt=0),
+    ids: t.List[int] = Query(None),
+    session_id: t.Optional[int] = Cookie(None),
+    filters: Filter = Query(),
+):
+    return {
+        "item_id": item_id,
+        "path": request.url.path,
+        "x_token": x_token,
+        "x_tags": x_tags,
+        "q": q,
+        "page": page,
+        "ids": ids,
+        "session_id": session_id,
+        "filters": filters.model_dump(),
+    }
+
+
+tm = Test.create_test_module(routers=[router])
+app = tm.create_application()
+client = tm.get_test_client()
+
+
+def _get_parameter_model(app, path):
+    for mount in app.router.routes:
+        for route in getattr(mount, "routes", ()):
+            if getattr(route, "path", None) == path:
+                return route.get_execution_plan(app).endpoint_args_model
+    raise AssertionError(path)  # pragma: no cover
+
+
+@pytest.mark.parametrize(
+    "path, params, headers, cookies",
+    [
+        ("/items/1", {}, {"x-token": "secret"}, {}),
+        (
+            "/items/2",
+            {"q": "search", "page": 3, "ids": [1, 2], "limit": 5},
+            [("x-token", "secret"), ("x-tags", "a"), ("x-tags", "b")],
+            {"session_id": "42"},
+        ),
+        ("/items/3", {"page": 0, "ids": ["a"], "offset": "x"}, {}, {"session_id": "x"}),
+    ],
+)
+@pytest.mark.parametrize("single_pass", [False, True])
+def test_compiled_resolver_matches_parameter_resolvers(
+    config_test_module, path, params, headers, cookies, single_pass
+):
+    compiled_tm = config_test_module(
+        routers=[router],
+        COMPILE_ROUTE_PARAMETERS=True,
+        SINGLE_PASS_PARAMETER_VALIDATION=single_pass,
+    )
+    compiled_client = compiled_tm.get_test_client()
+    compiled = _get_parameter_model(
+        compiled_tm.create_application(), "/{item_id:int}"
+    ).compiled_resolver
+    assert compiled.single_validation is single_pass
+
+    expected = client.get(path, params=params, headers=headers, cookies=cookies)
+    response = compiled_client.get(
+        path, params=params, headers=headers, cookies=cookies
+    )
+
+    assert response.status_code == expected.status_code
+    assert response.json() == expected.json()
+
+
+@pytest.mark.parametrize("single_pass", [False, True])
+def test_compiled_resolver_reports_the_same_errors(config_test_module, single_pass):
+    compiled_client = config_test_module(
+        routers=[router],
+        COMPILE_ROUTE_PARAMETERS=True,
+        SINGLE_PASS_PARAMETER_VALIDATION=single_pass,
+    ).get_test_client()
+
+    expected = client.get("/items/1", params={"page": 0}, cookies={"session_id": "x"})
+    response = compiled_client.get(
+        "/items/1", params={"page": 0}, cookies={"session_id": "x"}
+    )
+
+    assert response.status_code == 422
+    assert response.json() == expected.json()
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["header", "x-token"],
+        ["query", "page"],
+        ["cookie", "session_id"],
+    ]
+
+
+def test_compiled_resolver_source_can_be_inspected(config_test_module):
+    compiled_app = config_test_module(
+        routers=[router], COMPILE_ROUTE_PARAMETERS=True
+    ).create_application()
+    compiled = _get_parameter_model(compiled_app, "/{item_id:int}").compiled_resolver
+
+    assert isinstance(compiled, CompiledEndpointArgsResolver)
+    assert compiled.source.startswith(f"async def {compiled.name}(ctx):")
+    assert "headers.get('x-token')" in compiled.source
+    assert "path_params.get('item_id')" in compiled.source
+    # the Inject and grouped query parameters are resolved by their resolvers
+    assert compiled.source.count(".resolve(ctx=ctx)") == 2
+
+    filename = compiled.resolve.__code__.co_filename
+    assert linecache.getline(filename, 1) == f"async def {compiled.name}(ctx):\n"
+
+
+def test_route_parameters_are_not_compiled_by_default():
+    model = _get_parameter_model(app, "/{item_id:int}")
+
+    assert model.compiled_resolver is None
+    compiled = model.compile()
+    assert compiled is model.compiled_resolver is model.compile()
+
+    model.build_model()
+    assert model.compiled_resolver is None
+
+
+def test_single_pass_validation_validates_parameters_once(
+    config_test_module, monkeypatch
+):
+    single_pass_tm = config_test_module(
+        routers=[router], SINGLE_PASS_PARAMETER_VALIDATION=True
+    )
+    single_pass_client = single_pass_tm.get_test_client()
+    compiled = _get_parameter_model(
+        single_pass_tm.create_application(), "/{item_id:int}"
+    ).compiled_resolver
+    assert compiled.source.count("validator.validate(inputs)") == 1
+    assert ".validate(value_" not in compiled.source
+
+    calls = []
+    validate = ParametersValidator.validate
+
+    def _validate(self, inputs):
+        calls.append(sorted(inputs))
+        return validate(self, inputs)
+
+    monkeypatch.setattr(ParametersValidator, "validate", _validate)
+    response = single_pass_client.get(
+        "/items/1", params={"ids": [1, "a"]}, headers={"x-token": "secret"}
+    )
+
+    # the q and page query parameters have no value, and the item_id path parameter
+    # is already converted to int: they are not validated
+    assert calls == [["p0", "p1", "p5", "p7"]]
+    assert response.status_code == 422
+    assert [
+        (error["type"], error["loc"], error["input"])
+        for error in response.json()["detail"]
+    ] == [("int_parsing", ["query", "ids", 1], "a")]
+
+
+def test_parameters_validator_maps_errors_to_parameters_location():
+    model = _get_parameter_model(app, "/{item_id:int}")
+    fields = {
+        f"p{position}": resolver.model_field
+        for position, resolver in enumerate(model.get_route_models())
+        if getattr(resolver, "model_field", None)
+        and resolver.model_field.name in ("page", "ids")
+    }
+    validator = ParametersValidator("parameters", fields)
+    page, ids = fields
+
+    assert validator.validate({page: "2", ids: ["1"]}) == ({page: 2, ids: [1]}, {})
+    values, errors = validator.validate({page: "0", ids: ["x", "y"]})
+    assert values == {}
+    assert [error["loc"] for error in errors[page]] == [("query", "page")]
+    assert [error["loc"] for error in errors[ids]] == [
+        ("query", "ids", 0),
+        ("query", "ids", 1),
+    ]
+
+
+@Controller("/shared")
+class SharedController:
+    @get("/{item_id:int}")
+    def get_item(self, item_id: int, q: t.Optional[str] = None):
+        return {"item_id": item_id, "q": q}
+
+
+def test_applications_sharing_operations_do_not_share_compiled_resolvers(
+    config_test_module,
+):
+    compiled_tm = config_test_module(
+        controllers=[SharedController],
+        COMPILE_ROUTE_PARAMETERS=True,
+        SINGLE_PASS_PARAMETER_VALIDATION=True,
+    )
+    shared_tm = config_test_module(controllers=[SharedController])
+    other_tm = config_test_module(
+        controllers=[SharedController], COMPILE_ROUTE_PARAMETERS=True
+    )
+    compiled_app = compiled_tm.create_application()
+
+    compiled = _get_parameter_model(compiled_app, "/{item_id:int}")
+    assert compiled.compiled_resolver.single_validation is True
+    shared_app = shared_tm.create_application()
+    assert _get_parameter_model(shared_app, "/{item_id:int}").compiled_resolver is None
+    other = _get_parameter_model(other_tm.create_application(), "/{item_id:int}")
+    assert other.compiled_resolver.single_validation is False
+
+    clients = (compiled_tm.get_test_client(), shared_tm.get_test_client())
+    for _client in (*clients, clients[0]):
+        response = _client.get("/shared/1", params={"q": "x"})
+        assert response.json() == {"item_id": 1, "q": "x"}
+    assert _get_parameter_model(compiled_app, "/{item_id:int}") is compiled
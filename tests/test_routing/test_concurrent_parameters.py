@@ -0,0 +1,193 @@
+import typing as t
+
+import anyio
+import pytest
+from ellar.common import IExecutionContext, ModuleRouter, Query
+from ellar.common.exceptions import HTTPException
+from ellar.common.params import SystemParameterResolver
+from ellar.common.params.resolvers.base import ResolverResult
+from ellar.pydantic import get_missing_field_error
+from ellar.testing import Test
+
+events: t.List[t.Tuple[str, str]] = []
+
+
+class DelayedParameter(SystemParameterResolver):
+    """Waits `data` seconds, then reads the query parameter of the same name"""
+
+    async def resolve(self, ctx: IExecutionContext, **kwargs: t.Any) -> ResolverResult:
+        events.append(("start", self.parameter_name))
+        await anyio.sleep(self.data)
+        events.append(("end", self.parameter_name))
+
+        query_params = ctx.switch_to_http_connection().get_request().query_params
+        value = query_params.get(self.parameter_name)
+        if value == "raise":
+            raise HTTPException(status_code=418, detail=self.parameter_name)
+        if value is None:
+            return ResolverResult(
+                None, [get_missing_field_error(loc=("query", self.parameter_name))], {}
+            )
+        return ResolverResult(
+            {self.parameter_name: value}, [], self.create_raw_data(value)
+        )
+
+
+class TaskParameter(SystemParameterResolver):
+    awaits_io = False
+
+    async def resolve(self, ctx: IExecutionContext, **kwargs: t.Any) -> ResolverResult:
+        task_id = anyio.get_current_task().id
+        return ResolverResult({self.parameter_name: task_id}, [], {})
+
+
+router = ModuleRouter("/concurrent")
+
+
+@router.get("/")
+async def endpoint(
+    slow: str = DelayedParameter(0.05),
+    fast: str = DelayedParameter(0),
+    page: int = Query(),
+    task_id: int = TaskParameter(),
+):
+    return {
+        "slow": slow,
+        "fast": fast,
+        "page": page,
+        "inline": task_id == anyio.get_current_task().id,
+    }
+
+
+tm = Test.create_test_module(routers=[router])
+client = tm.get_test_client()
+
+concurrent_tm = Test.create_test_module(
+    routers=[router], config_module={"CONCURRENT_PARAMETER_RESOLUTION": True}
+)
+concurrent_client = concurrent_tm.get_test_client()
+
+
+@pytest.fixture(autouse=True)
+def clear_events():
+    events.clear()
+
+
+def test_parameters_are_resolved_one_after_another_by_default():
+    response = client.get("/concurrent/", params={"slow": "a", "fast": "b", "page": 1})
+
+    assert response.json() == {"slow": "a", "fast": "b", "page": 1, "inline": True}
+    assert events == [
+        ("start", "slow"),
+        ("end", "slow"),
+        ("start", "fast"),
+        ("end", "fast"),
+    ]
+
+
+def test_parameters_waiting_on_io_are_resolved_concurrently():
+    response = concurrent_client.get(
+        "/concurrent/", params={"slow": "a", "fast": "b", "page": 1}
+    )
+
+    # parameters that do not wait on I/O still run inline in the request task
+    assert response.json() == {"slow": "a", "fast": "b", "page": 1, "inline": True}
+    assert events == [
+        ("start", "slow"),
+        ("start", "fast"),
+        ("end", "fast"),
+        ("end", "slow"),
+    ]
+
+
+def test_concurrent_resolution_errors_keep_resolution_order():
+    sequential = client.get("/concurrent/")
+    concurrent = concurrent_client.get("/concurrent/")
+
+    assert concurrent.status_code == sequential.status_code == 422
+    assert concurrent.json() == sequential.json()
+    assert [error["loc"] for error in concurrent.json()["detail"]] == [
+        ["query", "page"],
+        ["query", "slow"],
+        ["query", "fast"],
+    ]
+
+
+def test_concurrent_resolution_raises_the_first_exception():
+    response = concurrent_client.get(
+        "/concurrent/", params={"slow": "raise", "fast": "raise", "page": 1}
+    )
+
+    # `fast` raised first, `slow` comes first in resolution order
+    assert response.status_code == 418
+    assert response.json()["detail"] == "slow"
+    assert ("end", "slow") in events
+
+
+def _get_parameter_model(app, path):
+    for mount in app.router.routes:
+        for route in getattr(mount, "routes", ()):
+            if getattr(route, "path", None) == path:
+                return route.get_execution_plan(app).endpoint_args_model
+    raise AssertionError(path)  # pragma: no cover
+
+
+def test_concurrent_resolution_needs_two_parameters_waiting_on_io():
+    single_router = ModuleRouter("/single")
+
+    @single_router.get("/one")
+    def single(slow: str = DelayedParameter(0), page: int = Query()):
+        return {"slow": slow, "page": page}
+
+    app = Test.create_test_module(routers=[router, single_router]).create_application()
+
+    assert _get_parameter_model(app, "/")._concurrent_route_models
+    assert not _get_parameter_model(app, "/one")._concurrent_route_models
+
+
+def test_concurrent_resolution_is_configured_when_the_application_is_built():
+    model = _get_parameter_model(concurrent_tm.create_application(), "/")
+    assert model._concurrent_resolution is True
+
+    other_app = tm.create_application()
+    assert _get_parameter_model(other_app, "/")._concurrent_resolution is False
+    assert model._concurrent_resolution is True
+
+
+def test_parameters_waiting_on_io_are_compiled_without_concurrent_resolution(
+    config_test_module,
+):
+    compiled_tm = config_test_module(routers=[router], COMPILE_ROUTE_PARAMETERS=True)
+    model = _get_parameter_model(compiled_tm.create_application(), "/")
+
+    assert model._concurrent_route_models
+    assert model.compiled_resolver is not None
+    response = compiled_tm.get_test_client().get(
+        "/concurrent/", params={"slow": "a", "fast": "b", "page": 1}
+    )
+    assert response.json() == {"slow": "a", "fast": "b", "page": 1, "inline": True}
+    assert events == [
+        ("start", "slow"),
+        ("end", "slow"),
+        ("start", "fast"),
+        ("end", "fast"),
+    ]
+
+    model.set_concurrent_resolution(True)
+    assert model.compiled_resolver is None
+    assert model.compile() is None
+    # the model is shared by the applications with the same settings
+    model.set_concurrent_resolution(False)
+    model.compile()
+
+
+def test_concurrent_resolution_is_not_compiled(config_test_module):
+    app = config_test_module(
+        routers=[router],
+        COMPILE_ROUTE_PARAMETERS=True,
+        CONCURRENT_PARAMETER_RESOLUTION=True,
+    ).create_application()
+    model = _get_parameter_model(app, "/")
+
+    assert model._concurrent_resolution is True
+    assert model.compiled_resolver is None
@@ -0,0 +1,191 @@
+import typing as t
+from unittest.mock import patch
+
+from ellar.common import (
+    Controller,
+    ControllerBase,
+    EllarInterceptor,
+    GuardCanActivate,
+    IExecutionContext,
+    ModuleRouter,
+    UseGuards,
+    UseInterceptors,
+    get,
+)
+from ellar.core.guards import GuardConsumer
+from ellar.core.interceptors import EllarInterceptorConsumer
+from ellar.core.services import Reflector
+from ellar.di import injectable, request_scope
+from ellar.testing import Test
+
+
+@injectable
+class SingletonGuard(GuardCanActivate):
+    async def can_activate(self, context: IExecutionContext) -> bool:
+        return True
+
+
+@injectable(scope=request_scope)
+class RequestGuard(GuardCanActivate):
+    instances = 0
+
+    def __init__(self) -> None:
+        RequestGuard.instances += 1
+
+    async def can_activate(self, context: IExecutionContext) -> bool:
+        return (
+            context.switch_to_http_connection().get_request().query_params.get("allow")
+            == "true"
+        )
+
+
+class GlobalGuard(GuardCanActivate):
+    async def can_activate(self, context: IExecutionContext) -> bool:
+        return False
+
+
+class OrderInterceptor(EllarInterceptor):
+    name = "instance"
+
+    async def intercept(
+        self, context: IExecutionContext, next_interceptor: t.Callable[..., t.Coroutine]
+    ) -> t.Any:
+        data = await next_interceptor()
+        data["order"].append(self.name)
+        return data
+
+
+@injectable
+class SingletonOrderInterceptor(OrderInterceptor):
+    name = "singleton"
+
+
+@Controller("/plan")
+class PlanController(ControllerBase):
+    @UseGuards(SingletonGuard, RequestGuard)
+    @UseInterceptors(SingletonOrderInterceptor, OrderInterceptor())
+    @get("/guarded")
+    async def guarded(self):
+        return {"order": []}
+
+    @get("/open")
+    async def open(self):
+        return {"order": []}
+
+
+def _get_operation(app, path):
+    for mount in app.router.routes:
+        for route in getattr(mount, "routes", ()):
+            if getattr(route, "path", None) == path:
+                return route
+    raise AssertionError(path)  # pragma: no cover
+
+
+def test_execution_plan_is_built_with_application():
+    tm = Test.create_test_module(controllers=[PlanController])
+    app = tm.create_application()
+    plan = _get_operation(app, "/guarded")._execution_plan
+
+    assert plan is not None and plan.app is app
+    singleton_guard, request_guard = plan.get_guards()
+    # singletons are resolved once, request scoped guards per request
+    assert isinstance(singleton_guard, SingletonGuard)
+    assert request_guard is RequestGuard
+    assert [type(item) for item in plan.get_interceptors()] == [
+        SingletonOrderInterceptor,
+        OrderInterceptor,
+    ]
+    assert plan.uses_global_guards is False
+
+
+def test_execution_plan_skips_metadata_lookups_per_request():
+    tm = Test.create_test_module(controllers=[PlanController])
+    client = tm.get_test_client()
+
+    RequestGuard.instances = 0
+    with patch.object(
+        Reflector,
+        "get_all_and_override",
+        autospec=True,
+        side_effect=Reflector.get_all_and_override,
+    ) as get_all_and_override:
+        response = client.get("/plan/guarded", params={"allow": "true"})
+        assert response.json() == {"order": ["instance", "singleton"]}
+        assert client.get("/plan/guarded").status_code == 403
+
+    assert get_all_and_override.call_count == 0
+    assert RequestGuard.instances == 2
+
+
+def test_execution_plan_follows_global_guards():
+    tm = Test.create_test_module(controllers=[PlanController])
+    app = tm.create_application()
+    client = tm.get_test_client()
+
+    assert client.get("/plan/open").status_code == 200
+    assert _get_operation(app, "/open")._execution_plan.uses_global_guards
+
+    app.use_global_guards(GlobalGuard())
+    assert client.get("/plan/open").status_code == 403
+    # guards of the route override global guards
+    assert client.get("/plan/guarded", params={"allow": "true"}).status_code == 200
+
+
+def test_execution_plan_is_rebuilt_for_another_application():
+    router = ModuleRouter("/shared")
+
+    @router.get("/")
+    def shared():
+        return {"order": []}
+
+    first = Test.create_test_module(routers=[router])
+    second = Test.create_test_module(routers=[router])
+    first_app, second_app = first.create_application(), second.create_application()
+
+    # the same operation is shared by both applications
+    operation = _get_operation(second_app, "/")
+    assert operation is _get_operation(first_app, "/")
+    assert operation._execution_plan.app is second_app
+
+    assert first.get_test_client().get("/shared/").status_code == 200
+    assert operation._execution_plan.app is first_app
+
+
+def test_fast_path_skips_guards_and_interceptors_consumers():
+    tm = Test.create_test_module(controllers=[PlanController])
+    app = tm.create_application()
+    client = tm.get_test_client()
+
+    assert _get_operation(app, "/open").get_execution_plan(app).fast_path
+    assert not _get_operation(app, "/guarded").get_execution_plan(app).fast_path
+
+    with (
+        patch.object(
+            GuardConsumer, "execute", autospec=True, side_effect=GuardConsumer.execute
+        ) as guards_execute,
+        patch.object(
+            EllarInterceptorConsumer,
+            "execute",
+            autospec=True,
+            side_effect=EllarInterceptorConsumer.execute,
+        ) as interceptors_execute,
+    ):
+        assert client.get("/plan/open").json() == {"order": []}
+        assert guards_execute.call_count == 0
+        assert interceptors_execute.call_count == 0
+
+        client.get("/plan/guarded", params={"allow": "true"})
+        assert guards_execute.call_count == 1
+        assert interceptors_execute.call_count == 1
+
+
+def test_fast_path_is_left_when_global_guards_are_added():
+    tm = Test.create_test_module(controllers=[PlanController])
+    app = tm.create_application()
+    client = tm.get_test_client()
+    plan = _get_operation(app, "/open").get_execution_plan(app)
+
+    assert plan.fast_path
+    app.use_global_guards(GlobalGuard())
+    assert not plan.fast_path
+    assert client.get("/plan/open").status_code == 403
@@ -0,0 +1,130 @@
+import pytest
+from ellar.common import (
+    Controller,
+    IHostContext,
+    ModuleRouter,
+    Version,
+    get,
+    post,
+)
+from ellar.core import Request
+from ellar.core.middleware import FunctionBasedMiddleware, Middleware
+from ellar.core.routing import EllarControllerMount
+from ellar.core.routing.flatten import FlattenedMountRoute, flatten_routes
+from ellar.core.versioning import UrlPathAPIVersioning
+from ellar.reflect import reflect
+from ellar.testing import Test
+from starlette.routing import Mount
+
+
+async def callable_middleware(ctx: IHostContext, call_next):
+    scope, _, _ = ctx.get_args()
+    scope["callable_middleware"] = "executed"
+    await call_next()
+
+
+@Controller(
+    "/cats/{org_id:int}",
+    middleware=[Middleware(FunctionBasedMiddleware, dispatch=callable_middleware)],
+)
+class CatController:
+    @get("/")
+    async def list_cats(self, request: Request):
+        return {
+            "org_id": request.path_params["org_id"],
+            "middleware": request.scope["callable_middleware"],
+            "root_path": request.scope["root_path"],
+        }
+
+    @get("/{cat_id:int}")
+    async def get_cat(self, cat_id: int, request: Request):
+        return {"org_id": request.path_params["org_id"], "cat_id": cat_id}
+
+    @post("/create")
+    async def create_cat(self, request: Request):
+        return {"org_id": request.path_params["org_id"], "created": True}
+
+    @get("/versioned")
+    @Version("1")
+    async def versioned_v1(self):
+        return {"version": "1"}
+
+    @get("/versioned")
+    @Version("2")
+    async def versioned_v2(self):
+        return {"version": "2"}
+
+
+@pytest.fixture(params=[True, False], ids=["flattened", "nested"])
+def client(request):
+    with reflect.context():
+        sub_router = ModuleRouter("/sub")
+
+        @sub_router.get("/items/{name}")
+        def get_item(name: str, req: Request):
+            return {"name": name, "root_path": req.scope["root_path"]}
+
+        router = ModuleRouter("/dogs")
+        router.add_router(sub_router)
+
+        @router.get("/")
+        def list_dogs():
+            return {"dogs": True}
+
+        tm = Test.create_test_module(
+            controllers=[CatController],
+            routers=[router],
+            config_module={
+                "FLATTEN_ROUTES": request.param,
+                "VERSIONING_SCHEME": UrlPathAPIVersioning(),
+            },
+        )
+        app = tm.create_application()
+
+        dispatch_routes = app.router.routes._dispatch_routes
+        flattened = [
+            route for route in dispatch_routes if isinstance(route, FlattenedMountRoute)
+        ]
+        assert bool(flattened) is request.param
+        assert all(not isinstance(r, EllarControllerMount) for r in flattened)
+        # routes exposed for reversing and documentation are left untouched
+        assert any(isinstance(r, EllarControllerMount) for r in app.routes)
+
+        yield tm.get_test_client()
+
+
+def test_flattened_routes_operation_params_and_middleware(client):
+    res = client.get("/cats/3/")
+    assert res.status_code == 200
+    assert res.json() == {"org_id": 3, "middleware": "executed", "root_path": "/cats/3"}
+
+    assert client.get("/cats/3/21").json() == {"org_id": 3, "cat_id": 21}
+    assert client.post("/cats/3/create").json() == {"org_id": 3, "created": True}
+
+
+def test_flattened_routes_method_not_allowed_and_not_found(client):
+    assert client.get("/cats/3/create").status_code == 405
+    assert client.get("/cats/three/").status_code == 404
+    assert client.get("/unknown").status_code == 404
+
+
+def test_flattened_routes_versioning(client):
+    assert client.get("/v1/cats/3/versioned").json() == {"version": "1"}
+    assert client.get("/v2/cats/3/versioned").json() == {"version": "2"}
+    assert client.get("/v3/cats/3/versioned").status_code == 404
+
+
+def test_flattened_routes_nested_routers(client):
+    assert client.get("/dogs/").json() == {"dogs": True}
+    assert client.get("/dogs/sub/items/bone").json() == {
+        "name": "bone",
+        "root_path": "/dogs/sub",
+    }
+
+
+def test_flatten_routes_keeps_mount_with_unsupported_children():
+    async def app(scope, receive, send):  # pragma: no cover
+        pass
+
+    mount = EllarControllerMount("/mixed", routes=[Mount("/inner", app=app)])
+    assert flatten_routes([mount]) == [mount]
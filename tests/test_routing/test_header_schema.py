@@ -4,6 +4,7 @@ from ellar.common.exceptions import ImproperConfiguration
 from ellar.core.connection import Request
 from ellar.core.router_builders.utils import build_route_handler
 from ellar.openapi import OpenAPIDocumentBuilder
+from ellar.pydantic import BaseModel, ModelField
 from ellar.testing import Test
 
 from ..utils import pydantic_error_url
@@ -37,6 +38,16 @@ def header_with_alias(
     return {"aliasQty": qty}
 
 
+class AgentHeaders(BaseModel):
+    user_agent: str
+    x_retries: int = 0
+
+
+@mr.get("/test/agent")
+def header_params_with_underscores(headers: AgentHeaders = Header()):
+    return headers.model_dump()
+
+
 tm = Test.create_test_module(routers=(mr,))
 app = tm.create_application()
 
@@ -180,3 +191,70 @@ def test_invalid_schema_header():
         "Field type should belong to (<class 'list'>, <class 'set'>, <class 'tuple'>) "
         "or any primitive type"
     )
+
+
+def test_header_schema_is_validated_once(monkeypatch):
+    client = tm.get_test_client()
+    validated = []
+    validate = ModelField.validate
+
+    def _validate(self, value, *args, **kwargs):
+        validated.append(self.name)
+        return validate(self, value, *args, **kwargs)
+
+    monkeypatch.setattr(ModelField, "validate", _validate)
+    response = client.get("/test/agent", headers={"x-retries": "3"})
+
+    # underscores of the schema fields are converted
+    assert response.json() == {"user_agent": "testclient", "x_retries": 3}
+    # and validated by the schema only
+    assert validated.count("headers") == 1
+    assert "user_agent" not in validated and "x_retries" not in validated
+
+
+def test_header_schema_errors_keep_parameter_location():
+    client = tm.get_test_client()
+    response = client.get(
+        "/test/agent", headers={"user-agent": "", "x-retries": "three"}
+    )
+    assert response.status_code == 422
+    assert response.json() == {
+        "detail": [
+            {
+                "type": "int_parsing",
+                "loc": ["header", "x-retries"],
+                "msg": "Input should be a valid integer, unable to parse string as an integer",
+                "input": "three",
+                "url": pydantic_error_url("int_parsing"),
+            }
+        ]
+    }
+
+
+def _get_headers_resolver():
+    for mount in app.router.routes:
+        for route in getattr(mount, "routes", ()):
+            if getattr(route, "path", None) == "/test/agent":
+                (resolver,) = route.endpoint_parameter_model.get_route_models()
+                return resolver
+    raise AssertionError("/test/agent")  # pragma: no cover
+
+
+def test_header_schema_fields_are_mapped_to_their_resolver_by_name():
+    resolver = _get_headers_resolver()
+    assert {
+        key: parameter.model_field.name
+        for key, parameter in resolver._model_keys.items()
+    } == {"user_agent": "user_agent", "x_retries": "x_retries"}
+
+    # resolvers given in another order are still mapped by name
+    reordered = type(resolver)(
+        model_field=resolver.model_field, resolvers=resolver.resolvers[::-1]
+    )
+    assert reordered._model_keys == resolver._model_keys
+
+    # resolvers not covering every model field are resolved one after another
+    partial = type(resolver)(
+        model_field=resolver.model_field, resolvers=resolver.resolvers[:1]
+    )
+    assert partial._model_keys is None
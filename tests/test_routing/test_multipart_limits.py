@@ -0,0 +1,192 @@
+import io
+import typing as t
+
+import pytest
+from ellar.common import File, Form, ModuleRouter, UploadFile, multipart_limits
+from ellar.common.params.formparsers import (
+    FileTooLarge,
+    LimitedMultiPartParser,
+    MultipartLimits,
+)
+from ellar.testing import Test
+from starlette.datastructures import Headers
+from starlette.datastructures import UploadFile as StarletteUploadFile
+from starlette.formparsers import MultiPartParser
+from starlette.requests import Request
+
+targets: t.Dict[str, io.BytesIO] = {}
+
+
+class _Target(io.BytesIO):
+    def close(self) -> None:
+        # keeps the content readable by the test
+        pass
+
+
+def _target_factory(filename, headers):
+    targets[filename] = _Target()
+    return targets[filename]
+
+
+router = ModuleRouter("/upload")
+
+
+@router.post("/limited")
+@multipart_limits(max_file_size=10, max_files=2, max_fields=1)
+async def limited(files: t.List[bytes] = File(), note: str = Form("")):
+    return {"sizes": [len(content) for content in files], "note": note}
+
+
+@router.post("/spooled")
+@multipart_limits(spool_max_size=4)
+async def spooled(file: UploadFile = File()):
+    return {"rolled": file.file._rolled, "content": (await file.read()).decode()}
+
+
+@router.post("/streamed")
+@multipart_limits(file_factory=_target_factory)
+async def streamed(file: UploadFile = File()):
+    return {"size": file.size, "target": file.file is targets[file.filename]}
+
+
+@router.post("/default")
+async def default(file: bytes = File()):
+    return {"size": len(file)}
+
+
+tm = Test.create_test_module(routers=[router])
+client = tm.get_test_client()
+
+
+def test_multipart_limits_accept_requests_within_limits():
+    response = client.post(
+        "/upload/limited",
+        files=[("files", ("a.txt", b"0123456789")), ("files", ("b.txt", b"01"))],
+        data={"note": "ok"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"sizes": [10, 2], "note": "ok"}
+
+
+def test_oversized_uploads_are_rejected_with_413():
+    response = client.post(
+        "/upload/limited", files=[("files", ("a.txt", b"0123456789a"))]
+    )
+
+    assert response.status_code == 413
+    assert response.json() == {
+        "detail": "File exceeded maximum size of 10 bytes.",
+        "status_code": 413,
+    }
+
+
+@pytest.mark.parametrize(
+    "files, data",
+    [
+        (
+            [
+                ("files", ("a.txt", b"a")),
+                ("files", ("b.txt", b"b")),
+                ("files", ("c", b"c")),
+            ],
+            {},
+        ),
+        ([("files", ("a.txt", b"a"))], {"note": "a", "other": "b"}),
+    ],
+)
+def test_too_many_files_or_fields_are_rejected(files, data):
+    response = client.post("/upload/limited", files=files, data=data)
+
+    assert response.status_code == 400
+
+
+def test_uploads_are_spooled_to_disk_from_spool_max_size():
+    small = client.post("/upload/spooled", files={"file": ("a.txt", b"abcd")})
+    large = client.post("/upload/spooled", files={"file": ("a.txt", b"abcde")})
+
+    assert small.json() == {"rolled": False, "content": "abcd"}
+    assert large.json() == {"rolled": True, "content": "abcde"}
+
+
+def test_uploads_are_streamed_to_the_file_factory_target():
+    targets.clear()
+    response = client.post("/upload/streamed", files={"file": ("a.txt", b"x" * 5000)})
+
+    assert response.json() == {"size": 5000, "target": True}
+    assert targets["a.txt"].getvalue() == b"x" * 5000
+
+
+def test_routes_without_limits_keep_default_form_parsing():
+    response = client.post("/upload/default", files={"file": ("a.txt", b"x" * 100)})
+
+    assert response.json() == {"size": 100}
+
+
+@pytest.mark.asyncio
+async def test_parser_rejects_oversized_files_before_reading_the_whole_body():
+    boundary = b"boundary"
+    chunks = [
+        b"--boundary\r\n"
+        b'Content-Disposition: form-data; name="file"; filename="a.txt"\r\n\r\n',
+        b"x" * 8,
+        b"x" * 8,
+        b"x" * 8,
+        b"\r\n--boundary--\r\n",
+    ]
+    received = []
+
+    async def stream():
+        for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+
+    parser = LimitedMultiPartParser(
+        Headers({"content-type": f"multipart/form-data; boundary={boundary.decode()}"}),
+        stream(),
+        MultipartLimits(max_file_size=10),
+    )
+    with pytest.raises(FileTooLarge):
+        await parser.parse()
+
+    assert len(received) == 3
+
+
+@pytest.mark.asyncio
+async def test_starlette_private_attributes_used_for_multipart_limits_exist():
+    # `LimitedMultiPartParser` and `parse_form` rely on these Starlette internals,
+    # which have to be replaced if a Starlette upgrade removes them
+    headers: t.List[t.Tuple[bytes, bytes]] = []
+    request = Request({"type": "http", "method": "POST", "headers": headers})
+    assert request._form is None, "Request._form is no longer used to cache the form"
+
+    seen = {}
+
+    class _Parser(MultiPartParser):
+        def on_headers_finished(self) -> None:
+            super().on_headers_finished()
+            seen["file"] = self._current_part.file
+            seen["files_to_close_on_error"] = list(self._files_to_close_on_error)
+
+    async def stream():
+        yield (
+            b"--boundary\r\n"
+            b'Content-Disposition: form-data; name="file"; filename="a.txt"\r\n\r\n'
+            b"x\r\n--boundary--\r\n"
+        )
+
+    parser = _Parser(
+        Headers({"content-type": "multipart/form-data; boundary=boundary"}),
+        stream(),
+    )
+    form = await parser.parse()
+
+    upload = form["file"]
+    assert isinstance(seen["file"], StarletteUploadFile), (
+        "MultiPartParser._current_part.file no longer holds the upload"
+    )
+    assert seen["file"] is upload
+    assert seen["files_to_close_on_error"] == [upload.file], (
+        "MultiPartParser._files_to_close_on_error no longer tracks the upload files"
+    )
+    await form.close()
@@ -0,0 +1,118 @@
+import uuid
+
+import pytest
+from ellar.common import ModuleRouter, Path
+from ellar.common.params.resolvers import PathParameterResolver
+from ellar.pydantic import ModelField
+from ellar.testing import Test
+
+router = ModuleRouter("/convertors")
+
+
+@router.get("/int/{item_id:int}")
+def get_int(item_id: int):
+    return {"value": item_id, "type": type(item_id).__name__}
+
+
+@router.get("/float/{value:float}")
+def get_float(value: float):
+    return {"value": value, "type": type(value).__name__}
+
+
+@router.get("/uuid/{value:uuid}")
+def get_uuid(value: uuid.UUID):
+    return {"value": str(value), "type": type(value).__name__}
+
+
+@router.get("/constrained/{item_id:int}")
+def get_constrained(item_id: int = Path(gt=2)):
+    return {"value": item_id, "type": type(item_id).__name__}
+
+
+@router.get("/str/{item_id}")
+def get_str(item_id: str):
+    return {"value": item_id, "type": type(item_id).__name__}
+
+
+@router.get("/plain/{item_id}")
+def get_plain(item_id: int):
+    return {"value": item_id, "type": type(item_id).__name__}
+
+
+tm = Test.create_test_module(routers=[router])
+compiled_tm = Test.create_test_module(
+    routers=[router], config_module={"COMPILE_ROUTE_PARAMETERS": True}
+)
+
+
+def _get_path_resolvers(app):
+    resolvers = {}
+    for mount in app.router.routes:
+        for route in getattr(mount, "routes", ()):
+            model = route.get_execution_plan(app).endpoint_args_model
+            for resolver in model.get_route_models():
+                if isinstance(resolver, PathParameterResolver):
+                    resolvers[route.path] = resolver
+    return resolvers
+
+
+@pytest.fixture(params=[tm, compiled_tm], ids=["resolvers", "compiled"])
+def test_module(request):
+    return request.param
+
+
+def test_unconstrained_convertor_types_are_trusted(test_module):
+    resolvers = _get_path_resolvers(test_module.create_application())
+
+    assert {path: resolver.trusted_type for path, resolver in resolvers.items()} == {
+        "/int/{item_id:int}": int,
+        "/float/{value:float}": float,
+        "/uuid/{value:uuid}": uuid.UUID,
+        "/constrained/{item_id:int}": None,
+        "/str/{item_id}": str,
+        "/plain/{item_id}": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "path, expected, validated",
+    [
+        ("/convertors/int/5", {"value": 5, "type": "int"}, False),
+        ("/convertors/float/1.5", {"value": 1.5, "type": "float"}, False),
+        (
+            "/convertors/uuid/d9f7a4b6-0b43-4a1c-9d0e-0f2a8f7b6c51",
+            {"value": "d9f7a4b6-0b43-4a1c-9d0e-0f2a8f7b6c51", "type": "UUID"},
+            False,
+        ),
+        ("/convertors/constrained/5", {"value": 5, "type": "int"}, True),
+        ("/convertors/str/5", {"value": "5", "type": "str"}, False),
+        ("/convertors/plain/5", {"value": 5, "type": "int"}, True),
+    ],
+)
+def test_trusted_path_values_skip_validation(
+    test_module, monkeypatch, path, expected, validated
+):
+    client = test_module.get_test_client()
+    calls = []
+    validate = ModelField.validate
+
+    def _validate(self, *args, **kwargs):
+        if self.name != "response_model":
+            calls.append(self.name)
+        return validate(self, *args, **kwargs)
+
+    monkeypatch.setattr(ModelField, "validate", _validate)
+    response = client.get(path)
+
+    assert response.status_code == 200
+    assert response.json() == expected
+    assert bool(calls) is validated
+
+
+def test_constrained_path_values_keep_validation(test_module):
+    response = test_module.get_test_client().get("/convertors/constrained/1")
+
+    assert response.status_code == 422
+    assert [error["loc"] for error in response.json()["detail"]] == [
+        ["path", "item_id"]
+    ]
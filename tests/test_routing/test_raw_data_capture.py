@@ -0,0 +1,135 @@
+import typing as t
+
+import pytest
+from ellar.common import Header, ModuleRouter, Query, capture_raw_data
+from ellar.common.params import RequestEndpointArgsModel
+from ellar.common.params.resolvers.base import EMPTY_RAW_DATA
+from ellar.pydantic import BaseModel
+from ellar.testing import Test
+
+
+class Filter(BaseModel):
+    limit: int = 10
+
+
+router = ModuleRouter("/raw")
+
+
+@router.get("/{item_id:int}")
+def get_item(
+    item_id: int, q: str, x_token: str = Header("token"), filters: Filter = Query()
+):
+    return {"item_id": item_id, "q": q, "limit": filters.limit}
+
+
+@router.get("/defaults")
+def defaults(
+    x_tags: t.List[str] = Header([]),
+    q: t.Optional[str] = None,
+    page: int = Query(1),
+):
+    return {"x_tags": x_tags, "q": q, "page": page}
+
+
+@router.get("/captured")
+@capture_raw_data(True)
+def captured(q: str):
+    return {"q": q}
+
+
+@router.get("/not-captured")
+@capture_raw_data(False)
+def not_captured(q: str):
+    return {"q": q}
+
+
+tm = Test.create_test_module(routers=[router])
+client = tm.get_test_client()
+
+
+@pytest.fixture
+def raw_data(monkeypatch):
+    results = []
+    resolve_dependencies = RequestEndpointArgsModel.resolve_dependencies
+
+    async def _resolve_dependencies(self, *, ctx):
+        res = await resolve_dependencies(self, ctx=ctx)
+        results.append(res.raw_data)
+        return res
+
+    monkeypatch.setattr(
+        RequestEndpointArgsModel, "resolve_dependencies", _resolve_dependencies
+    )
+    return results
+
+
+def test_raw_data_is_captured_by_default(raw_data):
+    response = client.get("/raw/1", params={"q": "a", "limit": "5"})
+    assert response.json() == {"item_id": 1, "q": "a", "limit": 5}
+    assert raw_data == [{"x_token": "token", "item_id": 1, "q": "a", "limit": "5"}]
+
+    client.get("/raw/not-captured", params={"q": "a"})
+    assert raw_data[-1] == {}
+
+
+@pytest.mark.parametrize("compile_parameters", [False, True])
+def test_raw_data_capture_can_be_turned_off(
+    config_test_module, raw_data, compile_parameters
+):
+    client = config_test_module(
+        routers=[router],
+        CAPTURE_PARAMETERS_RAW_DATA=False,
+        COMPILE_ROUTE_PARAMETERS=compile_parameters,
+    ).get_test_client()
+
+    response = client.get("/raw/1", params={"q": "a", "limit": "5"})
+    assert response.json() == {"item_id": 1, "q": "a", "limit": 5}
+    assert raw_data[-1] == {}
+
+    client.get("/raw/captured", params={"q": "a"})
+    assert raw_data[-1] == {"q": "a"}
+
+
+def test_resolvers_do_not_create_raw_data_when_capture_is_off(config_test_module):
+    app = config_test_module(
+        routers=[router],
+        CAPTURE_PARAMETERS_RAW_DATA=False,
+        COMPILE_ROUTE_PARAMETERS=True,
+    ).create_application()
+    model = next(
+        route.get_execution_plan(app).endpoint_args_model
+        for mount in app.router.routes
+        for route in getattr(mount, "routes", ())
+        if getattr(route, "path", None) == "/{item_id:int}"
+    )
+
+    assert model.capture_raw_data is False
+    assert "raw_data[" not in model.compiled_resolver.source
+    for resolver in model.get_route_models():
+        assert resolver.create_raw_data("value") is EMPTY_RAW_DATA
+        for child in getattr(resolver, "resolvers", ()):
+            assert child.capture_raw_data is False
+
+    model.set_raw_data_capture(True)
+    assert model.compiled_resolver is None
+    assert model.get_route_models()[0].create_raw_data("value") == {"x_token": "value"}
+    # the model is shared by the applications with the same settings
+    model.set_raw_data_capture(False)
+    model.compile()
+
+
+@pytest.mark.parametrize("single_pass", [False, True])
+def test_compiled_resolver_records_the_same_raw_data(
+    config_test_module, raw_data, single_pass
+):
+    compiled_client = config_test_module(
+        routers=[router],
+        COMPILE_ROUTE_PARAMETERS=True,
+        SINGLE_PASS_PARAMETER_VALIDATION=single_pass,
+    ).get_test_client()
+    for _client in (client, compiled_client):
+        _client.get("/raw/defaults")
+        _client.get("/raw/defaults", params={"q": "a"}, headers={"x-tags": "b"})
+
+    assert raw_data[:2] == raw_data[2:]
+    assert raw_data[0] == {"x_tags": [], "q": None, "page": 1}
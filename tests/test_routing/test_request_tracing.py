@@ -0,0 +1,97 @@
+import logging
+
+import pytest
+from ellar.common import Controller, get
+from ellar.common.constants import LOG_LEVELS
+from ellar.common.logging import TraceEvent, request_logger, request_tracer
+from ellar.testing import Test
+
+from benchmarks.tracing import main as tracing_benchmark
+
+
+@Controller("/trace")
+class TraceController:
+    @get("/{item_id:int}")
+    def get_item(self, item_id: int):
+        return {"item_id": item_id}
+
+
+@pytest.fixture
+def restore_tracer():
+    level = request_logger.level
+    yield
+    request_tracer.log_events = None
+    request_logger.setLevel(level)
+
+
+def test_request_tracer_is_disabled_by_default(restore_tracer):
+    tm = Test.create_test_module(controllers=[TraceController])
+    tm.create_application()
+
+    assert request_tracer.log_events is False
+    assert request_tracer.enabled is False
+
+
+def test_request_tracer_hooks_receive_stage_events(restore_tracer):
+    client = Test.create_test_module(controllers=[TraceController]).get_test_client()
+    events = []
+
+    request_tracer.add_hook(events.append)
+    try:
+        assert request_tracer.enabled
+        assert client.get("/trace/1").json() == {"item_id": 1}
+    finally:
+        request_tracer.remove_hook(events.append)
+    assert request_tracer.enabled is False
+
+    assert (
+        TraceEvent("Matching URL Handler", "EllarControllerMount", {"path": "/trace/1"})
+        in events
+    )
+    assert ("Resolving Path Parameters", "PathParameterResolver", {}) in events
+    assert "Creating Response from returned Handler value" in {
+        event.stage for event in events
+    }
+
+
+def test_request_tracer_logs_events_for_debug_log_level(restore_tracer, caplog):
+    tm = Test.create_test_module(
+        controllers=[TraceController], config_module={"LOG_LEVEL": LOG_LEVELS.debug}
+    )
+    client = tm.get_test_client()
+    assert request_tracer.log_events and request_tracer.enabled
+    # events are formatted once they pass the logger level
+    assert str(TraceEvent("Getting Controller Instance", "Route", {})) == (
+        "Getting Controller Instance - 'Route'"
+    )
+
+    with caplog.at_level(logging.DEBUG, logger="ellar.request"):
+        client.get("/trace/1")
+    assert "Matching URL Handler, path=/trace/1 - 'EllarControllerMount'" in caplog.text
+    assert "Resolving Path Parameters - 'PathParameterResolver'" in caplog.text
+
+
+def test_request_tracer_follows_the_request_logger_level(restore_tracer):
+    Test.create_test_module(
+        controllers=[TraceController], config_module={"LOG_LEVEL": LOG_LEVELS.debug}
+    ).create_application()
+    assert request_tracer.enabled
+
+    request_logger.setLevel(logging.INFO)
+    assert request_tracer.log_events is False
+    assert request_tracer.enabled is False
+
+    request_logger.setLevel(logging.DEBUG)
+    assert request_tracer.enabled
+    request_tracer.log_events = False
+    assert request_tracer.enabled is False
+
+
+def test_tracing_benchmark_emits_json_results(tmp_path):
+    output = tmp_path / "tracing.json"
+    tracing_benchmark(["--number", "2", "--repeat", "1", "--output", str(output)])
+
+    data = output.read_text()
+    assert '"benchmark": "tracing"' in data
+    assert '"mode": "filtered"' in data
+    assert request_tracer.enabled is False
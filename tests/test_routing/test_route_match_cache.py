@@ -0,0 +1,112 @@
+from ellar.common import ModuleRouter, Version
+from ellar.core.routing.route_cache import RouteMatchCache, RouteMatchCacheInfo
+from ellar.core.versioning import UrlPathAPIVersioning, VersioningSchemes
+from ellar.testing import Test
+from starlette.routing import Route
+
+
+async def _endpoint(request):  # pragma: no cover
+    pass
+
+
+def _scope(path, method="GET"):
+    return {"type": "http", "path": path, "method": method, "headers": []}
+
+
+router = ModuleRouter("/items")
+
+
+@router.get("/")
+def items():
+    return {"version": "default"}
+
+
+@router.get("/")
+@Version("2")
+def items_v2():
+    return {"version": "2"}
+
+
+@router.get("/{item_id:int}")
+def get_item(item_id: int):
+    return {"item_id": item_id}
+
+
+tm = Test.create_test_module(routers=[router])
+
+
+def test_route_match_cache_lru_eviction():
+    cache = RouteMatchCache(2)
+    route = Route("/a", _endpoint)
+    keys = [RouteMatchCache.get_key(_scope(path)) for path in ("/a", "/b", "/c")]
+
+    cache.set(keys[0], route, {"path_params": {}})
+    cache.set(keys[1], route, {"path_params": {}})
+    assert cache.get(keys[0]) is not None
+    cache.set(keys[2], route, {"path_params": {}})
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    assert cache.cache_info() == RouteMatchCacheInfo(
+        hits=2, misses=1, maxsize=2, currsize=2
+    )
+
+
+def test_route_match_cache_does_not_share_path_params():
+    cache = RouteMatchCache(1)
+    key = RouteMatchCache.get_key(_scope("/items/1"))
+    cache.set(key, Route("/items/{id}", _endpoint), {"path_params": {"id": "1"}})
+
+    _, child_scope = cache.get(key)
+    child_scope["path_params"]["id"] = "2"
+    assert cache.get(key)[1]["path_params"] == {"id": "1"}
+
+
+def test_route_match_cache_is_disabled_by_default():
+    assert tm.create_application().router.route_match_cache is None
+
+
+def test_route_match_cache_serves_repeated_requests(config_test_module):
+    cached_tm = config_test_module(routers=[router], ROUTE_MATCH_CACHE_SIZE=8)
+    app = cached_tm.create_application()
+    client = cached_tm.get_test_client()
+
+    for _ in range(3):
+        assert client.get("/items/1").json() == {"item_id": 1}
+    assert client.get("/items/2").json() == {"item_id": 2}
+    # misses are not cached
+    assert client.get("/missing").status_code == 404
+    assert client.get("/missing").status_code == 404
+
+    info = app.router.route_match_cache.cache_info()
+    assert info.hits == 2
+    assert info.currsize == 2
+
+
+def test_route_match_cache_keys_on_api_version(config_test_module):
+    cached_tm = config_test_module(
+        routers=[router],
+        ROUTE_MATCH_CACHE_SIZE=8,
+        VERSIONING_SCHEME=UrlPathAPIVersioning(),
+    )
+    app = cached_tm.create_application()
+    client = cached_tm.get_test_client()
+
+    for _ in range(2):
+        assert client.get("/items/").json() == {"version": "default"}
+        assert client.get("/v2/items/").json() == {"version": "2"}
+
+    app.enable_versioning(VersioningSchemes.URL, default_version="2")
+    assert client.get("/v2/items/").json() == {"version": "default"}
+
+
+def test_route_match_cache_is_cleared_when_routes_change(config_test_module):
+    cached_tm = config_test_module(routers=[router], ROUTE_MATCH_CACHE_SIZE=8)
+    app = cached_tm.create_application()
+    client = cached_tm.get_test_client()
+
+    assert client.get("/items/1").status_code == 200
+    assert app.router.route_match_cache.cache_info().currsize == 1
+
+    app.router.extend([Route("/health", _endpoint)])
+    assert app.router.route_match_cache.cache_info().currsize == 0
@@ -0,0 +1,155 @@
+import re
+
+import pytest
+from ellar.common import Controller, ModuleRouter, get
+from ellar.common.exceptions import ImproperConfiguration
+from ellar.core.routing import RouteCollection
+from ellar.core.routing.route_regex import RegexRouteMatcher
+from ellar.testing import Test
+from starlette.convertors import Convertor, register_url_convertor
+from starlette.routing import Host, Match, Mount, Route
+
+
+class LookaheadConvertor(Convertor):
+    regex = "(?!admin)[a-z]+"
+
+    def convert(self, value: str) -> str:
+        return value
+
+    def to_string(self, value: str) -> str:  # pragma: no cover
+        return value
+
+
+register_url_convertor("not_admin", LookaheadConvertor())
+
+
+async def _endpoint(request):  # pragma: no cover
+    pass
+
+
+async def _asgi_app(scope, receive, send):  # pragma: no cover
+    pass
+
+
+ROUTES = [
+    Route("/users/me", _endpoint, methods=["GET"]),
+    Route("/users/{user_id:int}", _endpoint, methods=["GET"]),
+    Route("/users/{user_id:int}", _endpoint, methods=["DELETE"]),
+    Route("/users/{username}", _endpoint, methods=["GET"]),
+    Route("/teams/{team:not_admin}", _endpoint, methods=["GET"]),
+    Mount("/static", app=_asgi_app),
+    Host("api.example.com", app=_asgi_app),
+]
+
+
+def _scope(path, method="GET"):
+    return {"type": "http", "path": path, "method": method, "headers": []}
+
+
+@pytest.mark.parametrize(
+    "path",
+    ["/users/me", "/users/12", "/users/john", "/teams/red", "/static/a.css", "/none"],
+)
+def test_regex_matcher_candidates_include_every_matching_route(path):
+    matcher = RegexRouteMatcher(ROUTES)
+    candidates = list(matcher.get_candidate_routes(path))
+
+    assert [ROUTES.index(route) for route in candidates] == sorted(
+        ROUTES.index(route) for route in candidates
+    )
+    for route in ROUTES:
+        if route not in candidates:
+            assert route.matches(_scope(path))[0] == Match.NONE
+
+
+def test_regex_matcher_uses_last_group_to_skip_routes():
+    matcher = RegexRouteMatcher(ROUTES)
+    assert matcher.match("/users/12") == 1
+    assert matcher.match("/users/john") == 3
+    # custom convertor with a lookahead and `Host` are not merged
+    assert matcher.match("/teams/red") is None
+    assert list(matcher.get_candidate_routes("/none")) == [ROUTES[4], ROUTES[6]]
+
+
+def test_route_collection_regex_matcher_keeps_partial_matches():
+    collection = RouteCollection(ROUTES, route_matcher="regex")
+    scope = _scope("/users/12", "DELETE")
+    candidates = list(collection.get_candidate_routes(scope))
+    matches = [route.matches(scope)[0] for route in candidates]
+    # the GET route matched by the regex comes first, the DELETE route is still checked
+    assert matches == [Match.NONE, Match.PARTIAL, Match.FULL, Match.PARTIAL, Match.NONE]
+    # merged routes after the matched one are only candidates when their regex matches
+    assert ROUTES[5] not in candidates
+
+
+def test_regex_matcher_continues_the_search_after_a_matched_route():
+    matcher = RegexRouteMatcher(ROUTES)
+    # `/users/me` does not match the routes with an integer parameter
+    assert list(matcher.get_candidate_routes("/users/me")) == [
+        ROUTES[0],
+        ROUTES[3],
+        ROUTES[4],
+        ROUTES[6],
+    ]
+    assert list(matcher.get_candidate_routes("/static/a.css")) == [
+        ROUTES[4],
+        ROUTES[5],
+        ROUTES[6],
+    ]
+
+
+def test_regex_matcher_does_not_compile_regexes_while_matching(monkeypatch):
+    routes = [
+        Route(f"/items{index}/{{item_id:int}}", _endpoint, methods=["GET"])
+        for index in range(100)
+    ] + [Route("/items1/{name}", _endpoint, methods=["GET"])]
+    collection = RouteCollection(routes, route_matcher="regex")
+
+    def _compile(*args, **kwargs):  # pragma: no cover
+        raise AssertionError("regex compiled while matching")
+
+    monkeypatch.setattr(re, "compile", _compile)
+    for item_id in range(100):
+        scope = _scope(f"/items1/{item_id}", "DELETE")
+        candidates = [route.path for route in collection.get_candidate_routes(scope)]
+        assert candidates == ["/items1/{item_id:int}", "/items1/{name}"]
+
+
+def test_route_collection_invalid_route_matcher():
+    with pytest.raises(ImproperConfiguration, match="Invalid route matcher"):
+        RouteCollection(route_matcher="linear")
+
+
+def test_regex_route_matcher_application():
+    router = ModuleRouter("/items")
+
+    @router.get("/{item_id:int}")
+    def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @router.get("/{name}")
+    def get_item_by_name(name: str):
+        return {"name": name}
+
+    @Controller("/teams")
+    class TeamController:
+        @get("/{team:not_admin}")
+        def get_team(self, team: str):
+            return {"team": team}
+
+    tm = Test.create_test_module(
+        routers=[router],
+        controllers=[TeamController],
+        config_module={"ROUTE_MATCHER": "regex"},
+    )
+    app = tm.create_application()
+    client = tm.get_test_client()
+
+    assert app.router.routes.route_matcher == "regex"
+    assert all(route.routes.route_matcher == "regex" for route in app.router.routes)
+
+    assert client.get("/items/1").json() == {"item_id": 1}
+    assert client.get("/items/apple").json() == {"name": "apple"}
+    assert client.post("/items/1").status_code == 405
+    assert client.get("/teams/red").json() == {"team": "red"}
+    assert client.get("/teams/admin").status_code == 404
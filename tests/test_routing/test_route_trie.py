@@ -0,0 +1,142 @@
+import uuid
+
+import pytest
+from ellar.common import ModuleRouter
+from ellar.core.routing import RouteCollection
+from ellar.core.routing.route_trie import RouteTrie
+from ellar.testing import Test
+from starlette.routing import Host, Match, Mount, Route
+
+
+async def _endpoint(request):  # pragma: no cover
+    pass
+
+
+async def _asgi_app(scope, receive, send):  # pragma: no cover
+    pass
+
+
+ROUTES = [
+    Route("/", _endpoint),
+    Route("/users", _endpoint, methods=["GET"]),
+    Route("/users/", _endpoint, methods=["GET"]),
+    Route("/users/me", _endpoint, methods=["GET"]),
+    Route("/users/{user_id:int}", _endpoint, methods=["GET"]),
+    Route("/users/{username}", _endpoint, methods=["POST"]),
+    Route("/users/{user_id:int}/avatar.{ext}", _endpoint),
+    Route("/items/{item_id:uuid}", _endpoint),
+    Route("/prices/{value:float}", _endpoint),
+    Route("/files/{file_path:path}", _endpoint),
+    Route("/{catch_all:path}", _endpoint),
+    Mount("/static", app=_asgi_app),
+    Mount("/{tenant}/api", app=_asgi_app),
+    Host("{subdomain}.example.org", app=_asgi_app),
+]
+
+PATHS = [
+    "/",
+    "",
+    "/users",
+    "/users/",
+    "/users/me",
+    "/users/12",
+    "/users/john",
+    "/users/12/avatar.png",
+    "/users/john/avatar.png",
+    f"/items/{uuid.uuid4()}",
+    "/items/not-a-uuid",
+    "/prices/12.5",
+    "/prices/12",
+    "/files/a/b/c.txt",
+    "/files/",
+    "/files",
+    "/static",
+    "/static/",
+    "/static/css/app.css",
+    "/acme/api/users",
+    "/acme/api",
+    "/users\n",
+    "/unknown/path/here",
+]
+
+
+def _matching_positions(routes, path, method="GET"):
+    scope = {"type": "http", "path": path, "method": method, "headers": []}
+    return [
+        idx for idx, route in enumerate(routes) if route.matches(scope)[0] != Match.NONE
+    ]
+
+
+@pytest.mark.parametrize("path", PATHS)
+@pytest.mark.parametrize("method", ["GET", "POST"])
+def test_route_trie_candidates_include_every_matching_route(path, method):
+    trie = RouteTrie(ROUTES)
+    positions = trie.lookup(path)
+    expected = _matching_positions(ROUTES, path, method)
+
+    if positions is None:
+        assert path == "" or "\n" in path
+        return
+
+    assert positions == sorted(positions)
+    assert set(expected).issubset(positions)
+
+
+def test_route_trie_filters_unrelated_routes():
+    trie = RouteTrie(ROUTES)
+    # `/users/me` should only see routes that can match it along with `Host` and catch all routes
+    assert [ROUTES[i] for i in trie.lookup("/users/me")] == [
+        ROUTES[3],
+        ROUTES[5],
+        ROUTES[10],
+        ROUTES[13],
+    ]
+    assert trie.lookup("/prices/abc") == [10, 13]
+
+
+def test_route_collection_candidates_keep_precedence_order():
+    collection = RouteCollection(ROUTES)
+    scope = {"type": "http", "path": "/users/12", "method": "GET"}
+    candidates = collection.get_candidate_routes(scope)
+
+    served = list(collection)
+    assert [served.index(route) for route in candidates] == sorted(
+        served.index(route) for route in candidates
+    )
+    for route in served:
+        if route not in candidates:
+            assert route.matches(scope)[0] == Match.NONE
+
+
+def test_route_collection_rebuilds_trie_on_append():
+    collection = RouteCollection()
+    scope = {"type": "http", "path": "/health", "method": "GET"}
+    assert list(collection.get_candidate_routes(scope)) == []
+
+    route = Route("/health", _endpoint)
+    collection.append(route)
+    assert list(collection.get_candidate_routes(scope)) == [route]
+
+
+def test_app_routing_with_trie_keeps_405_and_typed_params():
+    router = ModuleRouter("/items")
+
+    @router.get("/{item_id:int}")
+    def get_item(item_id: int):
+        return {"item_id": item_id, "type": "int"}
+
+    @router.get("/{item_name}")
+    def get_item_by_name(item_name: str):
+        return {"item_name": item_name}
+
+    @router.post("/create")
+    def create_item():
+        return {"created": True}
+
+    client = Test.create_test_module(routers=[router]).get_test_client()
+
+    assert client.get("/items/12").json() == {"item_id": 12, "type": "int"}
+    assert client.get("/items/pen").json() == {"item_name": "pen"}
+    assert client.post("/items/create").json() == {"created": True}
+    assert client.put("/items/create").status_code == 405
+    assert client.get("/unknown").status_code == 404
@@ -0,0 +1,32 @@
+import json
+import sys
+
+from benchmarks.routing import main
+
+
+def test_routing_benchmark_emits_json_results(tmp_path):
+    output = tmp_path / "routing.json"
+    main(["--sizes", "10", "--number", "2", "--repeat", "1", "--output", str(output)])
+
+    data = json.loads(output.read_text())
+    assert data["meta"]["benchmark"] == "routing"
+    results = {
+        (item["scenario"], item["target"], item["benchmark"])
+        for item in data["results"]
+    }
+    assert ("operations", "middle_param", "router") in results
+    assert ("versioned", "last_param", "mount") in results
+    assert ("path_mounts", "not_found", "asgi") in results
+    assert ("operations", "not_found", "mount") not in results
+    assert ("operations", "method_mismatch", "router") in results
+    assert all(item["ns_per_op_min"] > 0 for item in data["results"])
+
+
+def test_routing_benchmark_writes_to_stdout_without_closing_it(capsys):
+    main(
+        ["--sizes", "10", "--number", "1", "--repeat", "1", "--scenarios", "operations"]
+    )
+
+    assert sys.stdout.closed is False
+    data = json.loads(capsys.readouterr().out)
+    assert {item["scenario"] for item in data["results"]} == {"operations"}
@@ -0,0 +1,86 @@
+from unittest.mock import patch
+
+from ellar.common import ModuleRouter, get
+from ellar.core.router_builders.utils import build_route_handler
+from ellar.core.routing import RouteCollection, RouteOperation
+from ellar.core.routing.route_index import SlashRedirectIndex
+from ellar.testing import Test
+from starlette.routing import Route
+
+router = ModuleRouter("/items")
+
+
+@router.get("/")
+def list_items():
+    return {"items": []}
+
+
+@router.get("/{item_id:int}")
+def get_item(item_id: int):
+    return {"item_id": item_id}
+
+
+async def _endpoint(request):  # pragma: no cover
+    pass
+
+
+def _scope(path, method="GET"):
+    return {"type": "http", "path": path, "method": method}
+
+
+def test_slash_redirect_index_skips_methods_that_can_be_rejected():
+    health = Route("/health", _endpoint, methods=["GET"])
+
+    @get("/catalog")
+    def catalog():  # pragma: no cover
+        pass
+
+    operation = build_route_handler(catalog)[0]
+    index = SlashRedirectIndex([health, operation, Route("/users/{id}", _endpoint)])
+
+    assert len(index) == 2
+    assert index.match(_scope("/health", "GET"))
+    # a partial match is enough for a redirect
+    assert index.match(_scope("/health", "POST"))
+    # version of the matching operation is still to be checked
+    assert not index.match(_scope("/catalog", "GET"))
+    assert index.match(_scope("/catalog", "DELETE"))
+    assert not index.match(_scope("/users/1"))
+
+
+def test_route_collection_has_matching_route():
+    collection = RouteCollection([Route("/health", _endpoint, methods=["GET"])])
+    assert collection.has_matching_route(_scope("/health", "PUT"))
+    assert not collection.has_matching_route(_scope("/ready"))
+
+
+def test_redirect_slashes():
+    tm = Test.create_test_module(
+        routers=[router], config_module={"REDIRECT_SLASHES": True}
+    )
+    client = tm.get_test_client()
+
+    response = client.get("/items", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "http://testserver/items/"
+
+    response = client.get("/items/1/", follow_redirects=False)
+    assert response.status_code == 307
+    assert response.headers["location"] == "http://testserver/items/1"
+
+    assert client.get("/items/1/").json() == {"item_id": 1}
+
+
+def test_redirect_slashes_not_found_does_not_scan_routes():
+    tm = Test.create_test_module(
+        routers=[router], config_module={"REDIRECT_SLASHES": True}
+    )
+    client = tm.get_test_client()
+
+    with patch.object(
+        RouteOperation, "matches", autospec=True, side_effect=RouteOperation.matches
+    ) as matches:
+        response = client.get("/wp-admin/setup.php")
+
+    assert response.status_code == 404
+    assert matches.call_count == 0
@@ -0,0 +1,103 @@
+from ellar.common import ModuleRouter, Version
+from ellar.core.routing import RouteCollection
+from ellar.core.routing.route_index import StaticRouteIndex
+from ellar.core.routing.route_trie import RouteTrie
+from ellar.core.versioning import UrlPathAPIVersioning
+from ellar.testing import Test
+from starlette.routing import Mount, Route
+
+
+async def _endpoint(request):  # pragma: no cover
+    pass
+
+
+async def _asgi_app(scope, receive, send):  # pragma: no cover
+    pass
+
+
+class _ASGIApp:
+    async def __call__(self, scope, receive, send):  # pragma: no cover
+        pass
+
+
+def _scope(path, method="GET"):
+    return {"type": "http", "path": path, "method": method}
+
+
+def test_static_route_index_resolves_parameterless_routes():
+    health = Route("/health", _endpoint, methods=["GET"])
+    featured = Route("/v1/catalog/featured", _endpoint, methods=["GET", "POST"])
+    user = Route("/users/{user_id}", _endpoint, methods=["GET"])
+    routes = [health, user, featured]
+    index = StaticRouteIndex(routes, RouteTrie(routes))
+
+    route, child_scope = index.match(_scope("/health"))
+    assert route is health
+    assert child_scope == {"endpoint": _endpoint, "path_params": {}}
+
+    assert index.match(_scope("/v1/catalog/featured", "POST"))[0] is featured
+    assert index.match(_scope("/users/1")) == (None, {})
+    assert index.match(_scope("/health", "DELETE")) == (None, {})
+    assert index.match({"type": "websocket", "path": "/health"}) == (None, {})
+
+
+def test_static_route_index_skips_paths_shadowed_by_earlier_routes():
+    catch_all = Route("/{name}", _endpoint, methods=["GET"])
+    about = Route("/~about", _endpoint, methods=["GET"])
+    mount = Mount("/static", app=_asgi_app)
+    static_file = Route("/static/app.css", _endpoint, methods=["GET"])
+    # `/{name}` sorts before `/~about`, so it wins and `/~about` can not be indexed
+    routes = [catch_all, about, mount, static_file]
+    index = StaticRouteIndex(routes, RouteTrie(routes))
+
+    assert len(index) == 0
+    assert index.match(_scope("/~about")) == (None, {})
+
+
+def test_static_route_index_keeps_method_and_any_method_routes_out():
+    any_method = Route("/asgi", _ASGIApp())
+    get_only = Route("/items", _endpoint, methods=["GET"])
+    post_only = Route("/items", _endpoint, methods=["POST"])
+    routes = [any_method, get_only, post_only]
+    index = StaticRouteIndex(routes, RouteTrie(routes))
+
+    assert index.match(_scope("/asgi")) == (None, {})
+    assert index.match(_scope("/items"))[0] is get_only
+    assert index.match(_scope("/items", "POST"))[0] is post_only
+
+
+def test_route_collection_static_index_is_rebuilt_on_append():
+    collection = RouteCollection()
+    assert collection.match_static_route(_scope("/health")) == (None, {})
+
+    health = Route("/health", _endpoint, methods=["GET"])
+    collection.append(health)
+    assert collection.match_static_route(_scope("/health"))[0] is health
+
+
+def test_static_route_index_with_versions_and_precedence():
+    router = ModuleRouter("/catalog")
+
+    @router.get("/featured")
+    def featured():
+        return {"version": "default"}
+
+    @router.get("/featured")
+    @Version("2")
+    def featured_v2():
+        return {"version": "2"}
+
+    @router.get("/{name}")
+    def by_name(name: str):
+        return {"name": name}
+
+    tm = Test.create_test_module(
+        routers=[router],
+        config_module={"VERSIONING_SCHEME": UrlPathAPIVersioning()},
+    )
+    client = tm.get_test_client()
+
+    assert client.get("/catalog/featured").json() == {"version": "default"}
+    assert client.get("/v2/catalog/featured").json() == {"version": "2"}
+    assert client.get("/catalog/other").json() == {"name": "other"}
+    assert client.post("/catalog/featured").status_code == 405
@@ -0,0 +1,154 @@
+import json
+
+import pytest
+from ellar.common import ModuleRouter, StreamBody
+from ellar.common.params import JsonArrayStream
+from ellar.common.params.streaming import JsonArrayParser
+from ellar.openapi import OpenAPIDocumentBuilder
+from ellar.pydantic import BaseModel
+from ellar.testing import Test
+
+
+class Item(BaseModel):
+    name: str
+    price: float
+
+
+router = ModuleRouter("/stream")
+
+
+@router.post("/batches")
+async def import_batches(items: StreamBody[Item, StreamBody.P(batch_size=2)]):
+    batches = []
+    async for batch in items.batches():
+        batches.append([item.name for item in batch])
+    return {"batches": batches}
+
+
+@router.post("/items")
+async def import_items(items: StreamBody[Item]):
+    assert isinstance(items, JsonArrayStream)
+    return {"total": sum([item.price async for item in items])}
+
+
+@pytest.fixture
+def client():
+    return Test.create_test_module(routers=[router]).get_test_client()
+
+
+def _items(count):
+    return [{"name": f"item-{index}", "price": index} for index in range(count)]
+
+
+def _chunks(document, size):
+    return [document[index : index + size] for index in range(0, len(document), size)]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 1000])
+@pytest.mark.parametrize(
+    "value",
+    [
+        [],
+        [1, -2.5e3, True, None, "a"],
+        [{"name": 'a "quoted" ,] string', "tags": ["[", "{"]}, [[], {}]],
+        ["\\", '\\"', "é中"],
+    ],
+)
+def test_parser_decodes_items_of_chunked_documents(value, size):
+    document = json.dumps(value, ensure_ascii=False, indent=1).encode()
+    parser = JsonArrayParser()
+    items = []
+    for chunk in _chunks(document, size):
+        items += parser.feed(chunk)
+    parser.close()
+
+    assert items == value
+
+
+@pytest.mark.parametrize(
+    "document, message, position",
+    [
+        (b"", "Expecting value", 0),
+        (b'{"a": 1}', "Expecting '['", 0),
+        (b"[1, 2", "Expecting ']'", 5),
+        (b"[1, , 2]", "Expecting value", 4),
+        (b"[1, 2] 3", "Extra data", 7),
+        (b"[1, tru]", "Expecting value", 4),
+    ],
+)
+def test_parser_reports_malformed_documents(document, message, position):
+    parser = JsonArrayParser()
+    with pytest.raises(json.JSONDecodeError) as exc_info:
+        for chunk in _chunks(document, 2):
+            parser.feed(chunk)
+        parser.close()
+
+    assert exc_info.value.msg == message
+    assert exc_info.value.pos == position
+
+
+def test_parser_only_keeps_the_item_being_received():
+    parser = JsonArrayParser()
+    parser.feed(b"[")
+    for index in range(1000):
+        assert parser.feed(b'{"index": %d},' % index) == [{"index": index}]
+        assert len(parser._buffer) == 0
+
+    assert parser.feed(b'{"index": 1000}') == []
+    assert parser.feed(b"]") == [{"index": 1000}]
+
+
+def test_stream_body_validates_items_by_batches(client):
+    response = client.post("/stream/batches", json=_items(5))
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "batches": [["item-0", "item-1"], ["item-2", "item-3"], ["item-4"]]
+    }
+
+
+def test_stream_body_iterates_items(client):
+    response = client.post(
+        "/stream/items", content=_chunks(json.dumps(_items(10)).encode(), 16)
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"total": 45}
+
+
+def test_stream_body_reports_invalid_items_with_their_index(client):
+    items = _items(5)
+    items[3]["price"] = "free"
+    response = client.post("/stream/batches", json=items)
+
+    assert response.status_code == 422
+    assert [(error["type"], error["loc"]) for error in response.json()["detail"]] == [
+        ("float_parsing", ["body", 3, "price"])
+    ]
+
+
+def test_stream_body_reports_malformed_documents(client):
+    response = client.post("/stream/items", content=b'[{"name": "a", "price": 1},')
+
+    assert response.status_code == 422
+    assert response.json()["detail"] == [
+        {
+            "type": "json_invalid",
+            "loc": ["body", 27],
+            "msg": "JSON decode error",
+            "input": {},
+            "ctx": {"error": "Expecting ']'"},
+        }
+    ]
+
+
+def test_stream_body_is_not_documented_as_a_parameter():
+    app = Test.create_test_module(routers=[router]).create_application()
+    document = (
+        OpenAPIDocumentBuilder()
+        .build_document(app)
+        .model_dump(exclude_none=True, by_alias=True)
+    )
+    operation = document["paths"]["/stream/items"]["post"]
+    assert "requestBody" not in operation
+    assert "parameters" not in operation
@@ -1,3 +1,4 @@
+import dataclasses
 import typing as t
 from dataclasses import dataclass
 from datetime import datetime, timezone
@@ -6,8 +7,10 @@ from pathlib import PurePath, PurePosixPath, PureWindowsPath
 
 import pytest
 from ellar.common.serializer.base import (
+    ObjectSerializer,
     Serializer,
     SerializerFilter,
+    get_object_serializer,
     serialize_object,
 )
 from ellar.core import injector_context
@@ -300,3 +303,113 @@ async def test_serialize_object_under_app_context(anyio_backend):
         assert result == "2023-11-10T00:00:00"
 
     assert decoder_func_called is True
+
+
+async def test_serialize_object_uses_the_application_serializer(
+    anyio_backend, monkeypatch
+):
+    app = Test.create_test_module(
+        config_module={"SERIALIZER_CUSTOM_ENCODER": {Person: repr}}
+    ).create_application()
+    serializer = app.object_serializer
+
+    def _lazy_current_config():  # pragma: no cover
+        raise AssertionError("config is read per call")
+
+    monkeypatch.setattr(
+        "ellar.common.serializer.base._lazy_current_config", _lazy_current_config
+    )
+    async with app.with_injector_context():
+        person = Person("Foo")
+        assert serialize_object(person) == repr(person)
+    assert Person in serializer._dispatch
+    assert app.object_serializer is serializer
+
+
+def test_object_serializer_dispatch_table_is_capped():
+    serializer = ObjectSerializer({}, max_types=7)
+    assert len(serializer._dispatch) == 5
+
+    types = [type(f"Value{i}", (), {"__init__": Person.__init__}) for i in range(3)]
+    for _ in range(2):
+        assert (
+            serializer.serialize([cls("Foo") for cls in types]) == [{"name": "Foo"}] * 3
+        )
+    assert len(serializer._dispatch) == 7
+    assert list in serializer._dispatch
+    assert types[0] in serializer._dispatch
+    assert types[1] not in serializer._dispatch
+
+
+def test_serialize_deeply_nested_object():
+    data = value = []
+    for _ in range(3000):
+        value.append({"items": []})
+        value = value[0]["items"]
+
+    result = serialize_object(data)
+    for _ in range(3000):
+        assert list(result[0]) == ["items"]
+        result = result[0]["items"]
+    assert result == []
+
+
+def test_serialize_circular_reference_raises_value_error():
+    data = {"name": "Foo"}
+    data["self"] = data
+    with pytest.raises(ValueError, match="circular reference"):
+        ObjectSerializer({}, max_depth=50).serialize(data)
+
+
+def test_serialize_object_keeps_keys_order():
+    data = {"b": [1, {"c": 2}], "a": datetime(2019, 1, 1), "d": (x for x in "xy")}
+    result = serialize_object(data)
+    assert result == {"b": [1, {"c": 2}], "a": "2019-01-01T00:00:00", "d": ["x", "y"]}
+    assert list(result) == ["b", "a", "d"]
+    # keys converted to the same string keep the last value
+    assert serialize_object({1: [1], "1": "one"}) == {"1": "one"}
+
+
+def test_object_serializer_learns_data_of_types_without_encoder():
+    serializer = ObjectSerializer({})
+    pets = [
+        Pet(owner=Person(name="Foo"), name="Firulais"),
+        DictablePet(owner=DictablePerson(name="Bar"), name="Rex"),
+    ]
+    expected = [
+        {"owner": {"name": "Foo"}, "name": "Firulais"},
+        {"owner": {"name": "Bar"}, "name": "Rex"},
+    ]
+    assert serializer.serialize(pets) == expected
+    assert serializer.serialize(pets) == expected
+
+    with pytest.raises(ValueError):
+        serializer.serialize(Unserializable())
+
+
+def test_get_object_serializer_is_shared_by_the_same_encoders():
+    encoders = {PurePosixPath: str}
+    serializer = get_object_serializer(encoders)
+    assert get_object_serializer(dict(encoders)) is serializer
+    assert get_object_serializer({PurePosixPath: repr}) is not serializer
+
+
+def test_serializer_filter_is_immutable():
+    serializer_filter = SerializerFilter(exclude={"bla"}, exclude_none=True)
+    assert serializer_filter.dump_kwargs == {
+        "include": None,
+        "exclude": {"bla"},
+        "by_alias": True,
+        "exclude_unset": False,
+        "exclude_defaults": False,
+        "exclude_none": True,
+    }
+    assert serializer_filter.dict() == serializer_filter.dump_kwargs
+    assert serializer_filter.dict() is not serializer_filter.dump_kwargs
+    assert serializer_filter == SerializerFilter(exclude={"bla"}, exclude_none=True)
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        serializer_filter.exclude_none = False
+
+    model = ModelWithDefault(foo="foo", cat=None)
+    assert model.serialize(serializer_filter) == {"foo": "foo", "bar": "bar"}
@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+import pytest
+from ellar.common import Version, http_route
+from ellar.common.constants import SCOPE_API_VERSIONING_RESOLVER
+from ellar.core.router_builders.utils import build_route_handler
+from ellar.core.routing import RouteCollection, RouteOperation
+from ellar.core.versioning import QueryParameterAPIVersioning, VersioningSchemes
+from ellar.testing import Test
+
+from .operations import mr
+
+
+def create_route_operation(path, versions=()):
+    @http_route(path, methods=["GET"])
+    @Version(*versions)
+    def endpoint_sample():  # pragma: no cover
+        pass
+
+    return build_route_handler(endpoint_sample)[0]
+
+
+def create_scope(path, query_string=b"", default_version=None):
+    scope = {
+        "type": "http",
+        "path": path,
+        "method": "GET",
+        "query_string": query_string,
+        "headers": [],
+    }
+    scope[SCOPE_API_VERSIONING_RESOLVER] = QueryParameterAPIVersioning(
+        default_version=default_version
+    ).get_version_resolver(scope)
+    return scope
+
+
+@pytest.fixture()
+def routes():
+    return {
+        "default": create_route_operation("/items"),
+        "v1": create_route_operation("/items", versions=["1"]),
+        "v2": create_route_operation("/items", versions=["2"]),
+        "v1_and_v2": create_route_operation("/items/{item_id}", versions=["1", "2"]),
+    }
+
+
+@pytest.mark.parametrize(
+    "query_string, expected",
+    [
+        (b"version=1", "v1"),
+        (b"version=2", "v2"),
+        (b"", "default"),
+    ],
+)
+def test_versioned_route_resolves_request_version_routes(
+    routes, query_string, expected
+):
+    collection = RouteCollection(list(routes.values()))
+    route, child_scope = collection.match_versioned_route(
+        create_scope("/items", query_string)
+    )
+    assert route is routes[expected]
+    assert child_scope["endpoint"] is routes[expected].endpoint
+
+
+def test_versioned_route_only_evaluates_routes_of_request_version(routes):
+    collection = RouteCollection(list(routes.values()))
+    scope = create_scope("/items", b"version=2")
+
+    with patch.object(
+        RouteOperation, "matches", autospec=True, side_effect=RouteOperation.matches
+    ) as matches:
+        route, _ = collection.match_versioned_route(scope)
+
+    assert route is routes["v2"]
+    assert [call.args[0] for call in matches.call_args_list] == [routes["v2"]]
+
+
+def test_versioned_route_unknown_version_falls_back(routes):
+    collection = RouteCollection(list(routes.values()))
+    assert collection.match_versioned_route(create_scope("/items", b"version=9")) == (
+        None,
+        {},
+    )
+    assert collection.match_versioned_route(create_scope("/items/5", b"version=1")) == (
+        routes["v1_and_v2"],
+        {"endpoint": routes["v1_and_v2"].endpoint, "path_params": {"item_id": "5"}},
+    )
+
+
+def test_versioned_route_is_skipped_without_versioning(routes):
+    collection = RouteCollection(list(routes.values()))
+    scope = {"type": "http", "path": "/items", "method": "GET"}
+    assert collection.match_versioned_route(scope) == (None, {})
+    assert collection._version_tries == {}
+
+
+def test_versioned_route_tries_are_reset_on_append(routes):
+    collection = RouteCollection(list(routes.values()))
+    collection.match_versioned_route(create_scope("/items", b"version=1"))
+    assert collection._version_tries
+
+    v3 = create_route_operation("/items", versions=["3"])
+    collection.append(v3)
+    assert collection._version_tries == {}
+    assert (
+        collection.match_versioned_route(create_scope("/items", b"version=3"))[0] is v3
+    )
+
+
+def test_invalid_version_keeps_versioning_error_response():
+    tm = Test.create_test_module(routers=(mr,))
+    app = tm.create_application()
+    app.enable_versioning(
+        VersioningSchemes.HEADER, version_parameter="v", header_parameter="accept"
+    )
+    client = tm.get_test_client()
+
+    response = client.get("/version", headers={"accept": "application/json; v=2"})
+    assert response.json() == {"version": "v2"}
+
+    response = client.get("/version", headers={"accept": "application/json; v=9"})
+    assert response.status_code == 406